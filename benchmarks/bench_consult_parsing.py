@@ -0,0 +1,115 @@
+"""Benchmark of ``consult/lawDecree`` response parsing.
+
+Measures the time and peak memory of ``Loda._process_consult_content``
+(the JSON body validated straight into the models) on a large text, against
+the former parsing: ``response.json()`` into a dictionary, then ``TexteLoda``
+and ``ConsultTextResponse`` validated from that dictionary.
+
+A recorded response can be given with ``--payload``; otherwise a synthetic
+code-sized payload (nested sections, thousands of articles) is generated.
+
+Usage::
+
+    python benchmarks/bench_consult_parsing.py [--payload response.json]
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Any, Dict
+
+from pylegifrance.fonds.loda import Loda
+from pylegifrance.models.generated.model import ConsultTextResponse
+from pylegifrance.models.loda.models import TexteLoda as TexteLodaModel
+
+
+def synthetic_payload(
+    sections: int = 40, subsections: int = 10, articles: int = 8
+) -> Dict[str, Any]:
+    """Build a consult/lawDecree response shaped like a full code."""
+
+    def article(prefix: str, index: int) -> Dict[str, Any]:
+        return {
+            "id": f"LEGIARTI{prefix}{index:04d}",
+            "cid": f"LEGIARTI{prefix}{index:04d}",
+            "num": f"L{prefix}-{index}",
+            "etat": "VIGUEUR",
+            "intOrdre": index,
+            "content": "<p>" + "Texte de l'article. " * 30 + "</p>",
+            "dateDebut": "2020-01-01T00:00:00",
+            "dateFin": "2999-01-01T00:00:00",
+            "lstLienCitation": [],
+        }
+
+    def section(prefix: str, depth: int) -> Dict[str, Any]:
+        return {
+            "id": f"LEGISCTA{prefix}",
+            "cid": f"LEGISCTA{prefix}",
+            "title": f"Section {prefix}",
+            "etat": "VIGUEUR",
+            "dateDebut": "2020-01-01",
+            "dateFin": "2999-01-01",
+            "articles": [article(prefix, i) for i in range(articles)] if depth else [],
+            "sections": (
+                [section(f"{prefix}{i:02d}", depth + 1) for i in range(subsections)]
+                if not depth
+                else []
+            ),
+        }
+
+    return {
+        "id": "LEGITEXT000000000001",
+        "cid": "LEGITEXT000000000001",
+        "title": "Code synthétique",
+        "etat": "VIGUEUR",
+        "dateDebutVersion": "2020-01-01",
+        "dateFinVersion": "2999-01-01",
+        "sections": [section(f"{i:03d}", 0) for i in range(sections)],
+        "articles": [],
+    }
+
+
+def legacy_parse(content: bytes) -> TexteLodaModel:
+    response_data = json.loads(content)
+    texte_model = TexteLodaModel.model_validate(response_data)
+    texte_model.consult_response = ConsultTextResponse.model_validate(response_data)
+    return texte_model
+
+
+def _peak_memory(func, content: bytes) -> int:
+    tracemalloc.start()
+    result = func(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", help="recorded consult/lawDecree response")
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, "rb") as payload_file:
+            content = payload_file.read()
+    else:
+        content = json.dumps(synthetic_payload()).encode("utf-8")
+
+    single_pass = Loda(client=None)._process_consult_content
+    assert single_pass(content) is not None
+    print(f"Payload: {len(content) / 1e6:.1f} MB of JSON")
+
+    for name, func in (("legacy", legacy_parse), ("single pass", single_pass)):
+        seconds = min(timeit.repeat(lambda: func(content), number=args.number))
+        peak = _peak_memory(func, content)
+        print(
+            f"{name:>12}: {seconds / args.number * 1e3:8.1f} ms/parse, "
+            f"peak {peak / 1e6:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
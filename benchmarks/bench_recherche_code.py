@@ -0,0 +1,130 @@
+"""Benchmark of repeated ``recherche_code`` calls.
+
+Compares the former behaviour (a new ``LegifranceClient`` per call, hence a
+new session, connection and OAuth token each time) with the shared client
+now reused across calls.
+
+The calls go to a local server emulating the token endpoint and the
+``search``/``consult/getArticle`` routes. Its ``--connect-latency`` (paid once
+per new connection, like a TCP/TLS handshake) and ``--token-latency`` (paid
+per token request) stand in for the network costs of the real API.
+
+Usage::
+
+    python benchmarks/bench_recherche_code.py [--calls 20]
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.pipeline.pipeline_factory import recherche_code
+
+SEARCH_RESPONSE = {
+    "totalResultNumber": 1,
+    "results": [
+        {
+            "titles": [{"id": "LEGITEXT000006070721", "title": "Code civil"}],
+            "sections": [
+                {
+                    "id": "LEGISCTA000006089696",
+                    "extracts": [{"id": "LEGIARTI000006419288", "num": "7"}],
+                }
+            ],
+        }
+    ],
+}
+
+
+def make_handler(connect_latency: float, token_latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Avoids the delayed ACK stall on reused connections
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            time.sleep(connect_latency)
+            super().setup()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.path.endswith("/token"):
+                time.sleep(token_latency)
+                payload = {"access_token": "token", "expires_in": 3600}
+            elif self.path.endswith("/search"):
+                payload = SEARCH_RESPONSE
+            else:
+                payload = {"article": {"id": "LEGIARTI000006419288", "num": "7"}}
+
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--connect-latency", type=float, default=0.02)
+    parser.add_argument("--token-latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_handler(args.connect_latency, args.token_latency)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    config = ApiConfig(
+        client_id="bench",
+        client_secret="bench",
+        token_url=f"{base_url}/api/oauth/token",
+        api_url=f"{base_url}/",
+    )
+
+    def client_per_call() -> None:
+        client = LegifranceClient(config=config)
+        try:
+            recherche_code(code_name="Code civil", search="7", client=client)
+        finally:
+            client.close()
+
+    shared_client = LegifranceClient(config=config)
+
+    def shared() -> None:
+        recherche_code(code_name="Code civil", search="7", client=shared_client)
+
+    print(
+        f"{args.calls} calls, connect latency {args.connect_latency * 1e3:.0f} ms, "
+        f"token latency {args.token_latency * 1e3:.0f} ms"
+    )
+    results = {}
+    for name, func in (("client per call", client_per_call), ("shared", shared)):
+        start = time.perf_counter()
+        for _ in range(args.calls):
+            func()
+        results[name] = time.perf_counter() - start
+        print(f"{name:>16}: {results[name] / args.calls * 1e3:8.1f} ms/call")
+
+    print(f"         speedup: {results['client per call'] / results['shared']:.2f}x")
+
+    shared_client.close()
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Micro-benchmark of search request serialization.
+
+Compares the former path (``model_dump`` then a ``json.dumps``/``json.loads``
+round trip through EnumEncoder, then ``requests`` encoding the body again)
+with the single-pass path now used by the fonds and ``call_api``
+(``model_dump(mode="json")`` then ``dumps_json``).
+
+Usage::
+
+    python benchmarks/bench_serialization.py [--number 2000]
+"""
+
+import argparse
+import json
+import timeit
+
+from pylegifrance.models.juri.search import SearchRequest as JuriSearchRequest
+from pylegifrance.utils import EnumEncoder, dumps_json, orjson
+
+
+def _request_dto():
+    return JuriSearchRequest(
+        search="responsabilité contractuelle",
+        juridiction_judiciaire=["Cour de cassation", "Cour d'appel"],
+        page_size=100,
+    ).to_api_model()
+
+
+def legacy_body(dto) -> bytes:
+    payload = dto.model_dump(by_alias=True)
+    payload = json.loads(json.dumps(payload, cls=EnumEncoder))
+    # What requests does with json=payload
+    return json.dumps(payload, allow_nan=False).encode("utf-8")
+
+
+def single_pass_body(dto) -> bytes:
+    return dumps_json(dto.model_dump(mode="json", by_alias=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    dto = _request_dto()
+    assert json.loads(legacy_body(dto)) == json.loads(single_pass_body(dto))
+
+    backend = "orjson" if orjson is not None else "json (stdlib)"
+    print(f"JSON backend: {backend}, {args.number} requests")
+
+    results = {}
+    for name, func in (("legacy", legacy_body), ("single pass", single_pass_body)):
+        seconds = min(timeit.repeat(lambda: func(dto), number=args.number, repeat=5))
+        results[name] = seconds
+        print(f"{name:>12}: {seconds / args.number * 1e6:8.1f} µs/request")
+
+    print(f"     speedup: {results['legacy'] / results['single pass']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,5 @@
-from .pipeline.pipeline_factory import recherche_codefrom .client import LegifranceClient__all__ = ["recherche_code", "LegifranceClient"]
\ No newline at end of file
+from .pipeline.pipeline_factory import recherche_code
+from .client import LegifranceClient, AsyncLegifranceClient
+
+
+__all__ = ["recherche_code", "LegifranceClient", "AsyncLegifranceClient"]
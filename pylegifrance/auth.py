@@ -4,19 +4,63 @@ This module provides a class for handling authentication with the Legifrance API
 including token acquisition, storage, and refresh logic.
 """
 
+import asyncio
+import hashlib
+import threading
 import time
 import logging
 from dataclasses import dataclass
+from typing import Any, Dict, Optional, TYPE_CHECKING
 import requests
 from contextlib import contextmanager
 from tenacity import retry, stop_after_attempt, wait_fixed, RetryError
 
 from pylegifrance.config import ApiConfig
-from pylegifrance.utils import configure_session_timeouts
+from pylegifrance.utils import configure_session, require_httpx
+
+if TYPE_CHECKING:
+    from pylegifrance.token_store import TokenStore
 
 logger = logging.getLogger(__name__)
 
 
+def _token_request_data(client_id: str, client_secret: str) -> Dict[str, str]:
+    """Build the form data of an OAuth client-credentials token request."""
+    return {
+        "grant_type": "client_credentials",
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "scope": "openid",
+    }
+
+
+def _parse_token_response(response: Any) -> "TokenInfo":
+    """
+    Turn a token endpoint response into a TokenInfo.
+
+    Works with both ``requests`` and ``httpx`` responses, which share the
+    ``status_code``, ``text`` and ``json()`` interface.
+
+    Raises
+    ------
+    Exception
+        If the token endpoint returned an error status.
+    """
+    status_code, text = response.status_code, response.text
+    if 200 <= status_code < 300:
+        response_data = response.json()
+        token_info = TokenInfo(
+            access_token=response_data.get("access_token", ""),
+            issued_at=time.time(),
+            expires_in=response_data.get("expires_in", 0),
+        )
+        logger.info("Legifrance API authentication successful.")
+        return token_info
+
+    logger.warning(f"Failed to get token: {status_code} - {text}")
+    raise Exception(f"Error obtaining token: {status_code} - {text}")
+
+
 @dataclass
 class TokenInfo:
     """
@@ -45,6 +89,28 @@ class TokenInfo:
         """Check if the token is valid and not expired."""
         return bool(self.access_token) and not self.is_expired
 
+    def expires_within(self, margin: float) -> bool:
+        """
+        Check if the token is missing or expires within the given margin.
+
+        The margin is capped at half the token lifetime, so that a margin
+        larger than the lifetime does not trigger a refresh on every call.
+
+        Parameters
+        ----------
+        margin : float
+            Number of seconds before expiry.
+
+        Returns
+        -------
+        bool
+            True if the token should be refreshed.
+        """
+        if not self.access_token:
+            return True
+        margin = min(margin, self.expires_in / 2)
+        return time.time() - self.issued_at >= self.expires_in - margin
+
 
 class AuthenticationManager:
     """
@@ -58,9 +124,18 @@ class AuthenticationManager:
     - Obtaining access tokens
     - Refreshing expired tokens
     - Providing valid tokens for API requests
+
+    The manager is thread-safe. Token refreshes are single-flight: when the
+    token has expired, one thread fetches a new one while the others wait for
+    it. When the token is about to expire (see
+    ``ApiConfig.token_refresh_margin``), it is refreshed in a background
+    thread while callers keep using the current one.
+
+    An optional TokenStore shares tokens between managers, possibly across
+    processes: a valid stored token is reused instead of fetching a new one.
     """
 
-    def __init__(self, config: ApiConfig):
+    def __init__(self, config: ApiConfig, token_store: Optional["TokenStore"] = None):
         """
         Initialize a new AuthenticationManager instance.
 
@@ -68,14 +143,22 @@ class AuthenticationManager:
         ----------
         config : ApiConfig
             Configuration for the API authentication.
+        token_store : TokenStore, optional
+            Shared token storage. If None, tokens are kept in this manager only.
         """
         self._client_id = config.client_id
         self._client_secret = config.client_secret
         self._token_url = config.token_url
         self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+        self._refresh_margin = config.token_refresh_margin
+        self._token_store = token_store
+        # Last token rejected by the API (HTTP 401), never reused from the store
+        self._rejected_token: Optional[str] = None
+        # Held for the whole duration of a token fetch (single-flight)
+        self._refresh_lock = threading.Lock()
         self._session = requests.Session()
 
-        configure_session_timeouts(self._session, config)
+        configure_session(self._session, config)
 
     @retry(stop=stop_after_attempt(3), wait=wait_fixed(5), reraise=True)
     def _fetch_new_token(self) -> TokenInfo:
@@ -92,30 +175,11 @@ class AuthenticationManager:
         Exception
             If the token acquisition fails.
         """
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self._client_id,
-            "client_secret": self._client_secret,
-            "scope": "openid",
-        }
-
-        response = self._session.post(self._token_url, data=data)
-        if 200 <= response.status_code < 300:
-            response_data = response.json()
-            token_info = TokenInfo(
-                access_token=response_data.get("access_token", ""),
-                issued_at=time.time(),
-                expires_in=response_data.get("expires_in", 0),
-            )
-            logger.info("Legifrance API authentication successful.")
-            return token_info
-        else:
-            logger.warning(
-                f"Failed to get token: {response.status_code} - {response.text}"
-            )
-            raise Exception(
-                f"Error obtaining token: {response.status_code} - {response.text}"
-            )
+        response = self._session.post(
+            self._token_url,
+            data=_token_request_data(self._client_id, self._client_secret),
+        )
+        return _parse_token_response(response)
 
     def update_credentials(self, client_id: str, client_secret: str) -> None:
         """
@@ -128,16 +192,20 @@ class AuthenticationManager:
         client_secret : str
             The new client secret.
         """
-        if self._client_id != client_id or self._client_secret != client_secret:
-            self._client_id = client_id
-            self._client_secret = client_secret
-            # Reset token state
-            self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+        with self._refresh_lock:
+            if self._client_id != client_id or self._client_secret != client_secret:
+                self._client_id = client_id
+                self._client_secret = client_secret
+                # Reset token state
+                self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
 
     def ensure_valid_token(self) -> str:
         """
         Ensure that a valid token is available, refreshing it if necessary.
 
+        If the current token is still valid but close to expiry, a background
+        refresh is started and the current token is returned immediately.
+
         Returns
         -------
         str
@@ -148,14 +216,107 @@ class AuthenticationManager:
         Exception
             If the token acquisition or refresh fails.
         """
-        if not self._token_info.is_valid:
-            try:
-                self._token_info = self._fetch_new_token()
-            except RetryError as exc:
-                logger.error(f"Could not obtain access token after retries: {exc}")
-                raise
+        token_info = self._token_info
+        if token_info.is_valid:
+            if token_info.expires_within(self._refresh_margin):
+                self._start_background_refresh()
+            return token_info.access_token
+
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while we waited
+            if not self._token_info.is_valid:
+                try:
+                    self._token_info = self._acquire_token()
+                except RetryError as exc:
+                    logger.error(f"Could not obtain access token after retries: {exc}")
+                    raise
+
+            return self._token_info.access_token
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Discard a token rejected by the API, so that the next call fetches a new one.
 
-        return self._token_info.access_token
+        Only the given token is discarded: if another thread already replaced
+        it, the fresh token is kept.
+
+        Parameters
+        ----------
+        token : str
+            The access token that was rejected.
+        """
+        with self._refresh_lock:
+            self._rejected_token = token
+            if self._token_info.access_token == token:
+                self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+
+    def _store_key(self) -> str:
+        """Key identifying the current credentials in the token store."""
+        identity = f"{self._token_url}|{self._client_id}".encode("utf-8")
+        return hashlib.sha256(identity).hexdigest()[:32]
+
+    def _acquire_token(self) -> TokenInfo:
+        """
+        Obtain a fresh token, reusing the one in the token store if possible.
+
+        Must be called with the refresh lock held. When a store is configured,
+        its lock is held while fetching, so that only one manager sharing the
+        store requests a new token.
+
+        Returns
+        -------
+        TokenInfo
+            A token that is not about to expire.
+        """
+        if self._token_store is None:
+            return self._fetch_new_token()
+
+        key = self._store_key()
+        with self._token_store.lock(key):
+            stored = self._token_store.load(key)
+            if (
+                stored is not None
+                and stored.access_token != self._rejected_token
+                and not stored.expires_within(self._refresh_margin)
+            ):
+                logger.debug("Reusing access token from the shared token store.")
+                return stored
+
+            token_info = self._fetch_new_token()
+            self._token_store.save(key, token_info)
+            return token_info
+
+    def _start_background_refresh(self) -> None:
+        """
+        Refresh the token in a background thread, unless a refresh is running.
+
+        The refresh lock is acquired here and released by the background
+        thread once the new token is stored.
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        try:
+            threading.Thread(
+                target=self._refresh_in_background,
+                name="pylegifrance-token-refresh",
+                daemon=True,
+            ).start()
+        except RuntimeError:
+            self._refresh_lock.release()
+            raise
+
+    def _refresh_in_background(self) -> None:
+        """Fetch a new token ahead of expiry; must be called with the refresh lock held."""
+        try:
+            if self._token_info.expires_within(self._refresh_margin):
+                self._token_info = self._acquire_token()
+                logger.debug("Access token refreshed ahead of expiry.")
+        except Exception as exc:
+            # The current token remains usable until it expires
+            logger.warning(f"Background token refresh failed: {exc}")
+        finally:
+            self._refresh_lock.release()
 
     def close(self) -> None:
         """
@@ -181,3 +342,144 @@ class AuthenticationManager:
             yield self
         finally:
             self.close()
+
+
+class AsyncAuthenticationManager:
+    """
+    Asynchronous counterpart of AuthenticationManager.
+
+    Tokens are obtained with an ``httpx.AsyncClient``. Concurrent coroutines
+    share a single in-flight token request: the first one to find the token
+    expired fetches a new one while the others wait on a lock.
+
+    Requires the optional ``httpx`` dependency (``pylegifrance[async]``).
+    """
+
+    def __init__(self, config: ApiConfig):
+        """
+        Initialize a new AsyncAuthenticationManager instance.
+
+        Parameters
+        ----------
+        config : ApiConfig
+            Configuration for the API authentication.
+
+        Raises
+        ------
+        ImportError
+            If httpx is not installed.
+        """
+        httpx = require_httpx()
+
+        self._client_id = config.client_id
+        self._client_secret = config.client_secret
+        self._token_url = config.token_url
+        self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+        self._refresh_margin = config.token_refresh_margin
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._session = httpx.AsyncClient(
+            timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout)
+        )
+
+    @retry(stop=stop_after_attempt(3), wait=wait_fixed(5), reraise=True)
+    async def _fetch_new_token(self) -> TokenInfo:
+        """
+        Fetch a new access token from the Legifrance API.
+
+        Returns
+        -------
+        TokenInfo
+            Information about the newly acquired token.
+
+        Raises
+        ------
+        Exception
+            If the token acquisition fails.
+        """
+        response = await self._session.post(
+            self._token_url,
+            data=_token_request_data(self._client_id, self._client_secret),
+        )
+        return _parse_token_response(response)
+
+    def update_credentials(self, client_id: str, client_secret: str) -> None:
+        """
+        Update the authentication credentials.
+
+        Parameters
+        ----------
+        client_id : str
+            The new client ID.
+        client_secret : str
+            The new client secret.
+        """
+        if self._client_id != client_id or self._client_secret != client_secret:
+            self._client_id = client_id
+            self._client_secret = client_secret
+            self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+
+    async def ensure_valid_token(self) -> str:
+        """
+        Ensure that a valid token is available, refreshing it if necessary.
+
+        Returns
+        -------
+        str
+            The valid access token.
+
+        Raises
+        ------
+        Exception
+            If the token acquisition or refresh fails.
+        """
+        token_info = self._token_info
+        if token_info.is_valid:
+            refresh_running = (
+                self._refresh_task is not None and not self._refresh_task.done()
+            )
+            if token_info.expires_within(self._refresh_margin) and not refresh_running:
+                self._refresh_task = asyncio.create_task(self._refresh_in_background())
+            return token_info.access_token
+
+        async with self._lock:
+            # Another coroutine may have refreshed the token while we waited
+            if not self._token_info.is_valid:
+                try:
+                    self._token_info = await self._fetch_new_token()
+                except RetryError as exc:
+                    logger.error(f"Could not obtain access token after retries: {exc}")
+                    raise
+
+        return self._token_info.access_token
+
+    async def invalidate_token(self, token: str) -> None:
+        """
+        Discard a token rejected by the API, so that the next call fetches a new one.
+
+        See AuthenticationManager.invalidate_token.
+        """
+        async with self._lock:
+            if self._token_info.access_token == token:
+                self._token_info = TokenInfo(access_token="", issued_at=0, expires_in=0)
+
+    async def _refresh_in_background(self) -> None:
+        """Fetch a new token ahead of expiry without blocking callers."""
+        async with self._lock:
+            try:
+                if self._token_info.expires_within(self._refresh_margin):
+                    self._token_info = await self._fetch_new_token()
+                    logger.debug("Access token refreshed ahead of expiry.")
+            except Exception as exc:
+                # The current token remains usable until it expires
+                logger.warning(f"Background token refresh failed: {exc}")
+
+    async def close(self) -> None:
+        """
+        Close the session used for token acquisition.
+
+        This should be called when the manager is no longer needed to free up resources.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        await self._session.aclose()
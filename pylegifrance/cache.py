@@ -0,0 +1,494 @@
+"""Response cache for the Legifrance API.
+
+Legal texts and decisions rarely change, yet the same ``consult/*`` payloads
+are often requested again and again. This module provides an opt-in cache
+for ``LegifranceClient.call_api``, keyed on the route and the canonical JSON
+payload, with per-route time-to-live, LRU eviction and pluggable storage
+backends (memory, SQLite, directory).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from pylegifrance.utils import dumps_json
+
+logger = logging.getLogger(__name__)
+
+# Expiry timestamp prefixed to each cache file (0 means no expiry)
+_EXPIRY_HEADER = struct.Struct("!d")
+
+
+class CacheBackend:
+    """
+    Base class for cache storage backends.
+
+    A backend stores opaque byte values under string keys, with an optional
+    time-to-live. Subclasses implement ``get``, ``set`` and ``clear`` and
+    must be safe to use from several threads.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the value stored under the key, or None if absent or expired.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        Optional[bytes]
+            The stored value.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Store a value under the key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        value : bytes
+            The value to store.
+        ttl : float, optional
+            Time-to-live in seconds. None means the entry never expires.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+
+def _expires_at(ttl: Optional[float]) -> float:
+    return time.time() + ttl if ttl is not None else 0.0
+
+
+def _is_expired(expires_at: float) -> bool:
+    return expires_at != 0.0 and expires_at <= time.time()
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache.
+
+    Attributes:
+        max_entries: Number of entries kept before the least recently used
+            ones are evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize a new MemoryCacheBackend.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum number of entries (default: 1024).
+
+        Raises
+        ------
+        ValueError
+            If max_entries is lower than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if _is_expired(expires_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, _expires_at(ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache stored in a SQLite database.
+
+    The database can be shared by several processes of the same host.
+
+    Attributes:
+        path: Path of the database file.
+        max_entries: Number of entries kept before the least recently used
+            ones are evicted. None means unbounded.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_entries: Optional[int] = None):
+        """
+        Initialize a new SQLiteCacheBackend.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Database file, created if it does not exist.
+        max_entries : int, optional
+            Maximum number of entries. None means unbounded.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if _is_expired(expires_at):
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, _expires_at(ttl), time.time()),
+            )
+            if self.max_entries is not None:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class DirectoryCacheBackend(CacheBackend):
+    """
+    Cache stored as one file per entry in a local directory.
+
+    Files are written atomically, so the directory can be shared by several
+    processes. The modification time of a file records its last access and
+    drives LRU eviction.
+
+    Attributes:
+        directory: The directory holding the cache files.
+        max_entries: Number of entries kept before the least recently used
+            ones are evicted. None means unbounded.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_entries: Optional[int] = None):
+        """
+        Initialize a new DirectoryCacheBackend.
+
+        Parameters
+        ----------
+        directory : str or PathLike
+            Directory for the cache files, created if it does not exist.
+        max_entries : int, optional
+            Maximum number of entries. None means unbounded.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.cache"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            logger.warning(f"Ignoring unreadable cache file {path}: {exc}")
+            return None
+
+        if len(data) < _EXPIRY_HEADER.size:
+            return None
+        (expires_at,) = _EXPIRY_HEADER.unpack_from(data)
+        if _is_expired(expires_at):
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data[_EXPIRY_HEADER.size :]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(_EXPIRY_HEADER.pack(_expires_at(ttl)) + value)
+        os.replace(tmp_path, path)
+        if self.max_entries is not None:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.cache"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.cache"):
+            path.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Hit and miss counters of a ResponseCache.
+
+    Attributes:
+        hits: Number of calls answered from the cache.
+        misses: Number of calls sent to the API.
+    """
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of calls answered from the cache (0.0 if none was made)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    Cache of successful API responses.
+
+    Entries are keyed on the route and the canonical JSON form of the
+    payload, so that payloads differing only in key order share an entry.
+    Only 2xx responses are stored.
+
+    Attributes:
+        backend: The storage backend.
+        default_ttl: Time-to-live in seconds for routes without a specific
+            TTL. None means entries never expire.
+        route_ttls: Time-to-live per route prefix, e.g.
+            ``{"consult/juri": None, "search": 300}``. The longest matching
+            prefix wins; a TTL of 0 disables caching for the route.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        default_ttl: Optional[float] = 3600.0,
+        route_ttls: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        """
+        Initialize a new ResponseCache.
+
+        Parameters
+        ----------
+        backend : CacheBackend, optional
+            Storage backend. Defaults to a MemoryCacheBackend.
+        default_ttl : float, optional
+            Default time-to-live in seconds (default: 3600).
+        route_ttls : dict, optional
+            Time-to-live per route prefix.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.route_ttls = dict(route_ttls or {})
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(route: str, payload: Any) -> str:
+        """
+        Build the cache key of a call.
+
+        Parameters
+        ----------
+        route : str
+            The API route.
+        payload : Any
+            The JSON payload.
+
+        Returns
+        -------
+        str
+            A hexadecimal digest of the route and canonical payload.
+        """
+        digest = hashlib.sha256(f"{route.lstrip('/')}\n".encode("utf-8"))
+        digest.update(dumps_json(payload, sort_keys=True))
+        return digest.hexdigest()
+
+    def ttl_for(self, route: str) -> Optional[float]:
+        """
+        Return the time-to-live that applies to a route.
+
+        Parameters
+        ----------
+        route : str
+            The API route.
+
+        Returns
+        -------
+        Optional[float]
+            The TTL in seconds, or None if entries never expire.
+        """
+        route = route.lstrip("/")
+        matches = [prefix for prefix in self.route_ttls if route.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.route_ttls[max(matches, key=len)]
+
+    def get(self, route: str, payload: Any) -> Optional[requests.Response]:
+        """
+        Return the cached response of a call, if any.
+
+        Parameters
+        ----------
+        route : str
+            The API route.
+        payload : Any
+            The JSON payload.
+
+        Returns
+        -------
+        Optional[requests.Response]
+            A response rebuilt from the cache, or None on a miss.
+        """
+        if self.ttl_for(route) == 0:
+            return None
+
+        value = self.backend.get(self.make_key(route, payload))
+        response = _decode_response(value) if value is not None else None
+
+        with self._stats_lock:
+            if response is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return response
+
+    def set(self, route: str, payload: Any, response: requests.Response) -> None:
+        """
+        Store the response of a call.
+
+        Error responses and routes with a TTL of 0 are not stored.
+
+        Parameters
+        ----------
+        route : str
+            The API route.
+        payload : Any
+            The JSON payload.
+        response : requests.Response
+            The API response.
+        """
+        ttl = self.ttl_for(route)
+        if ttl == 0 or not 200 <= response.status_code < 300:
+            return
+        self.backend.set(self.make_key(route, payload), _encode_response(response), ttl)
+
+    def stats(self) -> CacheStats:
+        """Return the hit and miss counters."""
+        with self._stats_lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self.backend.clear()
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+
+
+def _encode_response(response: requests.Response) -> bytes:
+    """Serialise a response as a JSON metadata line followed by the body."""
+    metadata = {
+        "status_code": response.status_code,
+        "headers": dict(response.headers),
+        "url": response.url,
+        "encoding": response.encoding,
+    }
+    return json.dumps(metadata).encode("utf-8") + b"\n" + response.content
+
+
+def _decode_response(value: bytes) -> Optional[requests.Response]:
+    """Rebuild a response serialised with _encode_response."""
+    try:
+        metadata_line, content = value.split(b"\n", 1)
+        metadata = json.loads(metadata_line)
+    except ValueError:
+        logger.warning("Ignoring corrupted cache entry.")
+        return None
+
+    response = requests.Response()
+    response.status_code = metadata["status_code"]
+    response.headers = CaseInsensitiveDict(metadata["headers"])
+    response.url = metadata["url"]
+    response.encoding = metadata["encoding"]
+    response._content = content
+    return response
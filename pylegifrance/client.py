@@ -5,17 +5,95 @@ The client handles request formatting, sending, and response processing.
 Authentication is handled by a separate AuthenticationManager.
 """
 
+import asyncio
 import logging
+import threading
 import requests
-from typing import Optional, Any, Self
+from concurrent.futures import Future
+from typing import Optional, Any, Callable, Dict, List, Self, TYPE_CHECKING
 from contextlib import contextmanager
 
+from pydantic import BaseModel
+
 from pylegifrance.config import ApiConfig
-from pylegifrance.auth import AuthenticationManager
-from pylegifrance.utils import configure_session_timeouts
+from pylegifrance.auth import AuthenticationManager, AsyncAuthenticationManager
+from pylegifrance.cache import ResponseCache
+from pylegifrance.exceptions import LegifranceAPIError, RateLimitError
+from pylegifrance.rate_limit import TokenBucket, parse_retry_after
+from pylegifrance.retry import (
+    RETRYABLE_STATUS_CODES,
+    build_async_retrying,
+    build_retrying,
+    is_idempotent_route,
+)
+from pylegifrance.token_store import FileTokenStore, TokenStore
+from pylegifrance.utils import (
+    PoolStats,
+    configure_session,
+    dumps_json,
+    require_httpx,
+    session_pool_stats,
+)
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
+# Pause applied to the rate limiter on a 429 without Retry-After header
+DEFAULT_RATE_LIMIT_PAUSE = 1.0
+
+
+def _build_rate_limiter(config: ApiConfig) -> Optional[TokenBucket]:
+    """Create the rate limiter configured in ApiConfig, if any."""
+    if config.max_requests_per_second is None:
+        return None
+    return TokenBucket(config.max_requests_per_second, config.rate_limit_burst)
+
+
+def _raise_for_api_error(response: Any, rate_limiter: Optional[TokenBucket]) -> None:
+    """
+    Raise the exception matching an error response.
+
+    The ``Retry-After`` header, if any, is attached to the exception. On a
+    429, the rate limiter (if any) is paused for that delay so that the
+    other callers back off too.
+
+    Raises
+    ------
+    RateLimitError
+        If the API quota was exceeded.
+    LegifranceAPIError
+        If the API returned any other error status.
+    """
+    if response.status_code < 400:
+        return
+
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+    if response.status_code == 429:
+        if rate_limiter is not None:
+            rate_limiter.pause(
+                retry_after if retry_after is not None else DEFAULT_RATE_LIMIT_PAUSE
+            )
+        logger.warning(
+            f"Rate limit exceeded (429) when calling the API, retry after {retry_after}s."
+        )
+        raise RateLimitError(response.status_code, response.text, retry_after)
+
+    if response.status_code < 600:
+        logger.error(
+            f"Client error {response.status_code} - {response.text} when calling the API."
+        )
+        raise LegifranceAPIError(response.status_code, response.text, retry_after)
+
+
+def _to_payload(data: Any) -> Any:
+    """Turn a pydantic request model into its JSON-ready API representation."""
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode="json", by_alias=True)
+    return data
+
 
 class LegifranceClient:
     """
@@ -30,9 +108,16 @@ class LegifranceClient:
     Attributes:
         api_url: The base URL for the Legifrance API.
         session: The requests session used for making API calls.
+        cache: The response cache, or None if caching is disabled.
     """
 
-    def __init__(self, config: Optional[ApiConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ApiConfig] = None,
+        token_store: Optional[TokenStore] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         """
         Initialize a new LegifranceClient instance.
 
@@ -40,6 +125,15 @@ class LegifranceClient:
         ----------
         config : ApiConfig, optional
             Configuration for the API client. If None, will attempt to load from environment variables.
+        token_store : TokenStore, optional
+            Shared storage for access tokens. If None and ``config.token_cache_dir``
+            is set, a FileTokenStore on that directory is used.
+        rate_limiter : TokenBucket, optional
+            Rate limiter shared with other clients using the same credentials.
+            If None, one is built from ``config.max_requests_per_second``.
+        cache : ResponseCache, optional
+            Cache for the responses of read-only routes (``consult/*``,
+            ``search``...). If None, every call is sent to the API.
 
         Raises
         ------
@@ -53,11 +147,19 @@ class LegifranceClient:
                 logger.error(f"Failed to initialize API client: {e}")
                 raise
 
+        if token_store is None and config.token_cache_dir is not None:
+            token_store = FileTokenStore(config.token_cache_dir)
+
         self.api_url = config.api_url
-        self._auth_manager = AuthenticationManager(config)
+        self._config = config
+        self._auth_manager = AuthenticationManager(config, token_store=token_store)
+        self._rate_limiter = rate_limiter or _build_rate_limiter(config)
+        self.cache = cache
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         self.session = requests.Session()
 
-        configure_session_timeouts(self.session, config)
+        configure_session(self.session, config)
 
     def update_api_keys(
         self, client_id: Optional[str] = None, client_secret: Optional[str] = None
@@ -98,6 +200,108 @@ class LegifranceClient:
                 logger.error(f"Failed to set API keys: {e}")
                 raise
 
+    def pool_stats(self) -> List[PoolStats]:
+        """
+        Report the usage of the HTTP connection pools.
+
+        Useful to size ``ApiConfig.pool_maxsize``: a number of opened
+        connections well above the pool size means connections are discarded
+        and reopened under load.
+
+        Returns
+        -------
+        List[PoolStats]
+            One entry per host the client has connected to.
+        """
+        return session_pool_stats(self.session)
+
+    def _throttle(self) -> None:
+        """Wait for the rate limiter, if one is configured."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+    def _send(
+        self, method: str, url: str, headers: dict, **kwargs
+    ) -> requests.Response:
+        """
+        Send one authenticated request, re-authenticating once on a 401.
+
+        A 401 means the API rejected the token (revoked, or expired earlier
+        than announced): it is discarded and the request is sent again with a
+        new one.
+        """
+        token = self._auth_manager.ensure_valid_token()
+        self._throttle()
+        response = self.session.request(
+            method,
+            url,
+            headers={**headers, "Authorization": f"Bearer {token}"},
+            **kwargs,
+        )
+
+        if response.status_code == 401:
+            logger.warning("Access token rejected (401), re-authenticating.")
+            self._auth_manager.invalidate_token(token)
+            token = self._auth_manager.ensure_valid_token()
+            self._throttle()
+            response = self.session.request(
+                method,
+                url,
+                headers={**headers, "Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
+
+        return response
+
+    def _request(
+        self,
+        method: str,
+        route: str,
+        headers: dict,
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures according to the config.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        route : str
+            The API route.
+        headers : dict
+            Request headers, without the Authorization header.
+        raise_on_error : bool, optional
+            Raise LegifranceAPIError on any error status. If False, only
+            retryable statuses raise, once retries are exhausted.
+        **kwargs
+            Passed to ``requests.Session.request``.
+
+        Returns
+        -------
+        requests.Response
+            The API response.
+        """
+        url = f"{self.api_url}{route}"
+
+        def attempt() -> requests.Response:
+            response = self._send(method, url, headers, **kwargs)
+            if raise_on_error or response.status_code in RETRYABLE_STATUS_CODES:
+                _raise_for_api_error(response, self._rate_limiter)
+            return response
+
+        retrying = build_retrying(
+            self._config,
+            idempotent=is_idempotent_route(method, route),
+            connect_errors=(requests.exceptions.ConnectTimeout,),
+            transport_errors=(
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ),
+        )
+        return retrying(attempt)
+
     def call_api(self, route: str, data: Any) -> requests.Response:
         """
         Call the Legifrance API with token management and error logging.
@@ -107,7 +311,8 @@ class LegifranceClient:
         route : str
             The API route to use.
         data : Any
-            The data to send as JSON.
+            The data to send as JSON: a JSON-ready dictionary, or a pydantic
+            model serialized with its field aliases.
 
         Returns
         -------
@@ -118,35 +323,85 @@ class LegifranceClient:
         ------
         ValueError
             If no data is provided.
+        RateLimitError
+            If the API quota was exceeded (HTTP 429).
+        LegifranceAPIError
+            If the API returned another error status.
         Exception
-            If the API call fails or authentication fails.
+            If authentication fails.
         """
         if data is None:
             logger.warning("No data provided to call_api; request not sent.")
             raise ValueError("No data provided for API call.")
-
-        token = self._auth_manager.ensure_valid_token()
+        data = _to_payload(data)
+
+        if not is_idempotent_route("POST", route):
+            return self._post(route, data)
+
+        cache = self.cache
+        if cache is not None:
+            cached = cache.get(route, data)
+            if cached is not None:
+                logger.debug(f"API call to '{route}' served from cache.")
+                return cached
+
+        def send() -> requests.Response:
+            response = self._post(route, data)
+            if cache is not None:
+                cache.set(route, data, response)
+            return response
+
+        if not self._config.coalesce_requests:
+            return send()
+        return self._coalesce(ResponseCache.make_key(route, data), send)
+
+    def _post(self, route: str, data: Any) -> requests.Response:
+        """Send a JSON POST request to the API."""
         headers = {
-            "Authorization": f"Bearer {token}",
             "accept": "application/json",
             "Content-Type": "application/json",
         }
 
-        url = f"{self.api_url}{route}"
-        logger.info(f"POST request to URL: {url}")
-        response = self.session.post(url, headers=headers, json=data)
-
-        if 400 <= response.status_code < 600:
-            logger.error(
-                f"Client error {response.status_code} - {response.text} when calling the API."
-            )
-            raise Exception(
-                f"API client error {response.status_code} - {response.text}"
-            )
+        logger.info(f"POST request to URL: {self.api_url}{route}")
+        response = self._request("POST", route, headers, data=dumps_json(data))
 
         logger.info(f"API call to '{route}' successful.")
         return response
 
+    def _coalesce(
+        self, key: str, send: Callable[[], requests.Response]
+    ) -> requests.Response:
+        """
+        Share one request between concurrent identical calls.
+
+        The first caller for a key sends the request; callers arriving while
+        it is in flight wait for its outcome (response or exception) instead
+        of sending their own.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            logger.debug("Identical API call in flight, waiting for its response.")
+            return future.result()
+
+        try:
+            response = send()
+            # Read the body now so that the followers never touch the stream
+            _ = response.content
+            future.set_result(response)
+            return response
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
     def get(self, route: str) -> requests.Response:
         """
         Perform a GET request on the given API route.
@@ -163,17 +418,17 @@ class LegifranceClient:
 
         Raises
         ------
+        LegifranceAPIError
+            If a transient error status (429, 502, 503, 504) persists after retries.
         requests.exceptions.HTTPError
-            If the HTTP request returns an unsuccessful status code.
+            If the HTTP request returns another unsuccessful status code.
         Exception
             If authentication fails.
         """
-        token = self._auth_manager.ensure_valid_token()
-        headers = {"Authorization": f"Bearer {token}"}
         url = f"{self.api_url}{route}"
 
         logger.info(f"GET request to URL: {url}")
-        response = self.session.get(url, headers=headers)
+        response = self._request("GET", route, {}, raise_on_error=False)
         response.raise_for_status()
 
         logger.info(f"GET request successful for URL: {url}")
@@ -207,6 +462,7 @@ class LegifranceClient:
             }
 
             url = f"{self.api_url}{route}"
+            self._throttle()
             response = self.session.get(url, headers=headers)
 
             if response.status_code == 200:
@@ -265,3 +521,281 @@ class LegifranceClient:
         """
         self.session.close()
         self._auth_manager.close()
+
+
+class AsyncLegifranceClient:
+    """
+    Asynchronous client for interacting with the Legifrance API.
+
+    This class mirrors LegifranceClient (``call_api``, ``get``, ``ping``) on top
+    of an ``httpx.AsyncClient`` so that many consultations can run concurrently
+    on a single event loop. Authentication is delegated to an
+    AsyncAuthenticationManager.
+
+    Requires the optional ``httpx`` dependency (``pylegifrance[async]``).
+
+    Attributes:
+        api_url: The base URL for the Legifrance API.
+        session: The httpx client used for making API calls.
+    """
+
+    def __init__(self, config: Optional[ApiConfig] = None):
+        """
+        Initialize a new AsyncLegifranceClient instance.
+
+        Parameters
+        ----------
+        config : ApiConfig, optional
+            Configuration for the API client. If None, will attempt to load from environment variables.
+
+        Raises
+        ------
+        ValueError
+            If config is not provided and environment variables are not set.
+        ImportError
+            If httpx is not installed.
+        """
+        httpx = require_httpx()
+
+        if config is None:
+            try:
+                config = ApiConfig.from_env()
+            except ValueError as e:
+                logger.error(f"Failed to initialize API client: {e}")
+                raise
+
+        self.api_url = config.api_url
+        self._config = config
+        self._auth_manager = AsyncAuthenticationManager(config)
+        self._rate_limiter = _build_rate_limiter(config)
+        self.session = httpx.AsyncClient(
+            timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=config.pool_maxsize if config.pool_block else None,
+                max_keepalive_connections=(
+                    config.pool_maxsize if config.keep_alive else 0
+                ),
+            ),
+            headers=None if config.compression else {"Accept-Encoding": "identity"},
+        )
+
+    def update_api_keys(
+        self, client_id: Optional[str] = None, client_secret: Optional[str] = None
+    ) -> None:
+        """
+        Update the API keys for the client.
+
+        See LegifranceClient.update_api_keys.
+        """
+        if client_id is not None and client_secret is not None:
+            self._auth_manager.update_credentials(client_id, client_secret)
+        else:
+            try:
+                new_config = ApiConfig.from_env()
+                self._auth_manager.update_credentials(
+                    new_config.client_id, new_config.client_secret
+                )
+            except ValueError as e:
+                logger.error(f"Failed to set API keys: {e}")
+                raise
+
+    async def _throttle(self) -> None:
+        """Wait for the rate limiter, if one is configured."""
+        if self._rate_limiter is not None:
+            delay = self._rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _send(
+        self, method: str, url: str, headers: dict, **kwargs
+    ) -> "httpx.Response":
+        """Send one authenticated request, re-authenticating once on a 401."""
+        token = await self._auth_manager.ensure_valid_token()
+        await self._throttle()
+        response = await self.session.request(
+            method,
+            url,
+            headers={**headers, "Authorization": f"Bearer {token}"},
+            **kwargs,
+        )
+
+        if response.status_code == 401:
+            logger.warning("Access token rejected (401), re-authenticating.")
+            await self._auth_manager.invalidate_token(token)
+            token = await self._auth_manager.ensure_valid_token()
+            await self._throttle()
+            response = await self.session.request(
+                method,
+                url,
+                headers={**headers, "Authorization": f"Bearer {token}"},
+                **kwargs,
+            )
+
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        route: str,
+        headers: dict,
+        raise_on_error: bool = True,
+        **kwargs,
+    ) -> "httpx.Response":
+        """
+        Send a request, retrying transient failures according to the config.
+
+        See LegifranceClient._request.
+        """
+        httpx = require_httpx()
+        url = f"{self.api_url}{route}"
+
+        retrying = build_async_retrying(
+            self._config,
+            idempotent=is_idempotent_route(method, route),
+            connect_errors=(httpx.ConnectError, httpx.ConnectTimeout),
+            transport_errors=(httpx.TransportError,),
+        )
+        async for attempt in retrying:
+            with attempt:
+                response = await self._send(method, url, headers, **kwargs)
+                if raise_on_error or response.status_code in RETRYABLE_STATUS_CODES:
+                    _raise_for_api_error(response, self._rate_limiter)
+        return response
+
+    async def call_api(self, route: str, data: Any) -> "httpx.Response":
+        """
+        Call the Legifrance API with token management and error logging.
+
+        Parameters
+        ----------
+        route : str
+            The API route to use.
+        data : Any
+            The data to send as JSON: a JSON-ready dictionary, or a pydantic
+            model serialized with its field aliases.
+
+        Returns
+        -------
+        httpx.Response
+            The API response.
+
+        Raises
+        ------
+        ValueError
+            If no data is provided.
+        RateLimitError
+            If the API quota was exceeded (HTTP 429).
+        LegifranceAPIError
+            If the API returned another error status.
+        Exception
+            If authentication fails.
+        """
+        if data is None:
+            logger.warning("No data provided to call_api; request not sent.")
+            raise ValueError("No data provided for API call.")
+        data = _to_payload(data)
+
+        headers = {
+            "accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+        logger.info(f"POST request to URL: {self.api_url}{route}")
+        response = await self._request("POST", route, headers, content=dumps_json(data))
+
+        logger.info(f"API call to '{route}' successful.")
+        return response
+
+    async def get(self, route: str) -> "httpx.Response":
+        """
+        Perform a GET request on the given API route.
+
+        Parameters
+        ----------
+        route : str
+            The route to target.
+
+        Returns
+        -------
+        httpx.Response
+            The API response.
+
+        Raises
+        ------
+        LegifranceAPIError
+            If a transient error status (429, 502, 503, 504) persists after retries.
+        httpx.HTTPStatusError
+            If the HTTP request returns another unsuccessful status code.
+        Exception
+            If authentication fails.
+        """
+        url = f"{self.api_url}{route}"
+
+        logger.info(f"GET request to URL: {url}")
+        response = await self._request("GET", route, {}, raise_on_error=False)
+        response.raise_for_status()
+
+        logger.info(f"GET request successful for URL: {url}")
+        return response
+
+    async def ping(self, route: str = "consult/ping") -> bool:
+        """
+        Check connectivity with the Legifrance API by sending a ping request.
+
+        Parameters
+        ----------
+        route : str, optional
+            Route to use for the ping (default: "consult/ping").
+
+        Returns
+        -------
+        bool
+            True if the connection is successful, otherwise False.
+
+        Raises
+        ------
+        Exception
+            In case of API connection error or authentication failure.
+        """
+        httpx = require_httpx()
+
+        try:
+            token = await self._auth_manager.ensure_valid_token()
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Accept": "text/plain",
+                "Content-Type": "application/json",
+            }
+
+            url = f"{self.api_url}{route}"
+            await self._throttle()
+            response = await self.session.get(url, headers=headers)
+
+            if response.status_code == 200:
+                logger.info(
+                    "Ping successful: connection to Legifrance API established."
+                )
+                return True
+            else:
+                logger.warning(
+                    f"Ping failed: return code {response.status_code} - {response.text}"
+                )
+                return False
+        except httpx.HTTPError as e:
+            logger.error(f"Error during Legifrance API ping: {str(e)}")
+            raise Exception(f"API ping failed: {e}")
+
+    async def aclose(self) -> None:
+        """
+        Close the client's session and authentication manager.
+
+        This should be called when the client is no longer needed to free up resources.
+        """
+        await self.session.aclose()
+        await self._auth_manager.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
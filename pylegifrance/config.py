@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 import os
 import logging
 
@@ -15,6 +16,31 @@ class ApiConfig:
         api_url: The base URL for the Legifrance API.
         connect_timeout: Timeout in seconds for establishing connection with server.
         read_timeout: Timeout in seconds for receiving response after connection is established.
+        token_refresh_margin: Seconds before expiry at which the access token is
+            refreshed in the background, so that requests never wait for it.
+        token_cache_dir: Directory of a file-based token cache shared by all
+            processes of the host. It must belong to the current user and be
+            closed to other users. If None, each client fetches its own token.
+        max_requests_per_second: Client-side rate limit shared by every caller
+            of a client. If None, requests are not throttled.
+        rate_limit_burst: Number of requests that may be sent at once before
+            the rate limit applies. Defaults to the per-second rate.
+        max_retries: Number of times a data call is retried on transient
+            errors (429, 502, 503, 504, network errors). 0 disables retries.
+        retry_backoff_factor: Initial backoff delay in seconds, doubled at
+            each retry, with random jitter.
+        retry_max_backoff: Maximum delay in seconds between two attempts,
+            including delays requested through a Retry-After header.
+        coalesce_requests: Share one HTTP request between concurrent identical
+            calls to a read-only route.
+        pool_connections: Number of per-host connection pools kept by a client.
+        pool_maxsize: Maximum number of connections kept open per host. Size
+            it to the number of threads calling the API in parallel.
+        pool_block: Make callers wait for a free connection instead of opening
+            extra connections that are discarded afterwards.
+        keep_alive: Reuse connections between requests.
+        compression: Ask the API for compressed responses (gzip, deflate, and
+            br/zstd when their decoders are installed).
     """
 
     client_id: str
@@ -23,6 +49,19 @@ class ApiConfig:
     api_url: str = "https://api.piste.gouv.fr/dila/legifrance/lf-engine-app/"
     connect_timeout: float = 3.05  # seconds
     read_timeout: float = 27.0  # seconds
+    token_refresh_margin: float = 60.0  # seconds
+    token_cache_dir: Optional[str] = None
+    max_requests_per_second: Optional[float] = None
+    rate_limit_burst: Optional[int] = None
+    max_retries: int = 3
+    retry_backoff_factor: float = 0.5  # seconds
+    retry_max_backoff: float = 30.0  # seconds
+    coalesce_requests: bool = True
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    compression: bool = True
 
     @classmethod
     def from_env(cls) -> "ApiConfig":
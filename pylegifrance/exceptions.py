@@ -0,0 +1,42 @@
+"""Exceptions raised by the PyLegifrance client.
+
+All exceptions derive from the built-in Exception, so existing
+``except Exception`` handlers keep working.
+"""
+
+from typing import Optional
+
+
+class LegifranceAPIError(Exception):
+    """
+    Error status returned by the Legifrance API.
+
+    Attributes:
+        status_code: The HTTP status code of the response.
+        response_text: The body of the response.
+        retry_after: Seconds to wait before retrying, if the API said so
+            through a ``Retry-After`` header.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        response_text: str = "",
+        retry_after: Optional[float] = None,
+    ):
+        self.status_code = status_code
+        self.response_text = response_text
+        self.retry_after = retry_after
+        super().__init__(f"API client error {status_code} - {response_text}")
+
+
+class RateLimitError(LegifranceAPIError):
+    """The API rejected the request because the quota was exceeded (HTTP 429)."""
+
+    def __init__(
+        self,
+        status_code: int = 429,
+        response_text: str = "",
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(status_code, response_text, retry_after)
@@ -1,9 +1,22 @@
-from pylegifrance.fonds.juri import JuriAPI, JuriDecision
-from pylegifrance.fonds.loda import Loda, TexteLoda
+from pylegifrance.fonds.citation_graph import CitationGraph
+from pylegifrance.fonds.juri import (
+    AsyncJuriAPI,
+    Citation,
+    JuriAPI,
+    JuriDecision,
+    JuriSearchHit,
+)
+from pylegifrance.fonds.loda import AsyncLoda, LazyTexteLoda, Loda, TexteLoda
 
 __all__ = [
+    "AsyncJuriAPI",
+    "AsyncLoda",
+    "Citation",
+    "CitationGraph",
     "JuriAPI",
     "JuriDecision",
+    "JuriSearchHit",
+    "LazyTexteLoda",
     "Loda",
     "TexteLoda",
 ]
@@ -0,0 +1,333 @@
+import json
+import logging
+import os
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from pylegifrance.fonds.juri import JuriAPI, JuriDecision
+from pylegifrance.utils import map_concurrently
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Node states
+PENDING = 0
+EXPANDED = 1
+FAILED = 2
+
+
+class CitationGraph:
+    """
+    Citation network of JURI decisions, expanded breadth-first.
+
+    Starting from a root decision, the crawler fetches each decision once
+    through JuriAPI.fetch and follows its citation links up to max_depth.
+    Nodes are numbered in discovery order and each node keeps its outgoing
+    edges in an integer array, so large graphs stay compact. The crawl
+    state (nodes, edges, frontier) can be saved to a JSON checkpoint and
+    resumed later with CitationGraph.load().
+
+    Examples
+    --------
+    >>> graph = CitationGraph(JuriAPI(client), max_depth=2, max_workers=8)
+    >>> graph.crawl("JURITEXT000007022838", checkpoint_path="graph.json")
+    >>> graph.successors("JURITEXT000007022838")
+    """
+
+    def __init__(
+        self,
+        api: JuriAPI,
+        max_depth: int = 2,
+        max_nodes: int = 1000,
+        max_workers: int = 1,
+    ):
+        """
+        Initialize an empty citation graph.
+
+        Parameters
+        ----------
+        api : JuriAPI
+            The API used to fetch the decisions.
+        max_depth : int, optional
+            Citation distance from the root beyond which links are not
+            followed (default: 2). Nodes at max_depth are recorded but not
+            fetched.
+        max_nodes : int, optional
+            Maximum number of nodes in the graph (default: 1000). Citations
+            discovered once the budget is spent are dropped.
+        max_workers : int, optional
+            Maximum number of decisions fetched concurrently (default: 1).
+
+        Raises
+        ------
+        ValueError
+            If max_depth is negative, or max_nodes or max_workers lower than 1.
+        """
+        if max_depth < 0:
+            raise ValueError("max_depth cannot be negative")
+        if max_nodes < 1:
+            raise ValueError("max_nodes must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self._api = api
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_workers = max_workers
+
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._depths = array("l")
+        self._states = bytearray()
+        self._edges: List[array] = []
+        self._frontier: Deque[int] = deque()
+        self._errors: Dict[int, str] = {}
+        self.truncated = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, text_id: object) -> bool:
+        return text_id in self._index
+
+    def __repr__(self) -> str:
+        return (
+            f"CitationGraph(nodes={len(self)}, edges={self.edge_count}, "
+            f"pending={len(self._frontier)})"
+        )
+
+    @property
+    def nodes(self) -> List[str]:
+        """Get the IDs of the decisions in the graph, in discovery order."""
+        return list(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Get the number of citation edges."""
+        return sum(len(edges) for edges in self._edges)
+
+    @property
+    def is_complete(self) -> bool:
+        """Tell whether every reachable node within the limits was expanded."""
+        return not self._frontier
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Get the decisions that could not be fetched, with the error."""
+        return {self._ids[node]: error for node, error in self._errors.items()}
+
+    def depth(self, text_id: str) -> int:
+        """Get the citation distance between the root and a decision."""
+        return self._depths[self._index[text_id]]
+
+    def successors(self, text_id: str) -> List[str]:
+        """Get the IDs of the decisions cited by a decision."""
+        return [self._ids[target] for target in self._edges[self._index[text_id]]]
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the (citing, cited) pairs of decision IDs."""
+        for source, targets in enumerate(self._edges):
+            for target in targets:
+                yield self._ids[source], self._ids[target]
+
+    def crawl(
+        self,
+        root: Optional[Union[str, JuriDecision]] = None,
+        checkpoint_path: Optional[Union[str, os.PathLike]] = None,
+    ) -> "CitationGraph":
+        """
+        Expand the citation network breadth-first.
+
+        Parameters
+        ----------
+        root : Optional[Union[str, JuriDecision]], optional
+            The decision (or its ID) to start from. When omitted, the crawl
+            resumes from the pending frontier, e.g. after load().
+        checkpoint_path : Optional[Union[str, os.PathLike]], optional
+            If given, the crawl state is saved there after each batch of
+            fetched decisions.
+
+        Returns
+        -------
+        CitationGraph
+            The graph itself.
+
+        Raises
+        ------
+        ValueError
+            If no root is given and the graph is empty.
+        """
+        if root is not None:
+            self._add_root(root)
+        elif not self._ids:
+            raise ValueError("A root decision is required to start a crawl")
+
+        batch_size = self.max_workers * 4
+        while self._frontier:
+            batch = [
+                self._frontier.popleft()
+                for _ in range(min(batch_size, len(self._frontier)))
+            ]
+            results = map_concurrently(self._fetch, batch, max_workers=self.max_workers)
+            for node, (decision, error) in zip(batch, results):
+                if decision is None:
+                    self._states[node] = FAILED
+                    self._errors[node] = error
+                    logger.warning(f"Could not fetch {self._ids[node]}: {error}")
+                else:
+                    self._expand(node, decision)
+
+            if checkpoint_path is not None:
+                self.save(checkpoint_path)
+
+        return self
+
+    def _fetch(self, node: int) -> Tuple[Optional[JuriDecision], Optional[str]]:
+        try:
+            decision = self._api.fetch(self._ids[node])
+        except Exception as e:
+            # A failing decision must not stop the crawl
+            return None, str(e)
+        if decision is None:
+            return None, "not found"
+        return decision, None
+
+    def _add_root(self, root: Union[str, JuriDecision]) -> None:
+        root_id = root.id if isinstance(root, JuriDecision) else root
+        if not root_id:
+            raise ValueError("The root decision has no ID")
+        if root_id in self._index:
+            return
+
+        node = self._add_node(root_id, 0)
+        if node is None or self.max_depth == 0:
+            return
+        if isinstance(root, JuriDecision):
+            # No need to fetch a decision we already have
+            self._expand(node, root)
+        else:
+            self._frontier.append(node)
+
+    def _add_node(self, text_id: str, depth: int) -> Optional[int]:
+        if len(self._ids) >= self.max_nodes:
+            self.truncated = True
+            return None
+
+        node = len(self._ids)
+        self._ids.append(text_id)
+        self._index[text_id] = node
+        self._depths.append(depth)
+        self._states.append(PENDING)
+        self._edges.append(array("l"))
+        return node
+
+    def _expand(self, node: int, decision: JuriDecision) -> None:
+        depth = self._depths[node] + 1
+        edges = self._edges[node]
+        for cited_id in decision.citation_ids:
+            target = self._index.get(cited_id)
+            if target is None:
+                target = self._add_node(cited_id, depth)
+                if target is None:
+                    continue
+                if depth < self.max_depth:
+                    self._frontier.append(target)
+            if target != node:
+                edges.append(target)
+        self._states[node] = EXPANDED
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the crawl state to a JSON-serializable dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The limits, nodes, edges, frontier and errors of the crawl.
+        """
+        return {
+            "version": CHECKPOINT_VERSION,
+            "max_depth": self.max_depth,
+            "max_nodes": self.max_nodes,
+            "truncated": self.truncated,
+            "ids": self._ids,
+            "depths": self._depths.tolist(),
+            "states": list(self._states),
+            "edges": [edges.tolist() for edges in self._edges],
+            "frontier": list(self._frontier),
+            "errors": {str(node): error for node, error in self._errors.items()},
+        }
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Save the crawl state to a JSON checkpoint.
+
+        The file is replaced atomically, so an interrupted save leaves the
+        previous checkpoint intact.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The checkpoint file.
+        """
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as checkpoint:
+            json.dump(self.to_dict(), checkpoint)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, os.PathLike],
+        api: JuriAPI,
+        max_workers: int = 1,
+    ) -> "CitationGraph":
+        """
+        Load a crawl state saved by save().
+
+        Call crawl() without a root on the result to resume the crawl.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            The checkpoint file.
+        api : JuriAPI
+            The API used to fetch the remaining decisions.
+        max_workers : int, optional
+            Maximum number of decisions fetched concurrently (default: 1).
+
+        Returns
+        -------
+        CitationGraph
+            The restored graph.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint format is not supported.
+        """
+        with open(path, encoding="utf-8") as checkpoint:
+            state = json.load(checkpoint)
+
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported citation graph checkpoint version: {state.get('version')}"
+            )
+
+        graph = cls(
+            api,
+            max_depth=state["max_depth"],
+            max_nodes=state["max_nodes"],
+            max_workers=max_workers,
+        )
+        graph.truncated = state["truncated"]
+        graph._ids = list(state["ids"])
+        graph._index = {text_id: node for node, text_id in enumerate(graph._ids)}
+        graph._depths = array("l", state["depths"])
+        graph._states = bytearray(state["states"])
+        graph._edges = [array("l", edges) for edges in state["edges"]]
+        graph._frontier = deque(state["frontier"])
+        graph._errors = {int(node): error for node, error in state["errors"].items()}
+        return graph
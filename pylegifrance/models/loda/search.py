@@ -63,7 +63,7 @@ class SearchRequest(BaseModel):
         Returns
         -------
         Dict[str, Any]
-            A dictionary representation of the search request.
+            A JSON-ready dictionary representation of the search request.
         """
         # Always use the SearchRequestDTO for consistency
         # Simple list requests don't work well with search terms
@@ -265,5 +265,5 @@ class SearchRequest(BaseModel):
         # Create the final SearchRequestDTO
         recherche_final = SearchRequestDTO(recherche=recherche, fond=self.fond)
 
-        # Return as a dictionary
-        return recherche_final.model_dump(by_alias=True)
+        # Return as a JSON-ready dictionary (enums and dates already serialized)
+        return recherche_final.model_dump(mode="json", by_alias=True)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Moteur asynchrone pour les pipelines de traitement des résultats renvoyés
+par l'API Legifrance.
+
+Les étapes d'appel à l'API s'exécutent sur une boucle d'événements avec un
+AsyncLegifranceClient ; les étapes synchrones existantes (ExtractSearchResult,
+GetArticleId, Formatters...) sont adaptées automatiquement.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Callable, List, Optional, Union
+
+from pydantic import BaseModel
+
+from pylegifrance.pipeline.pipeline import (
+    CachedStep,
+    CallApiStep,
+    PaginatedSearchStep,
+    PipelineReport,
+    PipelineStep,
+    StepMetrics,
+    _apply_counters,
+    _count_errors,
+    _count_items,
+    _is_error,
+    _read_counters,
+    _record_metrics,
+    _step_name,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPipelineStep:
+    """
+    Classe de base pour une étape asynchrone du pipeline.
+    """
+
+    async def process(self, data, data_type=""):
+        """
+        Méthode de traitement des données à implémenter par chaque sous-classe.
+
+        Args:
+            data: Données à traiter.
+            data_type: Type des données à traiter.
+
+        Returns:
+            Tuple[Any, str]: Données transformées et leur type.
+        """
+        raise NotImplementedError
+
+
+def _calls_api(step: PipelineStep) -> bool:
+    """Indique si une étape synchrone appelle l'API, sous ses éventuels CachedStep."""
+    while isinstance(step, CachedStep):
+        step = step.step
+    return isinstance(step, (CallApiStep, PaginatedSearchStep))
+
+
+class SyncStepAdapter(AsyncPipelineStep):
+    """
+    Adapte une étape synchrone (PipelineStep) au pipeline asynchrone.
+
+    Les étapes de calcul s'exécutent directement dans la boucle d'événements ;
+    une étape qui appelle l'API (CallApiStep ou PaginatedSearchStep, y compris
+    enveloppée dans un CachedStep), et qui bloquerait la boucle pendant ses
+    appels, s'exécute dans un thread.
+
+    Attributs:
+        step (PipelineStep): L'étape synchrone adaptée.
+        in_thread (bool): Exécute l'étape dans un thread plutôt que dans la
+            boucle d'événements.
+    """
+
+    def __init__(self, step: PipelineStep, in_thread: Optional[bool] = None):
+        self.step = step
+        self.in_thread = _calls_api(step) if in_thread is None else in_thread
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose les compteurs de l'étape adaptée (bytes_received, cache_hits...)
+        if name == "step":
+            raise AttributeError(name)
+        return getattr(self.step, name)
+
+    async def process(self, data, data_type=""):
+        if self.in_thread:
+            return await asyncio.to_thread(self.step.process, data, data_type)
+        return self.step.process(data, data_type)
+
+
+def as_async_step(step: Union[PipelineStep, AsyncPipelineStep]) -> AsyncPipelineStep:
+    """
+    Renvoie l'étape telle quelle si elle est asynchrone, adaptée sinon.
+
+    Args:
+        step (Union[PipelineStep, AsyncPipelineStep]): Étape à adapter.
+
+    Returns:
+        AsyncPipelineStep: Étape utilisable par AsyncPipeline.
+
+    Raises:
+        TypeError: Si l'étape n'est ni une PipelineStep ni une AsyncPipelineStep.
+    """
+    if isinstance(step, AsyncPipelineStep):
+        return step
+    if isinstance(step, PipelineStep):
+        return SyncStepAdapter(step)
+    raise TypeError(f"Étape de pipeline non prise en charge : {step!r}")
+
+
+class AsyncPipeline:
+    """
+    Pipeline de traitement de données exécuté sur une boucle d'événements.
+
+    Même fonctionnement que Pipeline (arrêt à la première erreur, mesures par
+    étape dans `last_report` et `on_step`), avec des étapes asynchrones ; les
+    étapes synchrones sont adaptées automatiquement (voir SyncStepAdapter).
+
+    Attributs:
+        steps (List[AsyncPipelineStep]): Liste des étapes du pipeline.
+        on_step (Callable[[StepMetrics], None], optional): Fonction appelée
+            avec les mesures de chaque étape, dès la fin de celle-ci.
+        last_report (PipelineReport, optional): Rapport de la dernière exécution.
+    """
+
+    def __init__(
+        self,
+        steps: List[Union[PipelineStep, AsyncPipelineStep]],
+        on_step: Optional[Callable[[StepMetrics], None]] = None,
+    ):
+        self.steps = [as_async_step(step) for step in steps]
+        self.on_step = on_step
+        self.last_report: Optional[PipelineReport] = None
+
+    async def execute(self, data: Any, data_type: str = "") -> Any:
+        """
+        Exécute chaque étape du pipeline, en faisant passer les données
+        à travers chacune d'entre elles.
+
+        Args:
+            data (Any): Données à traiter par le pipeline.
+            data_type (str): Type initial des données.
+
+        Returns:
+            Any: Données transformées après être passées à travers
+                 toutes les étapes du pipeline.
+        """
+        report = PipelineReport()
+        self.last_report = report
+
+        for index, step in enumerate(self.steps):
+            if isinstance(data, dict) and "error" in data:
+                logger.warning(f"Pipeline stopped due to error: {data['error']}")
+                return data
+
+            metrics = StepMetrics(
+                index=index, name=_step_name(step), items_in=_count_items(data)
+            )
+            counters = _read_counters(step)
+            start = time.perf_counter()
+            try:
+                data, data_type = await step.process(data, data_type)
+            except Exception:
+                metrics.errors = 1
+                raise
+            else:
+                metrics.items_out = _count_items(data)
+                metrics.errors = _count_errors(data, data_type)
+            finally:
+                metrics.wall_time = time.perf_counter() - start
+                _apply_counters(metrics, step, counters)
+                _record_metrics(report, metrics, self.on_step)
+
+            logger.debug(f"Type de données de l'étape : {data_type}")
+
+            if data_type == "error":
+                logger.warning("Pipeline stopped due to error in step")
+                return data
+
+        return data
+
+
+class AsyncCallApiStep(AsyncPipelineStep):
+    """
+    Étape d'appel d'API asynchrone : pendant de CallApiStep pour un
+    AsyncLegifranceClient.
+
+    Pour une liste de modèles (GetArticle, LegiPart...), les appels sont
+    lancés simultanément sur la boucle d'événements, dans la limite de
+    `max_concurrency`, et les réponses gardent l'ordre des modèles.
+
+    Attributs:
+        client (AsyncLegifranceClient): Client asynchrone pour appeler l'API.
+        max_concurrency (int): Nombre maximal d'appels simultanés. Par défaut à 10.
+        bytes_received (int): Total des octets reçus de l'API par l'étape.
+    """
+
+    def __init__(self, client, max_concurrency: int = 10):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency doit être au moins égal à 1")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.bytes_received = 0
+
+    async def process(self, data, data_type=""):
+        """
+        Appelle l'API LegiFrance en utilisant les modèles (payload).
+
+        Voir CallApiStep.process : un appel en échec dans une liste est
+        remplacé par {"error": ...}, et l'étape renvoie une erreur si tous
+        les appels ont échoué.
+        """
+        if isinstance(data, dict) and "error" in data:
+            logger.warning(f"Error detected in pipeline: {data['error']}")
+            return data, "error"
+
+        if isinstance(data, BaseModel):
+            response_content = await self._call_api(data)
+            return response_content, getattr(data, "model_reponse", None)
+
+        if isinstance(data, list) and all(
+            isinstance(item, BaseModel) or _is_error(item) for item in data
+        ):
+            return await self._call_api_multiple(data)
+
+        raise ValueError(
+            "Les données d'entrée doivent être un modèle Pydantic "
+            "ou une liste de modèles Pydantic"
+        )
+
+    async def _call_api(self, model: BaseModel) -> Any:
+        """Appelle l'API pour un modèle et décode la réponse JSON."""
+        route = getattr(model, "route", None)
+        response = await self.client.call_api(
+            route=route, data=model.model_dump(mode="json")
+        )
+        logger.debug(
+            f"Appel API vers {route} retourné code de statut {response.status_code}"
+        )
+
+        content = response.content
+        self.bytes_received += len(content)
+        return json.loads(content.decode("utf-8"))
+
+    async def _call_api_multiple(self, models: List[BaseModel]):
+        """Appelle l'API pour une liste de modèles, simultanément."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call_item(model: BaseModel) -> Any:
+            # Une erreur émise plus haut (page ou article en échec) est transmise
+            if _is_error(model):
+                return model
+            async with semaphore:
+                try:
+                    return await self._call_api(model)
+                except Exception as e:
+                    # Un appel en échec ne doit pas empêcher les autres
+                    route = getattr(model, "route", None)
+                    logger.warning(f"Appel API vers {route} en échec : {e}")
+                    return {"error": str(e)}
+
+        responses = list(await asyncio.gather(*(call_item(m) for m in models)))
+
+        errors = [
+            response
+            for response in responses
+            if isinstance(response, dict) and "error" in response
+        ]
+        if errors and len(errors) == len(responses):
+            return {"error": errors[0]["error"]}, "error"
+
+        first = next((model for model in models if isinstance(model, BaseModel)), None)
+        return responses, getattr(first, "model_reponse", None)
@@ -8,12 +8,21 @@ renvoyés par l'API Legifrance.
 """
 
 from pydantic import BaseModel
-from typing import List, Union, Dict, Any
+from typing import Callable, List, Optional, Union, Dict, Any, Iterator
+from dataclasses import asdict, dataclass, field
+from itertools import chain
+import hashlib
 import logging
 import json
+import threading
+import time
 
+from pylegifrance.cache import CacheBackend, CacheStats, MemoryCacheBackend
 from pylegifrance.models.consult import GetArticle, LegiPart
+from pylegifrance.utils import dumps_json, imap_concurrently, map_concurrently
 from pylegifrance.process.processors import (
+    GetArticleIdError,
+    GetTextIdError,
     search_response_DTO,
     get_article_id,
     get_text_id,
@@ -27,6 +36,140 @@ from pylegifrance.process.formatters import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class StepMetrics:
+    """
+    Mesures d'une étape lors d'une exécution du pipeline.
+
+    Attributs:
+        index (int): Position de l'étape dans le pipeline.
+        name (str): Nom de la classe de l'étape.
+        wall_time (float): Durée de l'étape, en secondes.
+        items_in (int): Nombre d'éléments reçus (1 pour une donnée unique).
+        items_out (int): Nombre d'éléments produits.
+        bytes_received (int): Octets reçus de l'API par l'étape.
+        errors (int): Nombre d'éléments en erreur (ou 1 si l'étape a échoué).
+        cache_hits (int): Résultats servis par le cache (voir CachedStep).
+        cache_misses (int): Résultats calculés faute d'entrée dans le cache.
+    """
+
+    index: int
+    name: str
+    wall_time: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+    bytes_received: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Éléments produits par seconde (0.0 si la durée est nulle)."""
+        return self.items_out / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Part des résultats servis par le cache (0.0 sans cache)."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+
+@dataclass
+class PipelineReport:
+    """
+    Rapport d'exécution d'un pipeline : les mesures de chaque étape exécutée.
+
+    Attributs:
+        steps (List[StepMetrics]): Mesures des étapes, dans l'ordre d'exécution.
+    """
+
+    steps: List[StepMetrics] = field(default_factory=list)
+
+    @property
+    def wall_time(self) -> float:
+        """Durée totale des étapes, en secondes."""
+        return sum(step.wall_time for step in self.steps)
+
+    @property
+    def bytes_received(self) -> int:
+        """Octets reçus de l'API par l'ensemble des étapes."""
+        return sum(step.bytes_received for step in self.steps)
+
+    @property
+    def errors(self) -> int:
+        """Nombre d'erreurs sur l'ensemble des étapes."""
+        return sum(step.errors for step in self.steps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convertit le rapport en dictionnaire (pour export ou journalisation)."""
+        return {
+            "wall_time": self.wall_time,
+            "bytes_received": self.bytes_received,
+            "errors": self.errors,
+            "steps": [asdict(step) for step in self.steps],
+        }
+
+
+def _count_items(data: Any) -> int:
+    """Nombre d'éléments d'une donnée : la longueur d'une liste, sinon 1."""
+    if data is None:
+        return 0
+    return len(data) if isinstance(data, list) else 1
+
+
+def _is_error(item: Any) -> bool:
+    """Indique si un élément est un dictionnaire d'erreur ({"error": ...})."""
+    return isinstance(item, dict) and "error" in item
+
+
+def _count_errors(data: Any, data_type: str) -> int:
+    """Nombre d'éléments en erreur ({"error": ...}) dans une donnée."""
+    if data_type == "error":
+        return 1
+    items = data if isinstance(data, list) else [data]
+    return sum(1 for item in items if _is_error(item))
+
+
+# Compteurs cumulés des étapes, dont la variation est mesurée à chaque exécution
+_STEP_COUNTERS = ("bytes_received", "cache_hits", "cache_misses")
+
+
+def _step_name(step: Any) -> str:
+    """Nom de l'étape mesurée, en traversant les adaptateurs (attribut `step`)."""
+    return type(getattr(step, "step", step)).__name__
+
+
+def _read_counters(step: Any) -> Dict[str, int]:
+    return {name: getattr(step, name, 0) for name in _STEP_COUNTERS}
+
+
+def _apply_counters(metrics: StepMetrics, step: Any, before: Dict[str, int]) -> None:
+    """Reporte dans les mesures la variation des compteurs de l'étape."""
+    for name, value in _read_counters(step).items():
+        setattr(metrics, name, value - before[name])
+
+
+def _record_metrics(
+    report: PipelineReport,
+    metrics: StepMetrics,
+    on_step: Optional[Callable[[StepMetrics], None]],
+) -> None:
+    """Ajoute les mesures d'une étape au rapport et les transmet à on_step."""
+    report.steps.append(metrics)
+    logger.debug(
+        f"Étape {metrics.name} : {metrics.wall_time:.3f} s, "
+        f"{metrics.items_out} éléments, {metrics.bytes_received} octets, "
+        f"{metrics.errors} erreurs"
+    )
+    if on_step is not None:
+        try:
+            on_step(metrics)
+        except Exception as e:
+            # L'export des mesures ne doit pas interrompre le pipeline
+            logger.warning(f"Erreur dans le callback on_step : {e}")
+
+
 class PipelineStep:
     """
     Classe de base pour une étape dans le pipeline de traitement.
@@ -45,17 +188,53 @@ class PipelineStep:
         """
         raise NotImplementedError
 
+    def process_stream(self, data, data_type=""):
+        """
+        Traitement des données en flux, utilisé par Pipeline.stream.
+
+        Par défaut, un flux (itérateur) reçu de l'étape précédente est
+        matérialisé en liste puis confié à process(). Les étapes capables de
+        traiter les éléments un à un redéfinissent cette méthode pour
+        renvoyer à leur tour un itérateur.
+
+        Args:
+            data: Données à traiter, éventuellement un itérateur.
+            data_type: Type des données (des éléments, pour un flux).
+
+        Returns:
+            Tuple[Any, str]: Données transformées (éventuellement un
+            itérateur) et leur type.
+        """
+        if isinstance(data, Iterator):
+            data = list(data)
+        return self.process(data, data_type)
+
 
 class Pipeline:
     """
     Classe représentant un pipeline de traitement de données.
 
+    Chaque exécution par execute() est mesurée étape par étape (durée,
+    nombre d'éléments, octets reçus, erreurs) ; le rapport est disponible dans
+    `last_report` et chaque mesure peut être transmise à `on_step`, par
+    exemple pour l'exporter vers un système de métriques.
+
     Attributs:
         steps (List[PipelineStep]): Liste des étapes du pipeline.
+        on_step (Callable[[StepMetrics], None], optional): Fonction appelée
+            avec les mesures de chaque étape, dès la fin de celle-ci.
+        last_report (PipelineReport, optional): Rapport de la dernière
+            exécution par execute().
     """
 
-    def __init__(self, steps: List[PipelineStep]):
+    def __init__(
+        self,
+        steps: List[PipelineStep],
+        on_step: Optional[Callable[[StepMetrics], None]] = None,
+    ):
         self.steps = steps
+        self.on_step = on_step
+        self.last_report: Optional[PipelineReport] = None
 
     def execute(self, data: Any, data_type: str = "") -> Any:
         """
@@ -70,13 +249,33 @@ class Pipeline:
             Any: Données transformées après être passées à travers
                  toutes les étapes du pipeline.
         """
-        for step in self.steps:
+        report = PipelineReport()
+        self.last_report = report
+
+        for index, step in enumerate(self.steps):
             # Si on a déjà une erreur, on arrête le pipeline et on retourne l'erreur
             if isinstance(data, dict) and "error" in data:
                 logger.warning(f"Pipeline stopped due to error: {data['error']}")
                 return data
 
-            data, data_type = step.process(data, data_type)
+            metrics = StepMetrics(
+                index=index, name=_step_name(step), items_in=_count_items(data)
+            )
+            counters = _read_counters(step)
+            start = time.perf_counter()
+            try:
+                data, data_type = step.process(data, data_type)
+            except Exception:
+                metrics.errors = 1
+                raise
+            else:
+                metrics.items_out = _count_items(data)
+                metrics.errors = _count_errors(data, data_type)
+            finally:
+                metrics.wall_time = time.perf_counter() - start
+                _apply_counters(metrics, step, counters)
+                _record_metrics(report, metrics, self.on_step)
+
             logger.debug(f"Type de données de l'étape : {data_type}")
 
             # Si une étape a retourné une erreur, on arrête le pipeline
@@ -86,6 +285,56 @@ class Pipeline:
 
         return data
 
+    def stream(self, data: Any, data_type: str = "") -> Iterator[Any]:
+        """
+        Exécute le pipeline en flux et produit les résultats un à un.
+
+        Les étapes qui le permettent (CallApiStep sur une liste de modèles,
+        Formatters) se transmettent des itérateurs : chaque résultat final est
+        produit dès que sa réponse d'API est reçue, sans que l'ensemble des
+        réponses soit gardé en mémoire.
+
+        Args:
+            data (Any): Données à traiter par le pipeline.
+            data_type (str): Type initial des données.
+
+        Returns:
+            Iterator[Any]: Les éléments du résultat final (un seul si le
+                 résultat n'est pas une liste), ou le dictionnaire d'erreur qui
+                 a arrêté le pipeline.
+
+        Raises:
+            ValueError: Si le pipeline a un callback `on_step` : les étapes
+                s'exécutant de façon entrelacée, l'exécution en flux n'est pas
+                mesurée et ne met pas à jour `last_report`.
+        """
+        if self.on_step is not None:
+            raise ValueError(
+                "on_step n'est pas pris en charge en flux : utiliser execute()"
+            )
+        return self._stream(data, data_type)
+
+    def _stream(self, data: Any, data_type: str) -> Iterator[Any]:
+        """Générateur de stream(), qui enchaîne les process_stream des étapes."""
+        for step in self.steps:
+            if isinstance(data, dict) and "error" in data:
+                logger.warning(f"Pipeline stopped due to error: {data['error']}")
+                yield data
+                return
+
+            data, data_type = step.process_stream(data, data_type)
+            logger.debug(f"Type de données de l'étape : {data_type}")
+
+            if data_type == "error":
+                logger.warning("Pipeline stopped due to error in step")
+                yield data
+                return
+
+        if isinstance(data, (list, Iterator)):
+            yield from data
+        else:
+            yield data
+
 
 class ExtractSearchResult(PipelineStep):
     """
@@ -176,10 +425,25 @@ class CallApiStep(PipelineStep):
 
     Attributs:
         client (LegifranceClient): Client pour appeler l'API.
+        max_workers (int): Nombre maximal d'appels simultanés pour une liste
+            de modèles. Par défaut à 1 (appels successifs).
+        bytes_received (int): Total des octets reçus de l'API par l'étape.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, max_workers: int = 1):
+        if max_workers < 1:
+            raise ValueError("max_workers doit être au moins égal à 1")
         self.client = client
+        self.max_workers = max_workers
+        self.bytes_received = 0
+        self._bytes_lock = threading.Lock()
+
+    def _read_content(self, response) -> Any:
+        """Décode le contenu JSON d'une réponse en comptant les octets reçus."""
+        content = response.content
+        with self._bytes_lock:
+            self.bytes_received += len(content)
+        return json.loads(content.decode("utf-8"))
 
     def process(self, data: Union[BaseModel, List[BaseModel], Dict], data_type=""):
         """
@@ -207,7 +471,7 @@ class CallApiStep(PipelineStep):
             # Traitement pour un seul modèle Pydantic
             return self._call_api_single(data)
         elif isinstance(data, list) and all(
-            isinstance(item, BaseModel) for item in data
+            isinstance(item, BaseModel) or _is_error(item) for item in data
         ):
             # Traitement pour une liste de modèles Pydantic
             return self._call_api_multiple(data)
@@ -217,6 +481,37 @@ class CallApiStep(PipelineStep):
                 "ou une liste de modèles Pydantic"
             )
 
+    def process_stream(self, data, data_type=""):
+        """
+        Appelle l'API en flux pour une liste ou un itérateur de modèles.
+
+        Les réponses sont produites dans l'ordre des modèles, dès leur
+        réception, avec au plus `max_workers` appels en cours. Un appel en
+        échec produit {"error": ...} ; contrairement à process(), l'étape
+        n'échoue pas globalement si tous les appels échouent.
+
+        Args:
+            data: Modèle Pydantic, liste ou itérateur de modèles, ou
+                  dictionnaire d'erreur.
+            data_type (str): Type des données d'entrée (non utilisé).
+
+        Returns:
+            Tuple[Iterator[Any], Any | None]: Itérateur des contenus de
+            réponses JSON et le type de modèle de réponse.
+        """
+        if not isinstance(data, (list, Iterator)):
+            return self.process(data, data_type)
+
+        models = iter(data)
+        first = next(models, None)
+        if first is None:
+            return iter(()), None
+
+        responses = imap_concurrently(
+            self._call_api_item, chain([first], models), max_workers=self.max_workers
+        )
+        return responses, getattr(first, "model_reponse", None)
+
     def _call_api_single(self, model: BaseModel) -> tuple[Any, Any | None]:
         """
         Appelle l'API avec une seule requête (modèle).
@@ -237,7 +532,7 @@ class CallApiStep(PipelineStep):
         )
 
         model_reponse = getattr(model, "model_reponse", None)
-        response_content = json.loads(response.content.decode("utf-8"))
+        response_content = self._read_content(response)
 
         return response_content, model_reponse
 
@@ -247,32 +542,214 @@ class CallApiStep(PipelineStep):
         """
         Appelle l'API avec une liste de requêtes (modèles).
 
+        Les appels sont répartis sur au plus `max_workers` threads ; les
+        résultats restent dans l'ordre des modèles. Un appel en échec est
+        remplacé par un dictionnaire {"error": ...} sans interrompre les autres.
+
         Args:
             models (List[BaseModel]): Liste de modèles Pydantic utilisés
                                       pour générer les payloads.
 
         Returns:
             Tuple[List[Any], Any | None]: Liste des contenus de réponses JSON
-                                         et le type de modèle de réponse.
+                                         et le type de modèle de réponse, ou
+                                         un dictionnaire d'erreur et "error"
+                                         si tous les appels ont échoué.
         """
-        responses = []
+        responses = map_concurrently(
+            self._call_api_item, models, max_workers=self.max_workers
+        )
 
-        for model in models:
-            route = getattr(model, "route", None)
-            payload = model.model_dump(mode="json")
+        errors = [
+            response
+            for response in responses
+            if isinstance(response, dict) and "error" in response
+        ]
+        if errors and len(errors) == len(responses):
+            return {"error": errors[0]["error"]}, "error"
+
+        # Utilise le model_reponse du premier modèle pour tous les résultats
+        first = next((model for model in models if isinstance(model, BaseModel)), None)
+        model_reponse = getattr(first, "model_reponse", None)
+
+        return responses, model_reponse
+
+    def _call_api_item(self, model: BaseModel) -> Any:
+        """
+        Appelle l'API pour un modèle d'une liste, en capturant l'erreur éventuelle.
 
+        Args:
+            model (BaseModel): Modèle Pydantic utilisé pour générer le payload.
+
+        Returns:
+            Any: Contenu de la réponse JSON, ou {"error": ...} en cas d'échec.
+        """
+        # Une erreur produite en amont (page de recherche en échec) est transmise
+        if _is_error(model):
+            return model
+
+        route = getattr(model, "route", None)
+        payload = model.model_dump(mode="json")
+
+        try:
             response = self.client.call_api(route=route, data=payload)
-            response_content = json.loads(response.content.decode("utf-8"))
-            responses.append(response_content)
+            response_content = self._read_content(response)
+        except Exception as e:
+            # Un appel en échec ne doit pas empêcher les autres
+            logger.warning(f"Appel API vers {route} en échec : {e}")
+            return {"error": str(e)}
 
-            logger.debug(
-                f"Appel API vers {route} retourné code de statut {response.status_code}"
-            )
+        logger.debug(
+            f"Appel API vers {route} retourné code de statut {response.status_code}"
+        )
+        return response_content
 
-        # Utilise le model_reponse du premier modèle pour tous les résultats
-        model_reponse = getattr(models[0], "model_reponse", None)
 
-        return responses, model_reponse
+class PaginatedSearchStep(PipelineStep):
+    """
+    Étape de recherche sur toutes les pages de résultats.
+
+    À partir d'une requête de recherche (RechercheFinal), la première page
+    donne le nombre total de résultats ; les pages suivantes sont demandées
+    simultanément (au plus `max_workers` à la fois). Les identifiants extraits
+    de chaque page par `id_step` (GetArticleId ou GetTextId) sont produits en
+    flux, dans l'ordre des pages et sans doublon, pour l'étape de récupération
+    des articles ou des textes.
+
+    Une page en échec produit un élément {"error": ...}, transmis tel quel par
+    CallApiStep et Formatters.
+
+    Les pages sont demandées par `search_step`, par défaut un CallApiStep :
+    un CachedStep permet de mémoriser les pages, dont les compteurs de cache
+    sont reportés dans les mesures de l'étape.
+
+    Avec process() (Pipeline.execute), les identifiants de toutes les pages
+    sont réunis dans une liste avant d'être transmis ; process_stream()
+    (Pipeline.stream) ne demande chaque page qu'au fur et à mesure de la
+    consommation des identifiants.
+
+    Attributs:
+        id_step (PipelineStep): Étape d'extraction des identifiants d'une page.
+        max_workers (int): Nombre maximal de pages demandées simultanément.
+        search_step (PipelineStep): Étape d'appel à l'API pour chaque page.
+        pages (int): Nombre de pages de la dernière recherche.
+    """
+
+    def __init__(
+        self,
+        client,
+        id_step: PipelineStep,
+        max_workers: int = 1,
+        search_step: Optional[PipelineStep] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers doit être au moins égal à 1")
+        self.id_step = id_step
+        self.max_workers = max_workers
+        self.search_step = (
+            search_step if search_step is not None else CallApiStep(client)
+        )
+        self.pages = 0
+
+    @property
+    def bytes_received(self) -> int:
+        """Octets reçus de l'API pour les pages de résultats."""
+        return getattr(self.search_step, "bytes_received", 0)
+
+    @property
+    def cache_hits(self) -> int:
+        """Pages servies par le cache (search_step mémorisé)."""
+        return getattr(self.search_step, "cache_hits", 0)
+
+    @property
+    def cache_misses(self) -> int:
+        """Pages demandées à l'API malgré le cache (search_step mémorisé)."""
+        return getattr(self.search_step, "cache_misses", 0)
+
+    def process(self, data, data_type=""):
+        """
+        Renvoie la liste dédoublonnée des identifiants de toutes les pages.
+
+        Args:
+            data (RechercheFinal): La requête de recherche (page de départ).
+            data_type (str): Type des données d'entrée (non utilisé).
+
+        Returns:
+            Tuple[List[BaseModel], str]: Les modèles GetArticle ou LegiPart
+            et le nom de leur type.
+        """
+        ids, ids_type = self.process_stream(data, data_type)
+        return list(ids), ids_type
+
+    def process_stream(self, data, data_type=""):
+        """
+        Produit en flux les identifiants dédoublonnés de toutes les pages.
+
+        Args:
+            data (RechercheFinal): La requête de recherche (page de départ).
+            data_type (str): Type des données d'entrée (non utilisé).
+
+        Returns:
+            Tuple[Iterator[BaseModel], str]: Itérateur des modèles GetArticle
+            ou LegiPart et le nom de leur type.
+
+        Raises:
+            GetArticleIdError, GetTextIdError: Si la première page ne contient
+                aucun identifiant.
+        """
+        if _is_error(data):
+            return data, "error"
+
+        first_page, _ = self.search_step.process(data)
+        first_ids, ids_type = self.id_step.process(
+            search_response_DTO(first_page), "ExtractSearchResult"
+        )
+
+        page_size = data.recherche.pageSize
+        total = first_page.get("totalResultNumber")
+        last_page = -(-total // page_size) if isinstance(total, int) else 1
+        self.pages = max(last_page - data.recherche.pageNumber + 1, 1)
+        page_numbers = range(data.recherche.pageNumber + 1, last_page + 1)
+
+        def fetch_page(page_number: int) -> List[Any]:
+            page = data.model_copy(
+                update={
+                    "recherche": data.recherche.model_copy(
+                        update={"pageNumber": page_number}
+                    )
+                }
+            )
+            try:
+                response, _ = self.search_step.process(page)
+            except Exception as e:
+                # Une page en échec ne doit pas empêcher les autres
+                logger.warning(f"Page {page_number} de la recherche en échec : {e}")
+                return [{"error": f"page {page_number} : {e}"}]
+            try:
+                ids, _ = self.id_step.process(
+                    search_response_DTO(response), "ExtractSearchResult"
+                )
+            except (GetArticleIdError, GetTextIdError):
+                return []
+            return ids
+
+        def unique_ids() -> Iterator[Any]:
+            seen = set()
+            pages = chain(
+                [first_ids],
+                imap_concurrently(fetch_page, page_numbers, self.max_workers),
+            )
+            for ids in pages:
+                for model in ids:
+                    if _is_error(model):
+                        yield model
+                        continue
+                    key = model.model_dump_json()
+                    if key not in seen:
+                        seen.add(key)
+                        yield model
+
+        return unique_ids(), ids_type
 
 
 class Formatters(PipelineStep):
@@ -304,3 +781,258 @@ class Formatters(PipelineStep):
 
         # Si le type de données n'est pas reconnu, retourne None
         return None, "None"
+
+    def process_stream(self, data, data_type=""):
+        """
+        Formate en flux les réponses produites par CallApiStep.process_stream.
+
+        Chaque réponse est formatée dès sa réception ; les éléments en erreur
+        sont transmis tels quels.
+
+        Args:
+           data: Itérateur de réponses (ou données acceptées par process()).
+           data_type (str): Type des réponses ("GetArticleResponse" ou
+                            "ConsultTextResponse").
+
+        Returns:
+           Tuple[Any, str]: Itérateur des résultats formatés et leur type.
+        """
+        if not isinstance(data, Iterator):
+            return self.process(data, data_type)
+
+        if data_type == "GetArticleResponse":
+            formate = formate_article_response
+        elif data_type == "ConsultTextResponse":
+            formate = formate_text_response
+        else:
+            return None, "None"
+
+        formatted = (item if "error" in item else formate(item) for item in data)
+        return formatted, str(dict)
+
+
+def _to_cache_input(data: Any) -> Any:
+    """Forme JSON stable d'une entrée d'étape, les modèles étant identifiés par leur classe."""
+    if isinstance(data, BaseModel):
+        return {
+            "model": type(data).__name__,
+            "route": getattr(data, "route", None),
+            "data": data.model_dump(mode="json"),
+        }
+    if isinstance(data, (list, tuple)):
+        return [_to_cache_input(item) for item in data]
+    if isinstance(data, dict):
+        return {str(key): _to_cache_input(value) for key, value in data.items()}
+    return data
+
+
+class CachedStep(PipelineStep):
+    """
+    Étape qui mémorise les résultats d'une autre étape.
+
+    Les résultats sont indexés par une empreinte stable de l'entrée de
+    l'étape (son type et sa forme JSON, via model_dump(mode="json") pour les
+    modèles Pydantic) : une entrée déjà vue est servie par le cache sans
+    exécuter l'étape, par exemple sans appeler l'API. Les résultats comportant
+    une erreur ne sont pas mémorisés, pas plus que les entrées ou les résultats
+    non sérialisables en JSON (l'étape est alors simplement exécutée). Les
+    résultats sont stockés en JSON : un cache partagé sur disque ne peut pas
+    faire exécuter de code au processus qui le lit.
+
+    Pour un CallApiStep recevant une liste de modèles (GetArticle, LegiPart),
+    chaque modèle est mémorisé séparément : seuls les modèles absents du
+    cache sont envoyés à l'API, et un article déjà récupéré par une autre
+    recherche est réutilisé.
+
+    Le cache s'appuie sur un CacheBackend (par défaut un MemoryCacheBackend,
+    borné en nombre d'entrées avec éviction LRU) et peut être partagé entre
+    plusieurs étapes ou pipelines.
+
+    Attributs:
+        step (PipelineStep): L'étape mémorisée.
+        backend (CacheBackend): Le stockage des résultats.
+        ttl (float, optional): Durée de vie des entrées, en secondes
+            (None : pas d'expiration).
+        cache_hits (int): Nombre de résultats servis par le cache.
+        cache_misses (int): Nombre de résultats calculés par l'étape.
+    """
+
+    def __init__(
+        self,
+        step: PipelineStep,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = 3600.0,
+    ):
+        self.step = step
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def bytes_received(self) -> int:
+        """Octets reçus de l'API par l'étape mémorisée."""
+        return getattr(self.step, "bytes_received", 0)
+
+    def stats(self) -> CacheStats:
+        """
+        Renvoie les compteurs de succès et d'échecs du cache.
+
+        Returns:
+            CacheStats: Compteurs et taux de succès (hit_rate).
+        """
+        with self._stats_lock:
+            return CacheStats(hits=self.cache_hits, misses=self.cache_misses)
+
+    def cache_key(self, data: Any, data_type: str = "") -> Optional[str]:
+        """
+        Calcule la clé de cache d'une entrée de l'étape.
+
+        Args:
+            data: Données d'entrée de l'étape.
+            data_type (str): Type des données d'entrée.
+
+        Returns:
+            Optional[str]: Empreinte SHA-256 de l'étape, du type et de la forme
+            JSON canonique de l'entrée, ou None si l'entrée n'est pas
+            sérialisable.
+        """
+        try:
+            payload = dumps_json(
+                [type(self.step).__name__, str(data_type), _to_cache_input(data)],
+                sort_keys=True,
+            )
+        except TypeError:
+            return None
+        return hashlib.sha256(payload).hexdigest()
+
+    def _lookup(self, key: Optional[str]) -> Optional[tuple]:
+        """Renvoie le résultat mémorisé sous la clé, en comptant succès et échecs."""
+        cached = self.backend.get(key) if key is not None else None
+        if cached is not None:
+            try:
+                result, result_type = json.loads(cached)
+            except ValueError:
+                logger.warning(f"Entrée de cache illisible ignorée : {key}")
+                cached = None
+        with self._stats_lock:
+            if cached is None:
+                self.cache_misses += 1
+            else:
+                self.cache_hits += 1
+        return (result, result_type) if cached is not None else None
+
+    def _store(self, key: Optional[str], result: Any, result_type: Any) -> None:
+        """Mémorise un résultat en JSON, sauf s'il comporte une erreur."""
+        if key is None or _count_errors(result, result_type) != 0:
+            return
+        try:
+            value = dumps_json([result, result_type])
+        except TypeError:
+            # Résultat non sérialisable en JSON (modèles Pydantic...) : non mémorisé
+            return
+        self.backend.set(key, value, ttl=self.ttl)
+
+    def _is_model_list(self, data: Any) -> bool:
+        return (
+            isinstance(self.step, CallApiStep)
+            and isinstance(data, list)
+            and bool(data)
+            and all(isinstance(item, BaseModel) for item in data)
+        )
+
+    def process(self, data, data_type=""):
+        """
+        Renvoie le résultat mémorisé de l'étape pour cette entrée, ou l'exécute.
+
+        Args:
+            data: Données à traiter.
+            data_type (str): Type des données à traiter.
+
+        Returns:
+            Tuple[Any, str]: Données transformées et leur type.
+        """
+        if self._is_model_list(data):
+            return self._process_items(data, data_type)
+
+        key = self.cache_key(data, data_type)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        result, result_type = self.step.process(data, data_type)
+        self._store(key, result, result_type)
+        return result, result_type
+
+    def process_stream(self, data, data_type=""):
+        """
+        Version en flux de process() pour un CallApiStep : chaque modèle est
+        servi par le cache ou appelé dès qu'il est reçu.
+
+        Args:
+            data: Données à traiter, éventuellement un itérateur de modèles.
+            data_type (str): Type des données à traiter.
+
+        Returns:
+            Tuple[Any, str]: Données transformées (un itérateur pour une
+            liste de modèles) et leur type.
+        """
+        if not (
+            isinstance(self.step, CallApiStep) and isinstance(data, (list, Iterator))
+        ):
+            return super().process_stream(data, data_type)
+
+        models = iter(data)
+        first = next(models, None)
+        if first is None:
+            return iter(()), None
+        result_type = getattr(first, "model_reponse", None)
+
+        def call_item(model: BaseModel) -> Any:
+            key = self.cache_key(model, data_type)
+            cached = self._lookup(key)
+            if cached is not None:
+                return cached[0]
+            item = self.step._call_api_item(model)
+            self._store(key, item, result_type)
+            return item
+
+        responses = imap_concurrently(
+            call_item, chain([first], models), max_workers=self.step.max_workers
+        )
+        return responses, result_type
+
+    def _process_items(self, models: List[BaseModel], data_type: str):
+        """
+        Traite une liste de modèles élément par élément : les réponses en
+        cache sont réutilisées et seuls les autres modèles sont transmis à
+        l'étape, en un seul appel.
+        """
+        keys = [self.cache_key(model, data_type) for model in models]
+        results: List[Any] = [None] * len(models)
+        missing = []
+        for index, key in enumerate(keys):
+            cached = self._lookup(key)
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached[0]
+
+        result_type = getattr(models[0], "model_reponse", None)
+        if not missing:
+            return results, result_type
+
+        fetched, fetched_type = self.step.process(
+            [models[index] for index in missing], data_type
+        )
+        if fetched_type == "error":
+            if len(missing) == len(models):
+                return fetched, fetched_type
+            fetched = [{"error": fetched["error"]} for _ in missing]
+
+        for index, item in zip(missing, fetched):
+            results[index] = item
+            self._store(keys[index], item, result_type)
+
+        return results, result_type
@@ -7,20 +7,26 @@ legifrance et autres.
 @author: Raphaël d'Assignies
 """
 
+import atexit
 import logging
-from typing import List
+import threading
+from typing import Callable, List, Optional
 
 from dotenv import load_dotenv
 
 from pylegifrance.pipeline.pipeline import (
     Pipeline,
     PipelineStep,
+    CachedStep,
     CallApiStep,
     ExtractSearchResult,
     GetArticleId,
     GetTextId,
     Formatters,
+    PaginatedSearchStep,
+    StepMetrics,
 )
+from pylegifrance.cache import CacheBackend
 from pylegifrance.client import LegifranceClient
 from pylegifrance.config import ApiConfig
 from pylegifrance.models.search import (
@@ -42,6 +48,49 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+_shared_client: Optional[LegifranceClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> LegifranceClient:
+    """Renvoie le client partagé par les fonctions de recherche.
+
+    Le client est créé au premier appel à partir des variables d'environnement
+    (voir ApiConfig.from_env), puis réutilisé par tous les threads du processus :
+    la session HTTP, ses connexions et le jeton OAuth sont ainsi conservés
+    d'un appel à l'autre. Il est fermé à la sortie du programme.
+
+    Returns:
+        LegifranceClient: Le client partagé.
+
+    Raises:
+        ValueError: Si les identifiants de l'API ne sont pas définis.
+    """
+    global _shared_client
+
+    client = _shared_client
+    if client is not None:
+        return client
+
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = LegifranceClient(config=ApiConfig.from_env())
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Ferme le client partagé ; le prochain appel en créera un nouveau."""
+    global _shared_client
+
+    with _shared_client_lock:
+        client, _shared_client = _shared_client, None
+
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_shared_client)
+
 
 def recherche_code(
     code_name: str,
@@ -53,6 +102,13 @@ def recherche_code(
     page_number: int = 1,
     page_size: int = 10,
     *args,
+    max_workers: int = 1,
+    client: Optional[LegifranceClient] = None,
+    stream: bool = False,
+    on_step: Optional[Callable[[StepMetrics], None]] = None,
+    cache: Optional[CacheBackend] = None,
+    cache_ttl: Optional[float] = 3600.0,
+    all_pages: bool = False,
 ):
     """Recherche dans le fond CODE (CODE_DATE, CODE_ETAT) un article par son numéro,
     un terme de recherche ou un code dans son intégralité.
@@ -88,14 +144,45 @@ def recherche_code(
         page_number (int, optional): Numéro de la page de résultat. Par défaut à 1.
         page_size (int, optional): Nombre de résultats par page. Par défaut à 10 (max 100).
         *args: Arguments additionnels non implémentés pour le moment.
+        max_workers (int, optional): Nombre maximal d'articles ou de textes
+                               récupérés simultanément. Par défaut à 1.
+        client (LegifranceClient, optional): Client à utiliser. Par défaut, le
+                               client partagé du processus (get_shared_client).
+        stream (bool, optional): Si True, renvoie un itérateur qui produit chaque
+                               article ou texte dès sa récupération, au lieu
+                               d'une liste complète. Par défaut à False.
+        on_step (Callable[[StepMetrics], None], optional): Fonction appelée avec
+                               les mesures (durée, éléments, octets reçus,
+                               erreurs) de chaque étape du pipeline. Non prise
+                               en charge avec stream=True, dont les étapes
+                               s'exécutent de façon entrelacée.
+        cache (CacheBackend, optional): Cache des étapes d'appel à l'API (voir
+                               CachedStep), à partager entre les appels pour ne
+                               pas renvoyer les mêmes recherches et articles.
+        cache_ttl (float, optional): Durée de vie des entrées du cache, en
+                               secondes. Par défaut 3600 ; None : pas d'expiration.
+        all_pages (bool, optional): Si True, parcourt toutes les pages de résultats
+                               à partir de page_number (au plus max_workers pages
+                               demandées simultanément) et récupère chaque article
+                               ou texte une seule fois, au fil des pages. Les pages
+                               sont mémorisées dans `cache` s'il est fourni. Sans
+                               stream=True, tous les résultats sont réunis en
+                               mémoire ; avec stream=True, chaque page n'est
+                               demandée qu'au fil de la consommation.
 
     Returns:
         Dict: Soit un code en intégralité soit un ou plusieurs articles correspondant à la recherche.
+        Avec stream=True, un itérateur sur ces résultats.
+
+    Raises:
+        ValueError: Si on_step est fourni avec stream=True.
     """
+    if stream and on_step is not None:
+        raise ValueError("on_step n'est pas pris en charge avec stream=True")
 
-    # Initialisation du client (singleton)
-    config = ApiConfig.from_env()
-    client = LegifranceClient(config=config)
+    # Client fourni, sinon client partagé (singleton)
+    if client is None:
+        client = get_shared_client()
 
     # Création des critères de recherche et des champs de recherche
     if search:
@@ -146,27 +233,45 @@ def recherche_code(
         logger.debug(initial_data.model_dump(mode="json"))
     except Exception as e:
         logger.error(f"Error creating search request: {e}")
-        return {"error": str(e)}
+        error = {"error": str(e)}
+        return iter([error]) if stream else error
 
     # Initialisation des étapes du pipeline
-    pipeline_steps: List[PipelineStep] = [
-        CallApiStep(client),
-        ExtractSearchResult(),
-        GetArticleId(),
-        CallApiStep(client),
-    ]
-    # Sisearch=='' récupérer le textid à la place
-    if not search:
-        pipeline_steps[2] = GetTextId()
+    # Si search est vide, récupérer le textid à la place
+    id_step = GetArticleId() if search else GetTextId()
+
+    # Mémorise les appels à l'API si un cache est fourni
+    def api_step(max_workers: int = 1) -> PipelineStep:
+        step = CallApiStep(client, max_workers=max_workers)
+        return step if cache is None else CachedStep(step, cache, ttl=cache_ttl)
+
+    pipeline_steps: List[PipelineStep]
+    if all_pages:
+        pipeline_steps = [
+            PaginatedSearchStep(
+                client, id_step, max_workers=max_workers, search_step=api_step()
+            ),
+            api_step(max_workers),
+        ]
+    else:
+        pipeline_steps = [
+            api_step(),
+            ExtractSearchResult(),
+            id_step,
+            api_step(max_workers),
+        ]
 
     # Ajoute un formatter si demandé
     if formatter:
         pipeline_steps.append(Formatters())
 
     # Instanciation de Pipeline
-    pl = Pipeline(pipeline_steps)
+    pl = Pipeline(pipeline_steps, on_step=on_step)
 
     # Exécution du pipeline
+    if stream:
+        return pl.stream(data=initial_data)
+
     result = pl.execute(data=initial_data)
 
     return result
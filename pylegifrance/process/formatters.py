@@ -64,8 +64,12 @@ def formate_article_single(
         article_keys (Sequence[str]): Liste des clés à extraire
 
     Returns:
-        Dict[str, Any]: Article formaté avec les clés spécifiées
+        Dict[str, Any]: Article formaté avec les clés spécifiées, ou l'élément
+        inchangé s'il rapporte une erreur
     """
+    if "error" in item:
+        return item
+
     simplified_dict = {}
     article = item.get("article", {})
 
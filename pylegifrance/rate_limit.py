@@ -0,0 +1,132 @@
+"""Client-side rate limiting for the Legifrance API.
+
+PISTE enforces request quotas per application. This module provides a
+thread-safe token bucket that the clients use to pace their requests, so
+that parallel workloads run at the highest allowed throughput without
+tripping the quota.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+    second. Each request consumes one token. Reservations are first come,
+    first served: a caller that finds the bucket empty is told how long to
+    wait for its turn, and later callers queue behind it.
+
+    Attributes:
+        rate: Refill rate, in requests per second.
+        burst: Maximum number of requests that can be sent at once.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize a new TokenBucket.
+
+        Parameters
+        ----------
+        rate : float
+            Number of requests allowed per second.
+        burst : int, optional
+            Bucket capacity. Defaults to ``max(1, int(rate))``.
+
+        Raises
+        ------
+        ValueError
+            If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Reserve one request slot.
+
+        Returns
+        -------
+        float
+            Number of seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every request for at least the given number of seconds.
+
+        Used when the API reports that the quota was exceeded. Concurrent
+        pauses overlap rather than add up: the longest requested delay wins.
+
+        Parameters
+        ----------
+        seconds : float
+            Minimum delay before the next request.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value.
+
+    Parameters
+    ----------
+    value : str, optional
+        Either a number of seconds or an HTTP date.
+
+    Returns
+    -------
+    Optional[float]
+        The number of seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,171 @@
+"""Retry policy for Legifrance API data calls.
+
+Token acquisition has its own fixed retry (see AuthenticationManager). This
+module defines how data calls (``call_api``, ``get``) are retried on
+transient failures: exponential backoff with jitter, ``Retry-After`` support
+and limits that depend on whether the request can safely be replayed.
+"""
+
+import logging
+from typing import Callable, Tuple, Type
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from tenacity.wait import wait_base
+
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import LegifranceAPIError
+
+logger = logging.getLogger(__name__)
+
+# Transient gateway / quota errors worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Statuses meaning the request was not processed: safe to replay any request
+UNPROCESSED_STATUS_CODES = frozenset({429, 503})
+
+# Legifrance routes that only read data, although most are sent as POST
+IDEMPOTENT_ROUTE_PREFIXES = (
+    "consult/",
+    "search",
+    "list/",
+    "suggest",
+    "chrono/",
+    "misc/",
+)
+
+
+def is_idempotent_route(method: str, route: str) -> bool:
+    """
+    Tell whether a request can be replayed without side effects.
+
+    Parameters
+    ----------
+    method : str
+        The HTTP method.
+    route : str
+        The API route.
+
+    Returns
+    -------
+    bool
+        True for GET requests and read-only Legifrance routes.
+    """
+    return method.upper() == "GET" or route.lstrip("/").startswith(
+        IDEMPOTENT_ROUTE_PREFIXES
+    )
+
+
+class WaitRetryAfter(wait_base):
+    """Wait for the ``Retry-After`` delay of the last error, or fall back."""
+
+    def __init__(self, fallback: wait_base, max_wait: float):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.max_wait)
+        return self.fallback(retry_state)
+
+
+def _should_retry(
+    idempotent: bool,
+    connect_errors: Tuple[Type[BaseException], ...],
+    transport_errors: Tuple[Type[BaseException], ...],
+) -> Callable[[BaseException], bool]:
+    """Build the predicate deciding whether an exception is retried."""
+
+    def predicate(exc: BaseException) -> bool:
+        if isinstance(exc, LegifranceAPIError):
+            allowed = RETRYABLE_STATUS_CODES if idempotent else UNPROCESSED_STATUS_CODES
+            return exc.status_code in allowed
+        # The connection was never established: the server saw nothing
+        if isinstance(exc, connect_errors):
+            return True
+        # The request may have reached the server: replay only if idempotent
+        if isinstance(exc, transport_errors):
+            return idempotent
+        return False
+
+    return predicate
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    delay = retry_state.next_action.sleep if retry_state.next_action else 0
+    logger.warning(
+        f"API call failed ({exc}), retry {retry_state.attempt_number} in {delay:.2f}s."
+    )
+
+
+def _retry_kwargs(
+    config: ApiConfig,
+    idempotent: bool,
+    connect_errors: Tuple[Type[BaseException], ...],
+    transport_errors: Tuple[Type[BaseException], ...],
+) -> dict:
+    return dict(
+        stop=stop_after_attempt(config.max_retries + 1),
+        wait=WaitRetryAfter(
+            wait_exponential_jitter(
+                multiplier=config.retry_backoff_factor, max=config.retry_max_backoff
+            ),
+            max_wait=config.retry_max_backoff,
+        ),
+        retry=retry_if_exception(
+            _should_retry(idempotent, connect_errors, transport_errors)
+        ),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+
+
+def build_retrying(
+    config: ApiConfig,
+    idempotent: bool,
+    connect_errors: Tuple[Type[BaseException], ...],
+    transport_errors: Tuple[Type[BaseException], ...],
+) -> Retrying:
+    """
+    Build the tenacity controller for one synchronous API call.
+
+    Parameters
+    ----------
+    config : ApiConfig
+        Holds ``max_retries``, ``retry_backoff_factor`` and ``retry_max_backoff``.
+    idempotent : bool
+        Whether the request can be replayed safely.
+    connect_errors : tuple of exception types
+        Errors raised before the request reached the server.
+    transport_errors : tuple of exception types
+        Other network errors (read timeouts, dropped connections).
+
+    Returns
+    -------
+    Retrying
+        The retry controller.
+    """
+    return Retrying(
+        **_retry_kwargs(config, idempotent, connect_errors, transport_errors)
+    )
+
+
+def build_async_retrying(
+    config: ApiConfig,
+    idempotent: bool,
+    connect_errors: Tuple[Type[BaseException], ...],
+    transport_errors: Tuple[Type[BaseException], ...],
+) -> AsyncRetrying:
+    """Asynchronous counterpart of build_retrying."""
+    return AsyncRetrying(
+        **_retry_kwargs(config, idempotent, connect_errors, transport_errors)
+    )
@@ -0,0 +1,219 @@
+"""Shared storage for Legifrance API access tokens.
+
+This module provides pluggable token stores for the AuthenticationManager.
+A store lets several managers - in the same process or in different processes
+on the same host - reuse one valid access token instead of each requesting
+its own from the OAuth endpoint.
+"""
+
+import json
+import logging
+import os
+import stat
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from pylegifrance.auth import TokenInfo
+
+if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+    import msvcrt
+else:
+    import fcntl
+
+logger = logging.getLogger(__name__)
+
+
+class TokenStore:
+    """
+    Base class for token stores.
+
+    Subclasses implement ``load`` and ``save``. Stores shared between
+    processes should also override ``lock`` so that only one process fetches
+    a new token at a time.
+    """
+
+    def load(self, key: str) -> Optional[TokenInfo]:
+        """
+        Load the token stored under the given key.
+
+        Parameters
+        ----------
+        key : str
+            Identifies the credentials the token belongs to.
+
+        Returns
+        -------
+        Optional[TokenInfo]
+            The stored token, or None if there is none.
+        """
+        raise NotImplementedError
+
+    def save(self, key: str, token_info: TokenInfo) -> None:
+        """
+        Store a token under the given key.
+
+        Parameters
+        ----------
+        key : str
+            Identifies the credentials the token belongs to.
+        token_info : TokenInfo
+            The token to store.
+        """
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the given key while fetching a token.
+
+        The default implementation does not lock anything.
+        """
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    """
+    Thread-safe in-process token store.
+
+    Useful to share one token between several clients of the same process.
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, TokenInfo] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def load(self, key: str) -> Optional[TokenInfo]:
+        return self._tokens.get(key)
+
+    def save(self, key: str, token_info: TokenInfo) -> None:
+        self._tokens[key] = token_info
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with self._guard:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """
+    Token store backed by files in a local directory.
+
+    Each key is stored in its own JSON file, readable by the current user
+    only. An OS-level file lock serialises token fetches across processes, so
+    that all the workers of a host share one token until it expires.
+
+    Attributes:
+        directory: The directory holding the token files.
+    """
+
+    def __init__(self, directory: Optional[str | os.PathLike] = None):
+        """
+        Initialize a new FileTokenStore.
+
+        Parameters
+        ----------
+        directory : str or PathLike, optional
+            Directory for the token files. Defaults to ``pylegifrance`` in the
+            user's cache directory (``$XDG_CACHE_HOME``, or ``~/.cache``).
+
+        Raises
+        ------
+        PermissionError
+            If the directory already exists but belongs to another user or is
+            accessible to other users.
+        """
+        if directory is None:
+            directory = _default_cache_dir() / "pylegifrance"
+        self.directory = Path(directory)
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _check_private_directory(self.directory)
+        self._thread_lock = threading.Lock()
+
+    def _token_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Optional[TokenInfo]:
+        try:
+            with open(self._token_path(key), encoding="utf-8") as token_file:
+                return TokenInfo(**json.load(token_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning(f"Ignoring unreadable token cache file for {key}: {exc}")
+            return None
+
+    def save(self, key: str, token_info: TokenInfo) -> None:
+        path = self._token_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode passed to os.open is ignored if a stale file already exists
+        _make_private(fd)
+        with os.fdopen(fd, "w", encoding="utf-8") as token_file:
+            json.dump(asdict(token_info), token_file)
+        # Atomic replacement: readers never see a partially written file
+        os.replace(tmp_path, path)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        lock_path = self.directory / f"{key}.lock"
+        # Serialise the threads of this process before taking the OS-level lock
+        with self._thread_lock:
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                _lock_file(fd)
+                try:
+                    yield
+                finally:
+                    _unlock_file(fd)
+            finally:
+                os.close(fd)
+
+
+def _default_cache_dir() -> Path:
+    """Return the current user's cache directory."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+
+def _check_private_directory(directory: Path) -> None:
+    """Refuse a token directory that other local users could read or tamper with."""
+    if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+        return
+    info = directory.stat()
+    if info.st_uid != os.getuid():
+        raise PermissionError(
+            f"Token cache directory {directory} is not owned by the current user"
+        )
+    if stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(
+            f"Token cache directory {directory} is accessible to other users "
+            f"(mode {stat.S_IMODE(info.st_mode):o}); restrict it to 700"
+        )
+
+
+def _make_private(fd: int) -> None:
+    """Restrict an open file to the current user."""
+    if sys.platform != "win32":
+        os.fchmod(fd, 0o600)
+
+
+def _lock_file(fd: int) -> None:
+    """Block until an exclusive lock is held on the open file."""
+    if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_file(fd: int) -> None:
+    """Release a lock taken with _lock_file."""
+    if sys.platform == "win32":  # pragma: no cover - exercised on Windows only
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -6,9 +6,26 @@ This module provides utility functions used across the package.
 import json
 import enum
 import requests
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from types import ModuleType
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Tuple, TypeVar
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
 from pylegifrance.config import ApiConfig
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class EnumEncoder(json.JSONEncoder):
     """JSON encoder that can handle Enum objects and datetime objects."""
@@ -21,12 +38,98 @@ class EnumEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def dumps_json(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON in a single pass.
+
+    Enums and datetimes are handled like EnumEncoder. Uses ``orjson`` when
+    installed (``pylegifrance[speedups]``), the standard library otherwise.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize.
+    sort_keys : bool, optional
+        Sort dictionary keys, for a canonical output (default: False).
+
+    Returns
+    -------
+    bytes
+        The JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        cls=EnumEncoder,
+        sort_keys=sort_keys,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter applying default timeouts to every request it sends.
+
+    Attributes:
+        timeout: Default (connect, read) timeout, used when a request does not
+            set its own.
+    """
+
+    def __init__(self, timeout: Tuple[float, float], **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def configure_session(session: requests.Session, config: ApiConfig) -> None:
+    """
+    Configure connection pooling, keep-alive, compression and timeouts.
+
+    A TimeoutHTTPAdapter sized from the configuration is mounted for HTTP and
+    HTTPS, so that parallel callers reuse pooled connections instead of
+    opening and discarding them.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The session to configure.
+    config : ApiConfig
+        The configuration containing pool, compression and timeout values.
+    """
+    adapter = TimeoutHTTPAdapter(
+        timeout=(config.connect_timeout, config.read_timeout),
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if config.compression:
+        # gzip and deflate, plus br/zstd when their decoders are installed
+        session.headers.update(make_headers(accept_encoding=True))
+    else:
+        session.headers["Accept-Encoding"] = "identity"
+
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+
+
 def configure_session_timeouts(session: requests.Session, config: ApiConfig) -> None:
     """
     Configure default timeouts for all requests in a session.
 
-    This function wraps the original request method to include default timeouts
-    for all requests based on the provided configuration.
+    Kept for backward compatibility: use configure_session, which also sets
+    up connection pooling and compression.
 
     Parameters
     ----------
@@ -35,15 +138,164 @@ def configure_session_timeouts(session: requests.Session, config: ApiConfig) ->
     config : ApiConfig
         The configuration containing timeout values.
     """
-    # Store the original request method
-    original_request = session.request
+    configure_session(session, config)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Usage of one connection pool (one per host).
 
-    # Define a wrapper function that adds the timeout
-    def request_with_timeout(*args, **kwargs):
-        # Add default timeout if not provided
-        if "timeout" not in kwargs:
-            kwargs["timeout"] = (config.connect_timeout, config.read_timeout)
-        return original_request(*args, **kwargs)
+    Attributes:
+        host: The host the pool connects to.
+        maxsize: Number of connections kept open for reuse.
+        num_connections: Number of connections opened since the pool was
+            created. Well above ``maxsize`` means connections are being
+            discarded and reopened: the pool is too small.
+        num_requests: Number of requests sent through the pool.
+        idle_connections: Connections currently available for reuse.
+    """
+
+    host: str
+    maxsize: int
+    num_connections: int
+    num_requests: int
+    idle_connections: int
+
+
+def session_pool_stats(session: requests.Session) -> List[PoolStats]:
+    """
+    Report the usage of the connection pools of a session.
+
+    Parameters
+    ----------
+    session : requests.Session
+        The session to inspect.
+
+    Returns
+    -------
+    List[PoolStats]
+        One entry per host pool currently held by the session adapters.
+    """
+    stats = []
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            continue
+        for key in poolmanager.pools.keys():
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            # Free slots of the queue hold None until a connection is returned
+            queue = list(pool.pool.queue) if pool.pool is not None else []
+            stats.append(
+                PoolStats(
+                    host=f"{pool.scheme}://{pool.host}:{pool.port}",
+                    maxsize=len(queue),
+                    num_connections=pool.num_connections,
+                    num_requests=pool.num_requests,
+                    idle_connections=sum(conn is not None for conn in queue),
+                )
+            )
+    return stats
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = 1
+) -> List[R]:
+    """
+    Apply a function to every item, optionally through a bounded thread pool.
+
+    Results are returned in the same order as the input items. With
+    ``max_workers <= 1`` the items are processed serially in the calling thread.
+
+    Parameters
+    ----------
+    func : Callable[[T], R]
+        The function to apply to each item.
+    items : Iterable[T]
+        The items to process.
+    max_workers : int, optional
+        Maximum number of concurrent workers (default: 1).
 
-    # Replace the request method with our wrapper
-    session.request = request_with_timeout
+    Returns
+    -------
+    List[R]
+        The results, in input order.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def imap_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = 1
+) -> Iterator[R]:
+    """
+    Lazily apply a function to every item, through a bounded thread pool.
+
+    Like ``map_concurrently``, but results are yielded in input order as soon
+    as they are available, and at most ``max_workers`` items are in flight:
+    neither the items nor the results are all held in memory. With
+    ``max_workers <= 1`` the items are processed serially in the calling thread.
+
+    Parameters
+    ----------
+    func : Callable[[T], R]
+        The function to apply to each item.
+    items : Iterable[T]
+        The items to process; consumed as results are yielded.
+    max_workers : int, optional
+        Maximum number of concurrent workers (default: 1).
+
+    Yields
+    ------
+    R
+        The results, in input order.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending: Deque[Future] = deque(
+            executor.submit(func, item) for _, item in zip(range(max_workers), items)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def require_httpx() -> ModuleType:
+    """
+    Import the optional ``httpx`` dependency used by the asynchronous client.
+
+    Returns
+    -------
+    ModuleType
+        The ``httpx`` module.
+
+    Raises
+    ------
+    ImportError
+        If ``httpx`` is not installed.
+    """
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError(
+            "The asynchronous client requires httpx. "
+            "Install it with: pip install 'pylegifrance[async]'"
+        ) from exc
+    return httpx
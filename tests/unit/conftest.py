@@ -0,0 +1,130 @@
+"""Fixtures partagées par les tests unitaires : réponses et clients d'API factices."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+
+class SearchModel(BaseModel):
+    """Modèle minimal routé vers search, pour alimenter un pipeline."""
+
+    route: ClassVar[str] = "search"
+
+    query: str = "sûreté"
+
+
+def _api_response(payload, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def search_model():
+    """Requête de recherche factice (route search)."""
+    return SearchModel()
+
+
+@pytest.fixture
+def api_response():
+    """Construit une réponse HTTP factice dont le corps JSON est `payload`."""
+    return _api_response
+
+
+@pytest.fixture
+def make_client():
+    """
+    Construit un client d'API factice.
+
+    `respond(route, data)` renvoie le corps JSON de chaque appel. Le client
+    enregistre les appels dans `client.calls` (couples route, données),
+    attend `delay` secondes par appel, mesure le nombre d'appels simultanés
+    dans `client.in_flight["max"]` et échoue avec une erreur 503 pour les
+    identifiants (`id` ou `textId`) de `failing_ids`. Avec `is_async=True`,
+    `call_api` est une coroutine, comme pour un AsyncLegifranceClient.
+    """
+
+    def make(respond, failing_ids=(), delay=0.0, is_async=False):
+        client = MagicMock()
+        client.calls = []
+        client.in_flight = {"current": 0, "max": 0}
+        lock = threading.Lock()
+
+        def start(route, data):
+            with lock:
+                client.calls.append((route, data))
+                client.in_flight["current"] += 1
+                client.in_flight["max"] = max(
+                    client.in_flight["max"], client.in_flight["current"]
+                )
+
+        def finish():
+            with lock:
+                client.in_flight["current"] -= 1
+
+        def reply(route, data):
+            if data.get("id", data.get("textId")) in failing_ids:
+                raise Exception("API client error 503")
+            return _api_response(respond(route, data))
+
+        def call_api(route, data):
+            start(route, data)
+            try:
+                time.sleep(delay)
+                return reply(route, data)
+            finally:
+                finish()
+
+        async def async_call_api(route, data):
+            start(route, data)
+            try:
+                await asyncio.sleep(delay)
+                return reply(route, data)
+            finally:
+                finish()
+
+        client.call_api.side_effect = async_call_api if is_async else call_api
+        return client
+
+    return make
+
+
+@pytest.fixture
+def article_client(make_client):
+    """
+    Construit un client factice dont la recherche renvoie `article_ids`,
+    chaque article étant ensuite servi par consult/getArticle.
+    """
+
+    def make(article_ids=(), failing_ids=(), delay=0.0, is_async=False):
+        def respond(route, data):
+            if route == "search":
+                extracts = [{"id": article_id} for article_id in article_ids]
+                return {"results": [{"sections": [{"id": "S", "extracts": extracts}]}]}
+            return {"article": {"id": data["id"], "cid": data["id"]}}
+
+        return make_client(respond, failing_ids, delay, is_async)
+
+    return make
+
+
+@pytest.fixture
+def requested_pages():
+    """Renvoie les numéros des pages de recherche demandées à un client factice."""
+
+    def pages(client):
+        return [
+            data["recherche"]["pageNumber"]
+            for route, data in client.calls
+            if route == "search"
+        ]
+
+    return pages
@@ -0,0 +1,115 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.fonds.citation_graph import CitationGraph
+from pylegifrance.fonds.juri import JuriDecision
+from pylegifrance.models.juri.models import Decision
+
+# A -> B, C ; B -> C, D ; C -> A, E ; D -> F ; E -> (fails)
+NETWORK = {
+    "A": ["B", "C"],
+    "B": ["C", "D"],
+    "C": ["A", "E"],
+    "D": ["F"],
+    "F": [],
+}
+
+
+def _decision(text_id, cited_ids, client=None):
+    liens = [{"typeLien": "CITATION", "cidTexte": cid} for cid in cited_ids]
+    return JuriDecision(
+        Decision.model_validate({"id": text_id, "liens": liens}),
+        client or MagicMock(),
+    )
+
+
+def _make_api(delay=0.0):
+    """Mock JuriAPI serving NETWORK, counting fetches and concurrency."""
+    api = MagicMock()
+    calls = []
+    in_flight = {"current": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fetch(text_id):
+        with lock:
+            calls.append(text_id)
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        try:
+            time.sleep(delay)
+            if text_id not in NETWORK:
+                raise Exception("API client error 503")
+            return _decision(text_id, NETWORK[text_id])
+        finally:
+            with lock:
+                in_flight["current"] -= 1
+
+    api.fetch.side_effect = fetch
+    return api, calls, in_flight
+
+
+def test_crawl_is_breadth_first_and_deduplicated():
+    """Each decision is fetched once and nodes are numbered by depth."""
+    api, calls, _ = _make_api()
+
+    graph = CitationGraph(api, max_depth=3).crawl("A")
+
+    assert graph.nodes == ["A", "B", "C", "D", "E", "F"]
+    assert sorted(calls) == ["A", "B", "C", "D", "E"]
+    assert graph.successors("C") == ["A", "E"]
+    assert ("B", "D") in set(graph.edges())
+    assert graph.edge_count == 7
+    assert [graph.depth(node) for node in graph.nodes] == [0, 1, 1, 2, 2, 3]
+    assert "503" in graph.errors["E"]
+    assert graph.is_complete
+
+
+def test_depth_node_budget_and_concurrency_limits():
+    """Links are followed up to max_depth, within max_nodes and max_workers."""
+    api, calls, in_flight = _make_api(delay=0.05)
+
+    graph = CitationGraph(api, max_depth=1, max_workers=2).crawl(
+        _decision("A", NETWORK["A"])
+    )
+    assert graph.nodes == ["A", "B", "C"]
+    assert calls == []
+
+    graph = CitationGraph(api, max_depth=3, max_nodes=4, max_workers=2).crawl("A")
+    assert graph.nodes == ["A", "B", "C", "D"]
+    assert graph.truncated
+    assert in_flight["max"] == 2
+
+
+def test_checkpoint_and_resume(tmp_path):
+    """An interrupted crawl resumes from its checkpoint without refetching."""
+    path = tmp_path / "graph.json"
+    api, calls, _ = _make_api()
+    api.fetch.side_effect = [
+        _decision("A", NETWORK["A"]),
+        KeyboardInterrupt(),
+    ]
+
+    with pytest.raises(KeyboardInterrupt):
+        CitationGraph(api, max_depth=3, max_workers=1).crawl("A", checkpoint_path=path)
+
+    api, calls, _ = _make_api()
+    graph = CitationGraph.load(path, api)
+    assert graph.nodes == ["A", "B", "C"]
+    assert not graph.is_complete
+
+    graph.crawl()
+
+    assert "A" not in calls
+    assert graph.nodes == ["A", "B", "C", "D", "E", "F"]
+    assert graph.edge_count == 7
+
+
+def test_invalid_limits_raise_error():
+    """Invalid crawl limits are rejected."""
+    with pytest.raises(ValueError):
+        CitationGraph(MagicMock(), max_workers=0)
+    with pytest.raises(ValueError):
+        CitationGraph(MagicMock()).crawl()
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.fonds.juri import JuriDecision
+from pylegifrance.models.juri.models import Decision
+
+
+def _decision(cited_ids, client):
+    liens = [
+        {"typeLien": "CITATION", "cidTexte": cid, "id": f"lien-{index}"}
+        for index, cid in enumerate(cited_ids)
+    ]
+    liens.append({"typeLien": "AUTRE", "cidTexte": "JURITEXT000000000099"})
+    return JuriDecision(
+        Decision.model_validate({"id": "JURITEXT000000000000", "liens": liens}),
+        client,
+    )
+
+
+def _consult_juri(route, data):
+    return {"text": {"id": data["textId"], "liens": []}}
+
+
+def test_citations_are_fetched_concurrently_and_deduplicated(make_client):
+    """Each cited text is fetched once, concurrently, in link order."""
+    cited = [f"JURITEXT{i:012d}" for i in range(1, 7)]
+    client = make_client(_consult_juri, delay=0.05)
+    decision = _decision(cited + cited[:2], client)
+
+    citations = decision.citations(max_workers=4)
+
+    assert [citation.id for citation in citations] == cited
+    assert sorted(data["textId"] for _, data in client.calls) == cited
+    assert 1 < client.in_flight["max"] <= 4
+
+
+def test_resolve_citations_keeps_failures(make_client):
+    """Unresolved citations are returned with their error instead of dropped."""
+    client = make_client(_consult_juri, failing_ids={"JURITEXT000000000002"})
+    decision = _decision(["JURITEXT000000000001", "JURITEXT000000000002"], client)
+
+    first, second = decision.resolve_citations(max_workers=2)
+
+    assert first.resolved and first.error is None
+    assert not second.resolved
+    assert second.lien.cid_texte == "JURITEXT000000000002"
+    assert "503" in str(second.error)
+    assert [c.id for c in decision.citations()] == ["JURITEXT000000000001"]
+
+
+def test_invalid_max_workers_raises_error():
+    """A worker count below 1 is rejected."""
+    with pytest.raises(ValueError):
+        _decision([], MagicMock()).resolve_citations(max_workers=0)
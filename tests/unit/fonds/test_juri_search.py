@@ -0,0 +1,144 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.models.juri.search import SearchRequest
+
+
+def _serve_hits(text_ids):
+    """Serves one search page of `text_ids` then one consult call per hit."""
+
+    def respond(route, data):
+        if route == "search":
+            return {"results": [{"titles": [{"id": text_id}]} for text_id in text_ids]}
+        return {"text": {"id": data["textId"], "liens": []}}
+
+    return respond
+
+
+def test_search_fetches_hits_in_parallel_and_keeps_order(make_client):
+    """Hits are fetched concurrently and returned in search order."""
+    text_ids = [f"JURITEXT{i:012d}" for i in range(8)]
+    client = make_client(_serve_hits(text_ids), delay=0.05)
+
+    results = JuriAPI(client, max_workers=4).search("responsabilité")
+
+    assert [decision.id for decision in results] == text_ids
+    assert 1 < client.in_flight["max"] <= 4
+
+
+def test_search_isolates_failing_hits(make_client):
+    """A failing hit is skipped without aborting the other fetches."""
+    text_ids = ["JURITEXT000000000001", "JURITEXT000000000002", "JURITEXT000000000003"]
+    client = make_client(_serve_hits(text_ids), failing_ids={"JURITEXT000000000001"})
+
+    results = JuriAPI(client, max_workers=2).search("responsabilité")
+
+    assert [decision.id for decision in results] == [
+        "JURITEXT000000000002",
+        "JURITEXT000000000003",
+    ]
+
+
+def test_invalid_max_workers_raises_error():
+    """A worker count below 1 is rejected."""
+    with pytest.raises(ValueError):
+        JuriAPI(MagicMock(), max_workers=0)
+
+
+def test_search_hits_returns_hits_without_fetching(api_response):
+    """search_hits makes a single call and exposes the search fields."""
+    client = MagicMock()
+    client.call_api.return_value = api_response(
+        {
+            "results": [
+                {
+                    "titles": [{"id": "JURITEXT000000000001", "title": "Cass. civ."}],
+                    "date": "2024-03-14T00:00:00",
+                    "sections": [{"extracts": [{"values": ["<mark>bail</mark>"]}]}],
+                },
+                {"titles": []},
+            ]
+        }
+    )
+
+    [hit] = JuriAPI(client).search_hits("bail")
+
+    assert client.call_api.call_count == 1
+    assert hit.id == "JURITEXT000000000001"
+    assert hit.title == "Cass. civ."
+    assert hit.date is not None and hit.date.year == 2024
+    assert hit.extracts == ["<mark>bail</mark>"]
+
+
+def test_search_hit_hydrates_once(make_client):
+    """hydrate() fetches the full decision on demand, then reuses it."""
+    client = make_client(_serve_hits(["JURITEXT000000000001"]))
+    [hit] = JuriAPI(client).search_hits("bail")
+
+    decision = hit.hydrate()
+
+    assert decision is not None and decision.id == "JURITEXT000000000001"
+    assert hit.hydrate() is decision
+    assert client.call_api.call_count == 2
+
+
+def _serve_pages(total, page_size):
+    """Serves `total` hits in pages of `page_size`."""
+
+    def respond(route, data):
+        if route != "search":
+            return {"text": {"id": data["textId"], "liens": []}}
+        start = (data["recherche"]["pageNumber"] - 1) * page_size
+        return {
+            "totalResultNumber": total,
+            "results": [
+                {"titles": [{"id": f"JURITEXT{i:012d}"}]}
+                for i in range(start, min(start + page_size, total))
+            ],
+        }
+
+    return respond
+
+
+def test_fetch_all_merges_every_page_in_order(make_client, requested_pages):
+    """fetch_all fetches the remaining pages concurrently and keeps the order."""
+    client = make_client(_serve_pages(total=23, page_size=5), delay=0.05)
+
+    results = JuriAPI(client, max_workers=4).search(
+        SearchRequest(search="bail", page_size=5, fetch_all=True)
+    )
+
+    assert [decision.id for decision in results] == [
+        f"JURITEXT{i:012d}" for i in range(23)
+    ]
+    assert sorted(requested_pages(client)) == [1, 2, 3, 4, 5]
+    assert client.in_flight["max"] > 1
+
+
+def test_without_fetch_all_only_the_requested_page_is_fetched(
+    make_client, requested_pages
+):
+    """Without fetch_all, search keeps returning a single page."""
+    client = make_client(_serve_pages(total=23, page_size=5))
+
+    results = JuriAPI(client).search(SearchRequest(search="bail", page_size=5))
+
+    assert len(results) == 5
+    assert requested_pages(client) == [1]
+
+
+def test_iter_search_streams_decisions_page_by_page(make_client, requested_pages):
+    """iter_search yields the first decisions before fetching every page."""
+    client = make_client(_serve_pages(total=50, page_size=5))
+    iterator = JuriAPI(client).iter_search(SearchRequest(search="bail", page_size=5))
+
+    first = next(iterator)
+    time.sleep(0.05)
+
+    assert first.id == "JURITEXT000000000000"
+    assert requested_pages(client) == [1, 2]
+    assert [decision.id for decision in iterator][-1] == "JURITEXT000000000049"
+    assert requested_pages(client) == list(range(1, 11))
@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.fonds.loda import Loda
+from pylegifrance.models.loda.search import SearchRequest
+
+
+def _search_payload(text_ids):
+    return {
+        "results": [
+            {"titles": [{"id": text_id, "title": f"Titre {text_id}"}]}
+            for text_id in text_ids
+        ]
+    }
+
+
+def _serve_texts(text_ids):
+    """Sert une page de recherche de `text_ids` puis une consultation par hit."""
+
+    def respond(route, data):
+        if route == "search":
+            return _search_payload(text_ids)
+        return {"id": data["textId"], "title": f"Titre {data['textId']}"}
+
+    return respond
+
+
+def test_search_hydrates_hits_in_parallel_and_keeps_order(make_client):
+    """Les hits sont consultés en parallèle et restent dans l'ordre de la recherche."""
+    text_ids = [f"LEGITEXT{i:012d}" for i in range(8)]
+    client = make_client(_serve_texts(text_ids), delay=0.05)
+
+    results = Loda(client, max_workers=4).search("télétravail")
+
+    assert [texte.id for texte in results] == text_ids
+    assert 1 < client.in_flight["max"] <= 4
+
+
+def test_search_isolates_failing_hits(make_client):
+    """Un hit en échec est ignoré sans interrompre les autres consultations."""
+    text_ids = ["LEGITEXT000000000001", "LEGITEXT000000000002", "LEGITEXT000000000003"]
+    client = make_client(_serve_texts(text_ids), failing_ids={"LEGITEXT000000000002"})
+
+    results = Loda(client, max_workers=3).search("télétravail")
+
+    assert [texte.id for texte in results] == [
+        "LEGITEXT000000000001",
+        "LEGITEXT000000000003",
+    ]
+
+
+def test_invalid_max_workers_raises_error():
+    """Un nombre de workers inférieur à 1 est refusé."""
+    with pytest.raises(ValueError):
+        Loda(MagicMock(), max_workers=0)
+
+
+def test_consult_content_is_validated_in_a_single_pass():
+    """Le contenu brut donne le même texte que le chemin par dictionnaire."""
+    payload = {
+        "id": "LEGITEXT000000000001",
+        "title": "Loi",
+        "sections": [{"id": "LEGISCTA000000000001", "articles": [{"num": "1"}]}],
+    }
+    loda = Loda(MagicMock())
+
+    from_content = loda._process_consult_content(json.dumps(payload).encode())
+    from_dict = loda._process_consult_response(payload)
+
+    assert from_content is not None and from_dict is not None
+    assert from_content.consult_response == from_dict.consult_response
+    assert from_content.sections[0].articles[0].num == "1"
+
+
+def test_consult_content_keeps_wrapper_fields():
+    """Les deux chemins donnent le même modèle, champs du wrapper compris."""
+    payload = {
+        "id": "LEGITEXT000000000001",
+        "title": "Loi",
+        "dateDebutVersion": "2024-01-01",
+        "texte_html": "<p>Loi</p>",
+        "titre_long": "Loi relative au télétravail",
+        "last_update": "2024-01-01",
+    }
+    loda = Loda(MagicMock())
+
+    from_content = loda._process_consult_content(json.dumps(payload).encode())
+    from_dict = loda._process_consult_response(payload)
+
+    assert from_content == from_dict
+    assert from_content.texte_html == "<p>Loi</p>"
+    assert from_content.titre_long == "Loi relative au télétravail"
+    assert from_content.last_update == "2024-01-01"
+    assert from_content.date_debut == "2024-01-01"
+
+
+def test_consult_content_without_id_is_rejected():
+    """Un contenu sans id de premier niveau ne donne aucun texte."""
+    assert Loda(MagicMock())._process_consult_content(b'{"texte": {}}') is None
+
+
+def _consult_calls(client):
+    return [c for c in client.call_api.call_args_list if c.args[0] != "search"]
+
+
+def test_lazy_search_does_not_consult_texts(make_client):
+    """En mode lazy, seuls les champs du résultat de recherche sont renvoyés."""
+    text_ids = ["LEGITEXT000000000001", "LEGITEXT000000000002"]
+    client = make_client(_serve_texts(text_ids))
+
+    results = Loda(client).search("télétravail", lazy=True)
+
+    assert [texte.id for texte in results] == text_ids
+    assert [texte.titre for texte in results] == [f"Titre {i}" for i in text_ids]
+    assert not any(texte.is_hydrated for texte in results)
+    assert _consult_calls(client) == []
+
+
+def test_lazy_text_is_consulted_once_on_first_full_access(make_client):
+    """Le texte est consulté une seule fois, même en accès concurrent."""
+    client = make_client(_serve_texts(["LEGITEXT000000000001"]), delay=0.05)
+    [texte] = Loda(client).search("télétravail", lazy=True)
+
+    threads = [threading.Thread(target=lambda: texte.sections) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert texte.is_hydrated
+    assert len(_consult_calls(client)) == 1
+    assert texte.to_dict() == Loda(client).fetch("LEGITEXT000000000001").to_dict()
+
+
+def _serve_pages(total, page_size):
+    """Sert `total` résultats par pages de `page_size`."""
+
+    def respond(route, data):
+        if route != "search":
+            return {"id": data["textId"], "title": "Titre"}
+        start = (data["recherche"]["pageNumber"] - 1) * page_size
+        text_ids = [
+            f"LEGITEXT{i:012d}" for i in range(start, min(start + page_size, total))
+        ]
+        payload = _search_payload(text_ids)
+        payload["totalResultNumber"] = total
+        return payload
+
+    return respond
+
+
+def test_iter_search_walks_every_page(make_client, requested_pages):
+    """iter_search parcourt toutes les pages jusqu'à totalResultNumber."""
+    client = make_client(_serve_pages(total=25, page_size=10))
+
+    textes = list(
+        Loda(client).iter_search(
+            SearchRequest(search="travail", page_size=10), lazy=True
+        )
+    )
+
+    assert [texte.id for texte in textes] == [f"LEGITEXT{i:012d}" for i in range(25)]
+    assert requested_pages(client) == [1, 2, 3]
+
+
+def test_iter_search_prefetches_only_the_next_page(make_client, requested_pages):
+    """La page suivante est préchargée pendant la consommation, sans aller au-delà."""
+    client = make_client(_serve_pages(total=50, page_size=10))
+    iterator = Loda(client).iter_search(
+        SearchRequest(search="travail", page_size=10), lazy=True
+    )
+
+    next(iterator)
+    time.sleep(0.05)
+
+    assert requested_pages(client) == [1, 2]
+    iterator.close()
@@ -0,0 +1,128 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from pylegifrance.client import AsyncLegifranceClient  # noqa: E402
+from pylegifrance.config import ApiConfig  # noqa: E402
+from pylegifrance.fonds.juri import AsyncJuriAPI  # noqa: E402
+from pylegifrance.fonds.loda import AsyncLoda  # noqa: E402
+
+
+def _make_client(handler):
+    """Build an async client whose HTTP traffic goes through a mock transport."""
+    calls = {"token": 0}
+
+    def token_handler(request):
+        calls["token"] += 1
+        return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+
+    client = AsyncLegifranceClient(
+        ApiConfig(client_id="test_client_id", client_secret="test_client_secret")
+    )
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client._auth_manager._session = httpx.AsyncClient(
+        transport=httpx.MockTransport(token_handler)
+    )
+    return client, calls
+
+
+def test_call_api_shares_a_single_token_request():
+    """Concurrent calls wait for one token request instead of each fetching one."""
+
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(200, json={"ok": True})
+
+    async def scenario():
+        client, calls = _make_client(handler)
+        async with client:
+            responses = await asyncio.gather(
+                *(client.call_api("consult/juri", {"textId": str(i)}) for i in range(5))
+            )
+        return responses, calls
+
+    responses, calls = asyncio.run(scenario())
+
+    assert [response.json() for response in responses] == [{"ok": True}] * 5
+    assert calls["token"] == 1
+
+
+@pytest.mark.filterwarnings("error:Use 'content=:DeprecationWarning")
+def test_call_api_sends_the_body_as_raw_content():
+    """The JSON body is sent as raw content, without httpx's deprecated data=bytes."""
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    async def scenario():
+        client, _ = _make_client(handler)
+        async with client:
+            await client.call_api("consult/juri", {"textId": "1"})
+
+    asyncio.run(scenario())
+
+    assert bodies == [{"textId": "1"}]
+
+
+def test_call_api_raises_on_error_status():
+    """An error status is surfaced as an exception, like the sync client."""
+
+    def handler(request):
+        return httpx.Response(500, text="boom")
+
+    async def scenario():
+        client, _ = _make_client(handler)
+        async with client:
+            await client.call_api("consult/juri", {"textId": "1"})
+
+    with pytest.raises(Exception, match="API client error 500"):
+        asyncio.run(scenario())
+
+
+def test_async_juri_search_hydrates_hits_in_order():
+    """AsyncJuriAPI.search fetches every hit and keeps the search order."""
+    text_ids = [f"JURITEXT{i:012d}" for i in range(6)]
+
+    def handler(request):
+        if request.url.path.endswith("/search"):
+            return httpx.Response(
+                200,
+                json={
+                    "results": [{"titles": [{"id": text_id}]} for text_id in text_ids]
+                },
+            )
+        text_id = json.loads(request.content)["textId"]
+        return httpx.Response(200, json={"text": {"id": text_id, "liens": []}})
+
+    async def scenario():
+        client, _ = _make_client(handler)
+        async with client:
+            return await AsyncJuriAPI(client, max_concurrency=3).search("contrat")
+
+    results = asyncio.run(scenario())
+
+    assert [decision.id for decision in results] == text_ids
+
+
+def test_async_loda_fetch_returns_texte_without_sync_navigation():
+    """Texts fetched asynchronously refuse the sync navigation helpers."""
+
+    def handler(request):
+        return httpx.Response(200, json={"id": "LEGITEXT000000000001", "title": "Loi"})
+
+    async def scenario():
+        client, _ = _make_client(handler)
+        async with client:
+            return await AsyncLoda(client).fetch("LEGITEXT000000000001")
+
+    texte = asyncio.run(scenario())
+
+    assert texte is not None
+    assert texte.titre == "Loi"
+    with pytest.raises(TypeError):
+        texte.versions()
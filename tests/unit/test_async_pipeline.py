@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+from pylegifrance.pipeline.async_pipeline import (
+    AsyncCallApiStep,
+    AsyncPipeline,
+    SyncStepAdapter,
+)
+from pylegifrance.pipeline.pipeline import (
+    CachedStep,
+    CallApiStep,
+    ExtractSearchResult,
+    Formatters,
+    GetArticleId,
+)
+
+ARTICLE_IDS = [f"LEGIARTI{i:012d}" for i in range(6)]
+
+
+def test_async_pipeline_fans_out_and_adapts_sync_steps(article_client, search_model):
+    """Les articles sont récupérés simultanément ; les étapes synchrones sont adaptées."""
+    client = article_client(
+        ARTICLE_IDS, failing_ids={ARTICLE_IDS[2]}, delay=0.02, is_async=True
+    )
+    pipeline = AsyncPipeline(
+        [
+            AsyncCallApiStep(client),
+            ExtractSearchResult(),
+            GetArticleId(),
+            AsyncCallApiStep(client, max_concurrency=3),
+            Formatters(),
+        ]
+    )
+
+    articles = asyncio.run(pipeline.execute(search_model))
+
+    assert [a.get("cid") for a in articles] == [
+        None if i == 2 else article_id for i, article_id in enumerate(ARTICLE_IDS)
+    ]
+    assert "503" in articles[2]["error"]
+    assert client.in_flight["max"] == 3
+    assert isinstance(pipeline.steps[1], SyncStepAdapter)
+    fetch = pipeline.last_report.steps[3]
+    assert fetch.name == "AsyncCallApiStep" and fetch.errors == 1
+    assert pipeline.last_report.steps[4].name == "Formatters"
+
+
+def test_all_calls_failing_stops_the_pipeline(article_client, search_model):
+    """Si tous les appels échouent, le pipeline renvoie l'erreur."""
+    client = article_client(ARTICLE_IDS, failing_ids=set(ARTICLE_IDS), is_async=True)
+    pipeline = AsyncPipeline(
+        [
+            AsyncCallApiStep(client),
+            ExtractSearchResult(),
+            GetArticleId(),
+            AsyncCallApiStep(client),
+            Formatters(),
+        ]
+    )
+
+    result = asyncio.run(pipeline.execute(search_model))
+
+    assert "503" in result["error"]
+    assert len(pipeline.last_report.steps) == 4
+
+
+def test_error_items_pass_through(make_client, search_model):
+    """Les erreurs émises plus haut dans une liste sont transmises, pas rejetées."""
+    client = make_client(lambda route, data: {"results": []}, is_async=True)
+    failed_page = {"error": "page 2 : API client error 503"}
+
+    responses, data_type = asyncio.run(
+        AsyncCallApiStep(client).process([search_model, failed_page, search_model])
+    )
+
+    assert responses == [{"results": []}, failed_page, {"results": []}]
+    assert data_type is None
+    assert len(client.calls) == 2
+
+
+def test_cached_sync_call_runs_in_a_thread(make_client, search_model):
+    """Un CallApiStep synchrone sous un CachedStep ne bloque pas la boucle."""
+    threads = []
+
+    def respond(route, data):
+        threads.append(threading.current_thread())
+        return {"results": []}
+
+    client = make_client(respond)
+    pipeline = AsyncPipeline([CachedStep(CallApiStep(client))])
+
+    async def run():
+        return await pipeline.execute(search_model), threading.current_thread()
+
+    result, loop_thread = asyncio.run(run())
+
+    assert result == {"results": []}
+    assert pipeline.steps[0].in_thread
+    assert threads and threads[0] is not loop_thread
@@ -0,0 +1,154 @@
+import os
+import threading
+import time
+
+import pytest
+
+from pylegifrance.auth import AuthenticationManager, TokenInfo
+from pylegifrance.config import ApiConfig
+from pylegifrance.token_store import FileTokenStore
+
+
+class _CountingManager(AuthenticationManager):
+    """AuthenticationManager whose token endpoint is replaced by a slow counter."""
+
+    def __init__(
+        self,
+        config: ApiConfig,
+        delay: float = 0.0,
+        expires_in: int = 3600,
+        token_store=None,
+    ):
+        super().__init__(config, token_store=token_store)
+        self.fetch_count = 0
+        self._delay = delay
+        self._expires_in = expires_in
+        self._count_lock = threading.Lock()
+
+    def _fetch_new_token(self) -> TokenInfo:
+        with self._count_lock:
+            self.fetch_count += 1
+            count = self.fetch_count
+        time.sleep(self._delay)
+        return TokenInfo(
+            access_token=f"token-{count}",
+            issued_at=time.time(),
+            expires_in=self._expires_in,
+        )
+
+
+def _config(**kwargs) -> ApiConfig:
+    return ApiConfig(
+        client_id="test_client_id", client_secret="test_client_secret", **kwargs
+    )
+
+
+def test_expires_within_margin():
+    """A token is due for refresh once it enters the refresh margin."""
+    token = TokenInfo(
+        access_token="token", issued_at=time.time() - 3500, expires_in=3600
+    )
+
+    assert token.is_valid
+    assert token.expires_within(120)
+    assert not token.expires_within(60)
+    assert TokenInfo(access_token="", issued_at=0, expires_in=0).expires_within(0)
+
+
+def test_concurrent_callers_share_a_single_refresh():
+    """Threads hitting an expired token wait for one fetch instead of each fetching."""
+    manager = _CountingManager(_config(), delay=0.1)
+    tokens = []
+
+    def worker():
+        tokens.append(manager.ensure_valid_token())
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert manager.fetch_count == 1
+    assert tokens == ["token-1"] * 10
+
+
+def test_token_close_to_expiry_is_refreshed_in_background():
+    """A token inside the margin is returned immediately and refreshed behind the scenes."""
+    manager = _CountingManager(_config(token_refresh_margin=120), delay=0.1)
+    manager._token_info = TokenInfo(
+        access_token="old-token", issued_at=time.time() - 3500, expires_in=3600
+    )
+
+    started = time.perf_counter()
+    assert manager.ensure_valid_token() == "old-token"
+    assert time.perf_counter() - started < 0.1
+
+    # Waiting on the refresh lock means the background refresh has completed
+    with manager._refresh_lock:
+        pass
+
+    assert manager.fetch_count == 1
+    assert manager.ensure_valid_token() == "token-1"
+
+
+def test_file_token_store_shares_token_between_managers(tmp_path):
+    """Managers sharing a FileTokenStore reuse the stored token instead of fetching."""
+    store = FileTokenStore(tmp_path)
+    first = _CountingManager(_config(), token_store=store)
+    second = _CountingManager(_config(), token_store=store)
+
+    assert first.ensure_valid_token() == "token-1"
+    assert second.ensure_valid_token() == "token-1"
+    assert second.fetch_count == 0
+
+    key = first._store_key()
+    assert store.load(key) == first._token_info
+    assert (tmp_path / f"{key}.json").stat().st_mode & 0o777 == 0o600
+
+
+def test_expired_stored_token_is_replaced(tmp_path):
+    """A stored token that is about to expire is not reused."""
+    store = FileTokenStore(tmp_path)
+    manager = _CountingManager(_config(), token_store=store)
+    store.save(
+        manager._store_key(),
+        TokenInfo(access_token="stale", issued_at=time.time() - 3590, expires_in=3600),
+    )
+
+    assert manager.ensure_valid_token() == "token-1"
+    assert store.load(manager._store_key()).access_token == "token-1"
+
+
+def test_file_token_store_defaults_to_a_private_user_directory(tmp_path, monkeypatch):
+    """Without a directory, tokens go to a 700 folder in the user's cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    store = FileTokenStore()
+
+    assert store.directory == tmp_path / "cache" / "pylegifrance"
+    assert store.directory.stat().st_mode & 0o777 == 0o700
+
+
+def test_file_token_store_rejects_a_shared_directory(tmp_path):
+    """An existing directory open to other users is refused."""
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    os.chmod(shared, 0o777)
+
+    with pytest.raises(PermissionError, match="other users"):
+        FileTokenStore(shared)
+
+
+def test_saved_token_file_is_private_even_over_a_stale_file(tmp_path):
+    """A leftover temporary file does not keep its permissive mode."""
+    store = FileTokenStore(tmp_path)
+    stale = tmp_path / f"key.{os.getpid()}.tmp"
+    stale.write_text("{}")
+    os.chmod(stale, 0o644)
+
+    store.save(
+        "key", TokenInfo(access_token="t", issued_at=time.time(), expires_in=3600)
+    )
+
+    assert (tmp_path / "key.json").stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,122 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.cache import (
+    DirectoryCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+
+
+def _response(content=b'{"id": "JURITEXT000000000001"}', status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture(params=["memory", "sqlite", "directory"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCacheBackend(max_entries=2)
+    if request.param == "sqlite":
+        return SQLiteCacheBackend(tmp_path / "cache.db", max_entries=2)
+    return DirectoryCacheBackend(tmp_path / "cache", max_entries=2)
+
+
+def test_backend_evicts_least_recently_used(backend):
+    """Reading an entry keeps it; the oldest untouched entry is evicted."""
+    backend.set("a", b"1")
+    time.sleep(0.01)
+    backend.set("b", b"2")
+    time.sleep(0.01)
+    assert backend.get("a") == b"1"
+    time.sleep(0.01)
+    backend.set("c", b"3")
+
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_backend_expires_entries(backend):
+    """Entries are dropped once their TTL has elapsed."""
+    backend.set("a", b"1", ttl=0.05)
+    assert backend.get("a") == b"1"
+
+    time.sleep(0.1)
+
+    assert backend.get("a") is None
+
+
+def test_key_ignores_payload_key_order():
+    """Payloads that only differ by key order share a cache entry."""
+    assert ResponseCache.make_key("consult/juri", {"a": 1, "b": 2}) == (
+        ResponseCache.make_key("consult/juri", {"b": 2, "a": 1})
+    )
+    assert ResponseCache.make_key("consult/juri", {"a": 1}) != (
+        ResponseCache.make_key("consult/getArticle", {"a": 1})
+    )
+
+
+def test_route_ttls_use_longest_prefix():
+    """The most specific route prefix decides the TTL."""
+    cache = ResponseCache(
+        default_ttl=60, route_ttls={"consult/": None, "consult/juri": 0}
+    )
+
+    assert cache.ttl_for("search") == 60
+    assert cache.ttl_for("consult/getArticle") is None
+    assert cache.ttl_for("consult/juri") == 0
+
+
+def test_response_round_trip_and_stats():
+    """A cached response is rebuilt intact and counted as a hit."""
+    cache = ResponseCache()
+    payload = {"textId": "JURITEXT000000000001"}
+
+    assert cache.get("consult/juri", payload) is None
+    cache.set("consult/juri", payload, _response())
+    cached = cache.get("consult/juri", payload)
+
+    assert cached is not None
+    assert cached.status_code == 200
+    assert cached.json() == {"id": "JURITEXT000000000001"}
+    assert cached.headers["content-type"] == "application/json"
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 1
+    assert cache.stats().hit_rate == 0.5
+
+
+def test_error_responses_are_not_cached():
+    """Only successful responses are stored."""
+    cache = ResponseCache()
+    cache.set("consult/juri", {}, _response(b"boom", status_code=500))
+
+    assert cache.get("consult/juri", {}) is None
+
+
+def test_client_serves_repeated_calls_from_cache():
+    """A repeated read-only call does not reach the network."""
+    client = LegifranceClient(
+        ApiConfig(client_id="test_client_id", client_secret="test_client_secret"),
+        cache=ResponseCache(),
+    )
+    client._auth_manager.ensure_valid_token = MagicMock(return_value="token")
+    client.session.request = MagicMock(return_value=_response())
+
+    first = client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+    second = client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+
+    assert first.json() == second.json()
+    assert client.session.request.call_count == 1
+    assert client.cache is not None
+    assert client.cache.stats().hits == 1
@@ -0,0 +1,104 @@
+import json
+import time
+
+from pylegifrance.cache import MemoryCacheBackend
+from pylegifrance.models.consult import GetArticle
+from pylegifrance.pipeline.pipeline import (
+    CachedStep,
+    CallApiStep,
+    ExtractSearchResult,
+    GetArticleId,
+    Pipeline,
+)
+
+ARTICLE_IDS = [f"LEGIARTI{i:012d}" for i in range(4)]
+
+
+def _pipeline(client, backend, on_step=None):
+    return Pipeline(
+        [
+            CachedStep(CallApiStep(client), backend),
+            ExtractSearchResult(),
+            GetArticleId(),
+            CachedStep(CallApiStep(client, max_workers=2), backend),
+        ],
+        on_step=on_step,
+    )
+
+
+def test_repeated_pipeline_skips_the_api(article_client, search_model):
+    """Une seconde exécution est entièrement servie par le cache partagé."""
+    client = article_client(ARTICLE_IDS)
+    backend = MemoryCacheBackend()
+
+    first = _pipeline(client, backend).execute(search_model)
+    calls = client.call_api.call_count
+    metrics = []
+    second = _pipeline(client, backend, on_step=metrics.append).execute(search_model)
+
+    assert second == first
+    assert client.call_api.call_count == calls == 1 + len(ARTICLE_IDS)
+    search, _, _, fetch = metrics
+    assert (search.cache_hits, search.cache_misses) == (1, 0)
+    assert fetch.cache_hits == len(ARTICLE_IDS)
+    assert fetch.cache_hit_rate == 1.0 and fetch.bytes_received == 0
+
+
+def test_articles_are_cached_individually_and_errors_are_not(article_client):
+    """Seuls les articles absents ou en erreur sont redemandés."""
+    client = article_client(ARTICLE_IDS, failing_ids={ARTICLE_IDS[1]})
+    step = CachedStep(CallApiStep(client))
+    models = [GetArticle(id=article_id) for article_id in ARTICLE_IDS[:2]]
+
+    first, _ = step.process(models)
+    assert "503" in first[1]["error"]
+
+    client.call_api.reset_mock()
+    models.append(GetArticle(id=ARTICLE_IDS[2]))
+    responses, model_reponse = step.process(models)
+
+    requested = [call.kwargs["data"]["id"] for call in client.call_api.call_args_list]
+    assert requested == ARTICLE_IDS[1:3]
+    assert responses[0] == first[0]
+    assert model_reponse == "GetArticleResponse"
+    assert step.stats().hits == 1
+
+
+def test_stream_uses_the_cache(article_client):
+    """Le traitement en flux lit et alimente le même cache."""
+    client = article_client(ARTICLE_IDS)
+    step = CachedStep(CallApiStep(client, max_workers=2))
+    models = [GetArticle(id=article_id) for article_id in ARTICLE_IDS]
+    step.process(models[:2])
+
+    responses, _ = step.process_stream(iter(models))
+
+    assert [r["article"]["id"] for r in responses] == ARTICLE_IDS
+    assert (step.cache_hits, step.cache_misses) == (2, 4)
+
+
+def test_entries_expire_after_ttl(article_client, search_model):
+    """Une entrée expirée est recalculée."""
+    client = article_client(ARTICLE_IDS)
+    step = CachedStep(CallApiStep(client), ttl=0.01)
+
+    step.process(search_model)
+    time.sleep(0.02)
+    step.process(search_model)
+
+    assert client.call_api.call_count == 2
+    assert step.stats().hit_rate == 0.0
+
+
+def test_entries_are_stored_as_json(article_client, search_model):
+    """Les entrées du cache sont du JSON, relu sans exécuter de code."""
+    client = article_client(ARTICLE_IDS)
+    backend = MemoryCacheBackend()
+    step = CachedStep(CallApiStep(client), backend)
+
+    result, _ = step.process(search_model)
+    [stored] = [backend.get(key) for key in backend._entries]
+
+    assert json.loads(stored) == [result, None]
+    assert step.process(search_model) == (result, None)
+    assert client.call_api.call_count == 1
@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.models.consult import GetArticle
+from pylegifrance.pipeline.pipeline import CallApiStep
+
+
+def _articles(count):
+    return [GetArticle(id=f"LEGIARTI{i:012d}") for i in range(count)]
+
+
+def test_calls_are_concurrent_and_ordered(article_client):
+    """Les appels sont parallélisés et les réponses gardent l'ordre des modèles."""
+    models = _articles(8)
+    client = article_client(delay=0.05)
+
+    responses, model_reponse = CallApiStep(client, max_workers=4).process(models)
+
+    assert [r["article"]["id"] for r in responses] == [m.id for m in models]
+    assert model_reponse == "GetArticleResponse"
+    assert 1 < client.in_flight["max"] <= 4
+
+
+def test_failed_items_are_reported(article_client):
+    """Un appel en échec devient une erreur sans interrompre les autres."""
+    models = _articles(3)
+    client = article_client(failing_ids={models[1].id})
+
+    responses, _ = CallApiStep(client, max_workers=2).process(models)
+
+    assert responses[0]["article"]["id"] == models[0].id
+    assert "503" in responses[1]["error"]
+    assert responses[2]["article"]["id"] == models[2].id
+
+
+def test_all_items_failing_stops_the_pipeline(article_client):
+    """Si tous les appels échouent, l'étape renvoie une erreur."""
+    models = _articles(2)
+    client = article_client(failing_ids={m.id for m in models})
+
+    data, data_type = CallApiStep(client, max_workers=2).process(models)
+
+    assert data_type == "error"
+    assert "503" in data["error"]
+
+
+def test_invalid_max_workers_raises_error():
+    """Un nombre de workers inférieur à 1 est refusé."""
+    with pytest.raises(ValueError):
+        CallApiStep(MagicMock(), max_workers=0)
@@ -0,0 +1,92 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import LegifranceAPIError
+
+
+def _make_client(status_code=200, delay=0.1, **config_kwargs):
+    """Client whose HTTP session answers slowly and counts the requests."""
+    client = LegifranceClient(
+        ApiConfig(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            max_retries=0,
+            **config_kwargs,
+        )
+    )
+    client._auth_manager.ensure_valid_token = MagicMock(return_value="token")
+
+    def request(method, url, **kwargs):
+        time.sleep(delay)
+        return MagicMock(status_code=status_code, text="", headers={})
+
+    client.session.request = MagicMock(side_effect=request)
+    return client
+
+
+def _call_concurrently(client, route, payloads):
+    results = [None] * len(payloads)
+
+    def worker(index, payload):
+        try:
+            results[index] = client.call_api(route, payload)
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [
+        threading.Thread(target=worker, args=(index, payload))
+        for index, payload in enumerate(payloads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_identical_concurrent_calls_share_one_request():
+    """Concurrent identical calls send one request and get the same response."""
+    client = _make_client()
+
+    results = _call_concurrently(client, "consult/juri", [{"textId": "1"}] * 5)
+
+    assert client.session.request.call_count == 1
+    assert all(result is results[0] for result in results)
+    assert client._inflight == {}
+
+
+def test_different_payloads_are_not_coalesced():
+    """Calls with different payloads each send their own request."""
+    client = _make_client()
+
+    _call_concurrently(client, "consult/juri", [{"textId": str(i)} for i in range(3)])
+
+    assert client.session.request.call_count == 3
+
+
+def test_error_is_shared_with_waiting_callers():
+    """An error raised by the shared request reaches every caller."""
+    client = _make_client(status_code=500)
+
+    results = _call_concurrently(client, "consult/juri", [{"textId": "1"}] * 3)
+
+    assert client.session.request.call_count == 1
+    assert all(isinstance(result, LegifranceAPIError) for result in results)
+
+
+@pytest.mark.parametrize(
+    "route,config_kwargs",
+    [("consult/juri", {"coalesce_requests": False}), ("some/write/route", {})],
+)
+def test_coalescing_is_skipped(route, config_kwargs):
+    """Coalescing can be disabled and never applies to non read-only routes."""
+    client = _make_client(**config_kwargs)
+
+    _call_concurrently(client, route, [{"id": "1"}] * 3)
+
+    assert client.session.request.call_count == 3
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+
+from pylegifrance.cache import MemoryCacheBackend
+from pylegifrance.models.constants import Fond
+from pylegifrance.models.search import Recherche, RechercheFinal
+from pylegifrance.pipeline.async_pipeline import AsyncPipeline
+from pylegifrance.pipeline.pipeline import (
+    CallApiStep,
+    GetArticleId,
+    PaginatedSearchStep,
+)
+from pylegifrance.pipeline.pipeline_factory import recherche_code
+
+PAGE_SIZE = 3
+# 8 résultats sur 3 pages ; LEGIARTI...03 apparaît sur les pages 1 et 2
+PAGES = {
+    1: ["01", "02", "03"],
+    2: ["03", "04", "05"],
+    3: ["06", "07"],
+}
+
+
+def _article_id(suffix):
+    return f"LEGIARTI0000000000{suffix}"
+
+
+def _serve_pages(failing_pages=()):
+    """Sert PAGES pour la recherche puis chaque article demandé."""
+
+    def respond(route, data):
+        if route != "search":
+            return {"article": {"id": data["id"], "cid": data["id"]}}
+        page_number = data["recherche"]["pageNumber"]
+        if page_number in failing_pages:
+            raise Exception("API client error 503")
+        extracts = [{"id": _article_id(s)} for s in PAGES[page_number]]
+        return {
+            "totalResultNumber": 8,
+            "results": [{"sections": [{"id": "S", "extracts": extracts}]}],
+        }
+
+    return respond
+
+
+def _fetched_articles(client):
+    return [data["id"] for route, data in client.calls if route != "search"]
+
+
+def _all_ids():
+    return list(dict.fromkeys(_article_id(s) for p in PAGES.values() for s in p))
+
+
+def test_all_pages_are_fetched_and_deduplicated(make_client, requested_pages):
+    """Toutes les pages sont parcourues et chaque article récupéré une fois."""
+    client = make_client(_serve_pages())
+
+    articles = recherche_code(
+        code_name="Code civil",
+        search="sûreté",
+        champ="ARTICLE",
+        page_size=PAGE_SIZE,
+        formatter=True,
+        all_pages=True,
+        max_workers=2,
+        client=client,
+    )
+
+    assert [article["cid"] for article in articles] == _all_ids()
+    assert sorted(requested_pages(client)) == [1, 2, 3]
+    assert sorted(_fetched_articles(client)) == _all_ids()
+
+
+def test_all_pages_stream_reports_failed_pages(make_client):
+    """En flux, une page en échec devient une erreur sans arrêter les autres."""
+    client = make_client(_serve_pages(failing_pages={2}))
+
+    results = list(
+        recherche_code(
+            code_name="Code civil",
+            search="sûreté",
+            champ="ARTICLE",
+            page_size=PAGE_SIZE,
+            all_pages=True,
+            stream=True,
+            client=client,
+        )
+    )
+
+    errors = [r for r in results if "error" in r]
+    fetched = [r["article"]["id"] for r in results if "error" not in r]
+    assert len(errors) == 1 and "page 2" in errors[0]["error"]
+    assert fetched == [_article_id(s) for s in ["01", "02", "03", "06", "07"]]
+
+
+def test_all_pages_stream_requests_pages_as_consumed(make_client, requested_pages):
+    """En flux, une page n'est demandée qu'au fil de la consommation."""
+    client = make_client(_serve_pages())
+
+    results = recherche_code(
+        code_name="Code civil",
+        search="sûreté",
+        champ="ARTICLE",
+        page_size=PAGE_SIZE,
+        all_pages=True,
+        stream=True,
+        client=client,
+    )
+    next(results)
+
+    assert requested_pages(client) == [1]
+    assert len(list(results)) == len(_all_ids()) - 1
+    assert requested_pages(client) == [1, 2, 3]
+
+
+def test_all_pages_are_cached(make_client):
+    """Avec un cache, une seconde recherche ne redemande ni pages ni articles."""
+    client = make_client(_serve_pages())
+    cache = MemoryCacheBackend()
+    metrics = []
+
+    def search(on_step=None):
+        return recherche_code(
+            code_name="Code civil",
+            search="sûreté",
+            champ="ARTICLE",
+            page_size=PAGE_SIZE,
+            all_pages=True,
+            max_workers=2,
+            client=client,
+            cache=cache,
+            on_step=on_step,
+        )
+
+    first = search()
+    calls = len(client.calls)
+    second = search(on_step=metrics.append)
+
+    assert second == first
+    assert len(client.calls) == calls == 3 + len(_all_ids())
+    pages, fetch = metrics
+    assert (pages.cache_hits, pages.cache_misses) == (3, 0)
+    assert fetch.cache_hit_rate == 1.0
+
+
+def test_async_pipeline_runs_pages_in_a_thread(make_client):
+    """Dans un AsyncPipeline, les pages sont demandées hors de la boucle."""
+    threads = set()
+    serve = _serve_pages()
+
+    def respond(route, data):
+        threads.add(threading.current_thread())
+        return serve(route, data)
+
+    client = make_client(respond)
+    pipeline = AsyncPipeline(
+        [
+            PaginatedSearchStep(client, GetArticleId(), max_workers=2),
+            CallApiStep(client),
+        ]
+    )
+    search = RechercheFinal(
+        recherche=Recherche(champs=[], filtres=[], pageSize=PAGE_SIZE),
+        fond=Fond.CODE_DATE,
+    )
+
+    async def run():
+        return await pipeline.execute(search), threading.current_thread()
+
+    responses, loop_thread = asyncio.run(run())
+
+    assert [r["article"]["id"] for r in responses] == _all_ids()
+    assert pipeline.steps[0].in_thread
+    assert loop_thread not in threads
@@ -0,0 +1,86 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.pipeline.pipeline import (
+    CallApiStep,
+    ExtractSearchResult,
+    Formatters,
+    GetArticleId,
+    Pipeline,
+    PipelineStep,
+)
+from pylegifrance.pipeline.pipeline_factory import recherche_code
+
+ARTICLE_IDS = [f"LEGIARTI{i:012d}" for i in range(4)]
+
+
+def test_execute_reports_each_step(article_client, search_model):
+    """Chaque étape est mesurée et transmise au callback on_step."""
+    client = article_client(ARTICLE_IDS, failing_ids={ARTICLE_IDS[1]})
+    exported = []
+    pipeline = Pipeline(
+        [
+            CallApiStep(client),
+            ExtractSearchResult(),
+            GetArticleId(),
+            CallApiStep(client, max_workers=2),
+            Formatters(),
+        ],
+        on_step=exported.append,
+    )
+
+    pipeline.execute(search_model)
+    report = pipeline.last_report
+
+    assert exported == report.steps
+    assert [step.name for step in report.steps] == [
+        "CallApiStep",
+        "ExtractSearchResult",
+        "GetArticleId",
+        "CallApiStep",
+        "Formatters",
+    ]
+    search, _, get_ids, fetch, formatters = report.steps
+    assert search.bytes_received > 0 and search.items_out == 1
+    assert get_ids.items_out == len(ARTICLE_IDS)
+    assert fetch.items_in == len(ARTICLE_IDS) and fetch.errors == 1
+    assert fetch.bytes_received > 0 and formatters.bytes_received == 0
+    assert report.errors == 2
+    assert report.wall_time == pytest.approx(sum(s.wall_time for s in report.steps))
+    assert report.to_dict()["steps"][3]["errors"] == 1
+
+
+def test_failing_step_is_reported_and_hook_errors_ignored():
+    """Une étape qui lève une exception est mesurée ; le callback ne casse rien."""
+
+    class Failing(PipelineStep):
+        def process(self, data, data_type=""):
+            raise RuntimeError("boom")
+
+    pipeline = Pipeline([Failing()], on_step=MagicMock(side_effect=ValueError))
+
+    with pytest.raises(RuntimeError):
+        pipeline.execute("data")
+
+    [metrics] = pipeline.last_report.steps
+    assert metrics.name == "Failing"
+    assert metrics.errors == 1
+    pipeline.on_step.assert_called_once_with(metrics)
+
+
+def test_on_step_is_rejected_in_stream_mode():
+    """Le flux n'étant pas mesuré, on_step y est refusé dès l'appel."""
+    pipeline = Pipeline([Formatters()], on_step=MagicMock())
+
+    with pytest.raises(ValueError):
+        pipeline.stream({})
+
+    with pytest.raises(ValueError):
+        recherche_code(
+            code_name="Code civil",
+            search="7",
+            stream=True,
+            on_step=MagicMock(),
+            client=MagicMock(),
+        )
@@ -0,0 +1,61 @@
+from pylegifrance.pipeline.pipeline import (
+    CallApiStep,
+    ExtractSearchResult,
+    Formatters,
+    GetArticleId,
+    Pipeline,
+)
+from pylegifrance.utils import imap_concurrently
+
+ARTICLE_IDS = [f"LEGIARTI{i:012d}" for i in range(10)]
+
+
+def _pipeline(client, max_workers=1):
+    return Pipeline(
+        [
+            CallApiStep(client),
+            ExtractSearchResult(),
+            GetArticleId(),
+            CallApiStep(client, max_workers=max_workers),
+            Formatters(),
+        ]
+    )
+
+
+def test_stream_yields_articles_as_they_are_fetched(article_client, search_model):
+    """Chaque article formaté est produit dès sa réponse, dans l'ordre."""
+    client = article_client(ARTICLE_IDS)
+    results = _pipeline(client).stream(search_model)
+
+    first = next(results)
+
+    assert first["cid"] == ARTICLE_IDS[0]
+    assert [route for route, _ in client.calls].count("consult/getArticle") == 1
+    assert [article["cid"] for article in results] == ARTICLE_IDS[1:]
+
+
+def test_stream_matches_execute_and_keeps_errors(article_client, search_model):
+    """Le flux produit les mêmes articles qu'execute, erreurs comprises."""
+    client = article_client(ARTICLE_IDS, failing_ids={ARTICLE_IDS[3]})
+
+    streamed = list(_pipeline(client, max_workers=3).stream(search_model))
+    executed = _pipeline(client, max_workers=3).execute(search_model)
+
+    assert streamed == executed
+    assert "503" in streamed[3]["error"]
+
+
+def test_imap_concurrently_bounds_items_in_flight():
+    """Au plus max_workers éléments sont consommés avant le premier résultat."""
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = imap_concurrently(lambda x: x * 2, items(), max_workers=4)
+
+    assert next(results) == 0
+    assert len(consumed) <= 5
+    assert list(results) == [i * 2 for i in range(1, 100)]
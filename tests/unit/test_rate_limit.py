@@ -0,0 +1,97 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import RateLimitError
+from pylegifrance.rate_limit import TokenBucket, parse_retry_after
+
+
+def test_bucket_allows_burst_then_paces_requests():
+    """The first `burst` requests go through at once, the next ones are spaced."""
+    bucket = TokenBucket(rate=10, burst=3)
+
+    delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_is_shared_safely_between_threads():
+    """Concurrent callers never exceed the configured rate."""
+    bucket = TokenBucket(rate=50, burst=1)
+    sent_at = []
+    lock = threading.Lock()
+
+    def worker():
+        bucket.acquire()
+        with lock:
+            sent_at.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(11)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 1 immediate request + 10 requests spaced by 20ms
+    assert max(sent_at) - started >= 0.19
+
+
+def test_pause_holds_back_next_requests():
+    """A pause (e.g. after a 429) delays the following reservations."""
+    bucket = TokenBucket(rate=10, burst=5)
+
+    bucket.pause(2.0)
+
+    assert bucket.reserve() == pytest.approx(2.1, abs=0.01)
+
+
+def test_concurrent_pauses_overlap():
+    """Several pauses (e.g. one 429 per thread) keep the longest delay only."""
+    bucket = TokenBucket(rate=10, burst=5)
+
+    for seconds in [1.0] * 9 + [2.0, 0.5]:
+        bucket.pause(seconds)
+
+    assert bucket.reserve() == pytest.approx(2.1, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("not a date", None)],
+)
+def test_parse_retry_after(value, expected):
+    """Retry-After accepts a number of seconds and ignores invalid values."""
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    """Retry-After accepts an HTTP date."""
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_call_api_raises_rate_limit_error_and_pauses_limiter():
+    """A 429 raises RateLimitError and makes the shared limiter back off."""
+    config = ApiConfig(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        max_requests_per_second=10,
+        max_retries=0,
+    )
+    client = LegifranceClient(config=config)
+    client._auth_manager.ensure_valid_token = MagicMock(return_value="token")
+    response = MagicMock(status_code=429, text="quota", headers={"Retry-After": "5"})
+    client.session.request = MagicMock(return_value=response)
+
+    with pytest.raises(RateLimitError) as excinfo:
+        client.call_api("consult/juri", {"textId": "JURITEXT000000000001"})
+
+    assert excinfo.value.retry_after == 5.0
+    assert client._rate_limiter is not None
+    assert client._rate_limiter.reserve() >= 5.0
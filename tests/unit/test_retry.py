@@ -0,0 +1,120 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.config import ApiConfig
+from pylegifrance.exceptions import LegifranceAPIError
+from pylegifrance.retry import is_idempotent_route
+
+
+def _response(status_code, text="", headers=None):
+    response = MagicMock(status_code=status_code, text=text, headers=headers or {})
+    return response
+
+
+def _make_client(responses, **config_kwargs):
+    """Client whose HTTP session answers the given responses in order."""
+    config = ApiConfig(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        retry_backoff_factor=0.01,
+        **config_kwargs,
+    )
+    client = LegifranceClient(config=config)
+    client._auth_manager.ensure_valid_token = MagicMock(return_value="token")
+    client.session.request = MagicMock(side_effect=responses)
+    return client
+
+
+@pytest.mark.parametrize(
+    "method,route,expected",
+    [
+        ("POST", "consult/juri", True),
+        ("POST", "search", True),
+        ("POST", "list/code", True),
+        ("GET", "anything", True),
+        ("POST", "some/write/route", False),
+    ],
+)
+def test_is_idempotent_route(method, route, expected):
+    """Read-only Legifrance routes are idempotent even when sent as POST."""
+    assert is_idempotent_route(method, route) is expected
+
+
+def test_transient_error_is_retried():
+    """A 503 followed by a success returns the successful response."""
+    client = _make_client([_response(503, "busy"), _response(200)])
+
+    response = client.call_api("consult/juri", {"textId": "1"})
+
+    assert response.status_code == 200
+    assert client.session.request.call_count == 2
+
+
+def test_retry_after_header_is_honoured():
+    """The delay announced by Retry-After is waited before retrying."""
+    client = _make_client(
+        [_response(503, headers={"Retry-After": "0.3"}), _response(200)]
+    )
+
+    started = time.perf_counter()
+    client.call_api("consult/juri", {"textId": "1"})
+
+    assert time.perf_counter() - started >= 0.3
+
+
+def test_retries_are_bounded():
+    """The last error is raised once max_retries is exhausted."""
+    client = _make_client([_response(502)] * 3, max_retries=2)
+
+    with pytest.raises(LegifranceAPIError) as excinfo:
+        client.call_api("consult/juri", {"textId": "1"})
+
+    assert excinfo.value.status_code == 502
+    assert client.session.request.call_count == 3
+
+
+def test_client_errors_are_not_retried():
+    """A 400 is a caller error and is raised immediately."""
+    client = _make_client([_response(400, "bad request")])
+
+    with pytest.raises(LegifranceAPIError):
+        client.call_api("consult/juri", {"textId": "1"})
+
+    assert client.session.request.call_count == 1
+
+
+def test_non_idempotent_route_is_not_replayed_on_gateway_error():
+    """A 502 may hide a processed request: non read-only routes are not replayed."""
+    client = _make_client([_response(502), _response(200)])
+
+    with pytest.raises(LegifranceAPIError):
+        client.call_api("some/write/route", {"id": "1"})
+
+    assert client.session.request.call_count == 1
+
+
+def test_read_timeout_is_retried_on_idempotent_route():
+    """Network errors are retried on read-only routes."""
+    client = _make_client([requests.exceptions.ReadTimeout(), _response(200)])
+
+    assert client.call_api("search", {"recherche": {}}).status_code == 200
+
+
+def test_rejected_token_triggers_one_reauthentication():
+    """A 401 discards the token and resends the request with a new one."""
+    client = _make_client([_response(401), _response(200)])
+    client._auth_manager.ensure_valid_token = MagicMock(
+        side_effect=["old-token", "new-token"]
+    )
+    client._auth_manager.invalidate_token = MagicMock()
+
+    response = client.call_api("consult/juri", {"textId": "1"})
+
+    assert response.status_code == 200
+    client._auth_manager.invalidate_token.assert_called_once_with("old-token")
+    headers = client.session.request.call_args.kwargs["headers"]
+    assert headers["Authorization"] == "Bearer new-token"
@@ -0,0 +1,53 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from pylegifrance import utils
+from pylegifrance.fonds.juri import JuriAPI
+from pylegifrance.models.generated.model import Fond
+from pylegifrance.models.juri.search import SearchRequest
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+def test_dumps_json_handles_enums_and_datetimes(json_backend):
+    """Both backends produce the same compact JSON as EnumEncoder."""
+    payload = {"fond": Fond.juri, "date": datetime(2024, 1, 2), "titre": "Arrêt"}
+
+    body = utils.dumps_json(payload)
+
+    assert json.loads(body) == {
+        "fond": "JURI",
+        "date": "2024-01-02T00:00:00",
+        "titre": "Arrêt",
+    }
+
+
+def test_dumps_json_sort_keys_is_canonical(json_backend):
+    """Sorted output does not depend on the key order."""
+    assert utils.dumps_json({"b": 1, "a": 2}, sort_keys=True) == (
+        utils.dumps_json({"a": 2, "b": 1}, sort_keys=True)
+    )
+
+
+def test_search_payload_is_json_ready():
+    """The search payload is built in one pass and matches the former round trip."""
+    query = SearchRequest(search="responsabilité", page_size=20)
+    legacy = json.loads(
+        json.dumps(
+            query.to_api_model().model_dump(by_alias=True), cls=utils.EnumEncoder
+        )
+    )
+
+    payload = JuriAPI(client=None)._build_search_payload(query)
+
+    assert payload == legacy
+    assert payload["fond"] == "JURI"
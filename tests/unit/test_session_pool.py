@@ -0,0 +1,80 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from pylegifrance.config import ApiConfig
+from pylegifrance.utils import (
+    TimeoutHTTPAdapter,
+    configure_session,
+    session_pool_stats,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.headers.get("Accept-Encoding", "").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _config(**kwargs) -> ApiConfig:
+    return ApiConfig(
+        client_id="test_client_id", client_secret="test_client_secret", **kwargs
+    )
+
+
+def test_configure_session_mounts_sized_adapter():
+    """The mounted adapter carries the pool size and the default timeouts."""
+    session = requests.Session()
+    configure_session(session, _config(pool_maxsize=32, read_timeout=12.0))
+
+    adapter = session.get_adapter("https://api.piste.gouv.fr/")
+
+    assert isinstance(adapter, TimeoutHTTPAdapter)
+    assert adapter.timeout == (3.05, 12.0)
+    assert adapter._pool_maxsize == 32
+
+
+def test_keep_alive_reuses_one_connection(server_url):
+    """Sequential requests reuse the pooled connection and are reported."""
+    session = requests.Session()
+    configure_session(session, _config(pool_maxsize=4))
+
+    for _ in range(3):
+        assert session.get(server_url).status_code == 200
+
+    [stats] = session_pool_stats(session)
+    assert stats.num_requests == 3
+    assert stats.num_connections == 1
+    assert stats.idle_connections == 1
+    assert stats.maxsize == 4
+
+
+def test_compression_header(server_url):
+    """Compressed responses are requested unless compression is disabled."""
+    session = requests.Session()
+    configure_session(session, _config())
+    assert "gzip" in session.get(server_url).text
+
+    session = requests.Session()
+    configure_session(session, _config(compression=False))
+    assert session.get(server_url).text == "identity"
@@ -0,0 +1,55 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylegifrance.client import LegifranceClient
+from pylegifrance.pipeline import pipeline_factory
+from pylegifrance.pipeline.pipeline_factory import (
+    close_shared_client,
+    get_shared_client,
+    recherche_code,
+)
+
+
+@pytest.fixture
+def credentials(monkeypatch):
+    monkeypatch.setenv("LEGIFRANCE_CLIENT_ID", "test_client_id")
+    monkeypatch.setenv("LEGIFRANCE_CLIENT_SECRET", "test_client_secret")
+    close_shared_client()
+    yield
+    close_shared_client()
+
+
+def test_shared_client_is_created_once(credentials):
+    """Tous les threads obtiennent le même client, recréé après fermeture."""
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(get_shared_client()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert isinstance(clients[0], LegifranceClient)
+    assert all(client is clients[0] for client in clients)
+
+    close_shared_client()
+    assert pipeline_factory._shared_client is None
+    assert get_shared_client() is not clients[0]
+
+
+def test_recherche_code_uses_given_client(credentials, monkeypatch):
+    """Un client fourni est utilisé à la place du client partagé."""
+    client = MagicMock()
+    client.call_api.side_effect = Exception("API client error 503")
+    monkeypatch.setattr(
+        pipeline_factory, "get_shared_client", MagicMock(side_effect=AssertionError)
+    )
+
+    with pytest.raises(Exception, match="503"):
+        recherche_code(code_name="Code civil", search="7", client=client)
+
+    assert client.call_api.call_args.kwargs["route"] == "search"